@@ -1,16 +1,148 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import copy
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.settings import get_api_base_url
 
 
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 10)  # connect, read
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.3
+DEFAULT_POOL_SIZE = 10
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+ME_CACHE_TTL_S = 30.0
+SUBSCRIPTIONS_CACHE_TTL_S = 60.0
+
+UnauthorizedCallback = Callable[[Optional[str]], None]  # token that was rejected
+
+
+class JitteredRetry(Retry):
+    """urllib3 Retry with full jitter: sleep a random fraction of the exponential backoff."""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return random.uniform(0, backoff) if backoff > 0 else 0
+
+
+def build_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    retries: int = DEFAULT_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    status_retries: Optional[int] = None,
+) -> requests.Session:
+    """Create a keep-alive session whose idempotent calls retry on connect errors and 5xx.
+
+    ``status_retries`` (default ``retries``) covers 502/503/504; 0 hands them
+    straight to the caller. Retry-After is not slept on: retries run on
+    shared TaskExecutor workers, so waits stay at the short jittered backoff
+    and pollers schedule around Retry-After themselves.
+    """
+    retry = JitteredRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries if status_retries is None else status_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=IDEMPOTENT_METHODS,
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_shared_session: Optional[requests.Session] = None
+_polling_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = build_session()
+        return _shared_session
+
+
+def get_polling_session() -> requests.Session:
+    """Session for pollers: 5xx and their Retry-After reach the PollScheduler instead of being retried here."""
+    global _polling_session
+    with _shared_session_lock:
+        if _polling_session is None:
+            _polling_session = build_session(pool_size=2, status_retries=0)
+        return _polling_session
+
+
+class ResponseCache:
+    """Thread-safe TTL cache of decoded GET responses, keyed by token, path and params.
+
+    ``invalidate`` bumps the path's generation; a ``put`` tagged with an older
+    generation (a GET that raced with a write) is dropped.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, path: str) -> int:
+        with self._lock:
+            return self._generations.get(path, 0)
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                return None
+            # Callers may mutate what they get back.
+            return copy.deepcopy(entry[1])
+
+    def put(self, key: Hashable, value: Any, ttl_s: float, generation: Optional[int] = None) -> None:
+        with self._lock:
+            if generation is not None and generation != self._generations.get(key[1], 0):
+                return
+            self._entries[key] = (time.monotonic() + ttl_s, copy.deepcopy(value))
+
+    def invalidate(self, path: str) -> None:
+        with self._lock:
+            self._generations[path] = self._generations.get(path, 0) + 1
+            for key in [k for k in self._entries if k[1] == path]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
 class ApiClient:
-    def __init__(self, token: Optional[str] = None) -> None:
-        self.base_url = get_api_base_url().rstrip("/")
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        base_url: Optional[str] = None,
+        on_unauthorized: Optional[UnauthorizedCallback] = None,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        self.base_url = (base_url or get_api_base_url()).rstrip("/")
         self.token = token
+        self.session = session or get_shared_session()
+        self.timeout = timeout
+        self.on_unauthorized = on_unauthorized
+        self.cache = cache
 
     def _headers(self) -> Dict[str, str]:
         headers = {"Content-Type": "application/json"}
@@ -18,33 +150,59 @@ class ApiClient:
             headers["Authorization"] = f"Bearer {self.token}"
         return headers
 
-    def login(self, email: str) -> Dict[str, Any]:
-        resp = requests.post(
-            f"{self.base_url}/auth/login",
-            json={"email": email},
+    def _request(self, method: str, path: str, **kwargs) -> Any:
+        token = self.token
+        resp = self.session.request(
+            method,
+            f"{self.base_url}{path}",
             headers=self._headers(),
-            timeout=10,
+            timeout=self.timeout,
+            **kwargs,
         )
+        if resp.status_code == 401 and token and self.on_unauthorized:
+            self.on_unauthorized(token)
         resp.raise_for_status()
         return resp.json()
 
+    def _cached_get(self, path: str, ttl_s: float, params: Optional[Dict[str, Any]] = None) -> Any:
+        if self.cache is None:
+            return self._request("GET", path, params=params)
+        key = (self.token, path, tuple(sorted((params or {}).items())))
+        data = self.cache.get(key)
+        if data is None:
+            generation = self.cache.generation(path)
+            data = self._request("GET", path, params=params)
+            self.cache.put(key, data, ttl_s, generation)
+        return data
+
+    def login(self, email: str) -> Dict[str, Any]:
+        return self._request("POST", "/auth/login", json={"email": email})
+
     def me(self) -> Dict[str, Any]:
-        resp = requests.get(
-            f"{self.base_url}/me",
-            headers=self._headers(),
-            timeout=10,
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return self._cached_get("/me", ME_CACHE_TTL_S)
 
     def set_token(self, token: Optional[str]) -> None:
         self.token = token
 
-    def get_notices(self) -> Dict[str, Any]:
-        resp = requests.get(
-            f"{self.base_url}/notices",
-            headers=self._headers(),
-            timeout=10,
-        )
-        resp.raise_for_status()
-        return resp.json()
+    def get_notices(self, limit: Optional[int] = None, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        params = {k: v for k, v in (("limit", limit), ("since", since)) if v} or None
+        return self._request("GET", "/notices", params=params)
+
+    def get_subscriptions(self) -> List[str]:
+        return self._cached_get("/subscriptions", SUBSCRIPTIONS_CACHE_TTL_S).get("vtuber_ids", [])
+
+    def subscribe(self, vtuber_id: str) -> List[str]:
+        data = self._request("POST", "/subscriptions", json={"vtuber_id": vtuber_id})
+        self._replace_cached("/subscriptions", data, SUBSCRIPTIONS_CACHE_TTL_S)
+        return data.get("vtuber_ids", [])
+
+    def unsubscribe(self, vtuber_id: str) -> List[str]:
+        data = self._request("DELETE", f"/subscriptions/{vtuber_id}")
+        self._replace_cached("/subscriptions", data, SUBSCRIPTIONS_CACHE_TTL_S)
+        return data.get("vtuber_ids", [])
+
+    def _replace_cached(self, path: str, data: Any, ttl_s: float) -> None:
+        # After the write: GETs still in flight were started before it, and their put is dropped.
+        if self.cache is not None:
+            self.cache.invalidate(path)
+            self.cache.put((self.token, path, ()), data, ttl_s)
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.api_client import DEFAULT_TIMEOUT, build_session
+from app.settings import get_api_base_url
+from app.storage_paths import get_assets_cache_dir
+
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+MANIFEST_FILE = "manifest.json"
+
+
+@dataclass
+class SyncResult:
+    downloaded: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    bytes_downloaded: int = 0
+
+
+class AssetDownloader:
+    """Mirror the server's content-addressed asset pack into ``assets_cache``.
+
+    Blobs are stored by sha256 under ``blobs/`` and materialized under
+    ``<pack>/<path>``. Large blobs are fetched as parallel ``Range`` chunks into a
+    ``.part`` file whose finished chunks are recorded next to it, so an
+    interrupted sync resumes where it stopped. A blob only leaves ``.part`` once
+    its hash matches the manifest. Files and blobs the new manifest no longer
+    lists are removed after it has been materialized.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = 4,
+        timeout: Tuple[float, float] = (DEFAULT_TIMEOUT[0], 30),
+    ) -> None:
+        self.base_url = (base_url or get_api_base_url()).rstrip("/")
+        self.cache_dir = Path(cache_dir) if cache_dir else get_assets_cache_dir()
+        self.blobs_dir = self.cache_dir / "blobs"
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.timeout = timeout
+        # Own pool sized to the worker count so chunk requests reuse connections.
+        self.session = build_session(pool_size=max_workers)
+        self._bytes_lock = threading.Lock()
+        self._bytes_downloaded = 0
+
+    def fetch_manifest(self) -> Dict[str, Any]:
+        headers = {}
+        cached = self._load_local_manifest()
+        if cached and cached.get("version"):
+            headers["If-None-Match"] = f'"{cached["version"]}"'
+        resp = self.session.get(f"{self.base_url}/assets/manifest", headers=headers, timeout=self.timeout)
+        if resp.status_code == 304 and cached:
+            return cached
+        resp.raise_for_status()
+        return resp.json()
+
+    def sync(self) -> SyncResult:
+        previous = self._load_local_manifest() or {}
+        materialized = {f["path"]: f["sha256"] for f in previous.get("files", [])}
+        manifest = self.fetch_manifest()
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self._bytes_downloaded = 0
+
+        result = SyncResult()
+        missing: Dict[str, Dict[str, Any]] = {}
+        for entry in manifest.get("files", []):
+            if self._blob_path(entry["sha256"]).exists():
+                result.skipped.append(entry["path"])
+            else:
+                missing.setdefault(entry["sha256"], entry)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            jobs = [(entry, self._submit_blob(entry, pool)) for entry in missing.values()]
+            for entry, futures in jobs:
+                # On failure .part and its progress file stay behind so the next sync resumes.
+                for future in futures:
+                    future.result()
+                self._finish_blob(entry)
+                result.downloaded.append(entry["path"])
+
+        pack_dir = self.cache_dir / manifest.get("pack", "cats")
+        for entry in manifest.get("files", []):
+            self._materialize(entry, pack_dir, materialized.get(entry["path"]))
+        self._prune(previous, manifest, result)
+        self._save_local_manifest(manifest)
+        result.bytes_downloaded = self._bytes_downloaded
+        return result
+
+    # ---- Blobs ----
+    def _blob_path(self, sha256: str) -> Path:
+        return self.blobs_dir / sha256
+
+    def _submit_blob(self, entry: Dict[str, Any], pool: ThreadPoolExecutor) -> List[Future]:
+        sha256, size = entry["sha256"], int(entry["size"])
+        part = self.blobs_dir / f"{sha256}.part"
+        progress = self.blobs_dir / f"{sha256}.part.json"
+
+        done = self._load_progress(progress, size)
+        if not part.exists() or part.stat().st_size != size:
+            with part.open("wb") as f:
+                f.truncate(size)
+            done = set()
+
+        ranges = [
+            (start, min(start + self.chunk_size, size) - 1)
+            for start in range(0, size, self.chunk_size)
+            if start not in done
+        ]
+        lock = threading.Lock()
+
+        def fetch(start: int, end: int) -> None:
+            data = self._get_range(sha256, start, end, size)
+            with part.open("r+b") as f:
+                f.seek(start)
+                f.write(data)
+            with lock:
+                done.add(start)
+                progress.write_text(json.dumps({"size": size, "done": sorted(done)}), encoding="utf-8")
+
+        return [pool.submit(fetch, start, end) for start, end in ranges]
+
+    def _finish_blob(self, entry: Dict[str, Any]) -> None:
+        sha256 = entry["sha256"]
+        part = self.blobs_dir / f"{sha256}.part"
+        progress = self.blobs_dir / f"{sha256}.part.json"
+        if _sha256_file(part) != sha256:
+            part.unlink(missing_ok=True)
+            progress.unlink(missing_ok=True)
+            raise ValueError(f"Hash mismatch for asset {entry['path']}")
+        os.replace(part, self._blob_path(sha256))
+        progress.unlink(missing_ok=True)
+
+    def _get_range(self, sha256: str, start: int, end: int, size: int) -> bytes:
+        headers = {}
+        if size > 0:
+            headers["Range"] = f"bytes={start}-{end}"
+        resp = self.session.get(f"{self.base_url}/assets/blobs/{sha256}", headers=headers, timeout=self.timeout)
+        resp.raise_for_status()
+        data = resp.content
+        if resp.status_code == 200 and size > 0:
+            # Server ignored the range; slice the full body.
+            data = data[start : end + 1]
+        with self._bytes_lock:
+            self._bytes_downloaded += len(data)
+        return data
+
+    @staticmethod
+    def _load_progress(path: Path, size: int) -> set:
+        if not path.exists():
+            return set()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("size") == size:
+                return set(data.get("done", []))
+        except Exception:
+            pass
+        return set()
+
+    # ---- Pack tree ----
+    def _materialize(self, entry: Dict[str, Any], pack_dir: Path, previous_sha256: Optional[str]) -> None:
+        target = (pack_dir / entry["path"]).resolve()
+        if pack_dir.resolve() not in target.parents:
+            raise ValueError(f"Asset path escapes the pack directory: {entry['path']}")
+        if previous_sha256 == entry["sha256"] and target.exists():
+            return
+        blob = self._blob_path(entry["sha256"])
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        try:
+            os.link(blob, tmp)
+        except OSError:
+            shutil.copyfile(blob, tmp)
+        os.replace(tmp, target)
+
+    def _prune(self, previous: Dict[str, Any], manifest: Dict[str, Any], result: SyncResult) -> None:
+        kept = {(manifest.get("pack", "cats"), f["path"]) for f in manifest.get("files", [])}
+        old_pack = previous.get("pack", "cats")
+        for entry in previous.get("files", []):
+            if (old_pack, entry["path"]) in kept:
+                continue
+            pack_dir = (self.cache_dir / old_pack).resolve()
+            target = (pack_dir / entry["path"]).resolve()
+            if pack_dir not in target.parents:
+                continue
+            target.unlink(missing_ok=True)
+            result.removed.append(entry["path"])
+            # Drop directories the removal left empty, up to the pack root.
+            for parent in target.parents:
+                if parent == pack_dir:
+                    break
+                try:
+                    parent.rmdir()
+                except OSError:
+                    break
+        referenced = {f["sha256"] for f in manifest.get("files", [])}
+        for blob in self.blobs_dir.iterdir():
+            if blob.is_file() and blob.name.split(".", 1)[0] not in referenced:
+                blob.unlink(missing_ok=True)
+
+    def _load_local_manifest(self) -> Optional[Dict[str, Any]]:
+        path = self.cache_dir / MANIFEST_FILE
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+
+    def _save_local_manifest(self, manifest: Dict[str, Any]) -> None:
+        path = self.cache_dir / MANIFEST_FILE
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(DEFAULT_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def main() -> None:
+    result = AssetDownloader().sync()
+    print(
+        f"Downloaded {len(result.downloaded)} file(s) ({result.bytes_downloaded} bytes), "
+        f"{len(result.skipped)} already cached."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+try:
+    import httpx  # type: ignore
+    _HTTPX_IMPORT_ERROR: Optional[Exception] = None
+except Exception as e:  # noqa: BLE001
+    httpx = None  # type: ignore
+    _HTTPX_IMPORT_ERROR = e
+
+from app.api_client import DEFAULT_POOL_SIZE, DEFAULT_RETRIES, DEFAULT_TIMEOUT, UnauthorizedCallback
+from app.settings import get_api_base_url
+
+
+def async_available() -> bool:
+    return httpx is not None
+
+
+class AsyncApiClient:
+    """httpx-based counterpart of ApiClient; every method is a coroutine.
+
+    The underlying ``httpx.AsyncClient`` is created lazily on first use so it is
+    bound to the loop that runs the requests (normally the AsyncBridge loop).
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_POOL_SIZE,
+        base_url: Optional[str] = None,
+        on_unauthorized: Optional[UnauthorizedCallback] = None,
+    ) -> None:
+        if httpx is None:
+            raise RuntimeError(f"httpx is required for AsyncApiClient: {_HTTPX_IMPORT_ERROR}")
+        self.base_url = (base_url or get_api_base_url()).rstrip("/")
+        self.token = token
+        self.on_unauthorized = on_unauthorized
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    def set_token(self, token: Optional[str]) -> None:
+        self.token = token
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        if self._client is None:
+            connect, read = self.timeout
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(read, connect=connect),
+                # httpx only retries failed connects, which is safe for every method. The pool limits
+                # go on the transport: AsyncClient ignores its own ``limits`` when given one.
+                transport=httpx.AsyncHTTPTransport(
+                    retries=DEFAULT_RETRIES,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections, max_keepalive_connections=self.max_connections
+                    ),
+                ),
+            )
+        return self._client
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        token = self.token
+        resp = await self._get_client().request(method, path, headers=self._headers(), **kwargs)
+        if resp.status_code == 401 and token and self.on_unauthorized:
+            self.on_unauthorized(token)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def login(self, email: str) -> Dict[str, Any]:
+        return await self._request("POST", "/auth/login", json={"email": email})
+
+    async def me(self) -> Dict[str, Any]:
+        return await self._request("GET", "/me")
+
+    async def get_notices(self, limit: Optional[int] = None, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        params = {k: v for k, v in (("limit", limit), ("since", since)) if v} or None
+        return await self._request("GET", "/notices", params=params)
+
+    async def get_subscriptions(self) -> List[str]:
+        return (await self._request("GET", "/subscriptions")).get("vtuber_ids", [])
+
+    async def me_and_notices(
+        self, limit: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], Union[List[Dict[str, Any]], BaseException]]:
+        """Fetch the profile and notices concurrently over the shared pool.
+
+        Only a ``/me`` failure is raised; if just ``/notices`` fails its
+        exception is returned in place of the list, so a badge fetch can't
+        end the session.
+        """
+        me, notices = await asyncio.gather(self.me(), self.get_notices(limit), return_exceptions=True)
+        if isinstance(me, BaseException):
+            raise me
+        return me, notices
+
+    async def stream_lines(self, path: str, **kwargs) -> AsyncIterator[str]:
+        """Yield non-empty lines from a streaming endpoint (e.g. NDJSON or SSE)."""
+        async with self._get_client().stream("GET", path, headers=self._headers(), **kwargs) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if line:
+                    yield line
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class AsyncBridge(QObject):
+    """Runs an asyncio loop on one background thread and reports back on the UI thread.
+
+    ``submit`` and ``stream`` return concurrent futures; cancelling one cancels
+    the coroutine on the loop, and its callbacks are then never called.
+    """
+
+    _completed = pyqtSignal(object, object, object)  # callback, result, error
+    _item = pyqtSignal(object, object)  # callback, item
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="meowbuddy-asyncio", daemon=True)
+        self.thread.start()
+        self._completed.connect(lambda callback, result, error: callback(result, error))
+        self._item.connect(lambda callback, item: callback(item))
+
+    def submit(self, coro, on_done: Optional[Callable[[Any, Optional[Exception]], None]] = None) -> Future:
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if on_done:
+            future.add_done_callback(lambda f: self._deliver(f, on_done))
+        return future
+
+    def stream(
+        self,
+        agen: AsyncIterator[Any],
+        on_item: Callable[[Any], None],
+        on_done: Optional[Callable[[Any, Optional[Exception]], None]] = None,
+    ) -> Future:
+        async def pump() -> None:
+            async for item in agen:
+                self._item.emit(on_item, item)
+
+        return self.submit(pump(), on_done)
+
+    def _deliver(self, future: Future, on_done) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        self._completed.emit(on_done, None if error else future.result(), error)
+
+    def shutdown(self, timeout: float = 3.0) -> None:
+        async def cancel_all() -> None:
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self.loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(cancel_all(), self.loop).result(timeout)
+            except Exception:
+                pass
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout)
+
+
+_bridge: Optional[AsyncBridge] = None
+
+
+def get_async_bridge() -> AsyncBridge:
+    global _bridge
+    if _bridge is None:
+        _bridge = AsyncBridge()
+    return _bridge
+
+
+def shutdown_async_bridge() -> None:
+    global _bridge
+    if _bridge is not None:
+        _bridge.shutdown()
+        _bridge = None
@@ -1,11 +1,12 @@
 ﻿from __future__ import annotations
 
 import os
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-from PyQt6.QtCore import QThread, QUrl, pyqtSignal
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import QTimer, QUrl, pyqtSignal
+from PyQt6.QtGui import QHideEvent, QIcon, QShowEvent
 from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
@@ -24,17 +25,23 @@ except Exception as e:  # noqa: BLE001
     QWebEngineSettings = None  # type: ignore
     _WEBENGINE_IMPORT_ERROR = e
 
-from app.api_client import ApiClient
-from app.token_store import clear_token, load_token, save_token
-from app.worker import Worker
+from app.async_api_client import get_async_bridge
+from app.session import get_api_session
+from app.settings import get_web_view_mode, get_web_view_teardown_s
+from app.task_executor import DoneCallback, TaskHandle, get_executor
+
+
+PREWARM_DELAY_MS = 15_000
+PREWARM_RETRY_MS = 30_000
 
 
 class DashboardWindow(QWidget):
     logged_in = pyqtSignal(str, str)  # token, user_id
     logged_out = pyqtSignal()
     session_invalid = pyqtSignal()
+    notices_loaded = pyqtSignal(list)  # newest notice, fetched alongside the profile
 
-    def __init__(self) -> None:
+    def __init__(self, web_view_mode: Optional[str] = None, teardown_s: Optional[float] = None) -> None:
         super().__init__()
         self.setWindowTitle("MeowBuddy Dashboard")
         # 로그인 전 기본 크기
@@ -42,12 +49,30 @@ class DashboardWindow(QWidget):
         self.setMinimumSize(900, 600)
         self._set_window_icon()
 
-        self.api = ApiClient()
-        self.login_thread: Optional[QThread] = None
-        self.me_thread: Optional[QThread] = None
+        self.session = get_api_session()
+        self.api = self.session.client
+        self.async_api = self.session.async_client
+        self.session.expired.connect(self._on_session_expired)
+        self.login_task: Optional[TaskHandle] = None
+        self.me_task: Optional[TaskHandle] = None
+        self.me_callback: Optional[DoneCallback] = None  # this window's subscription to me_task
+        self.me_future: Optional[Future] = None
         self.web_view: Optional[QWebEngineView] = None  # type: ignore[valid-type]
 
+        # The Chromium renderer costs hundreds of MB, so by default it only exists while needed.
+        self.web_view_mode = web_view_mode or get_web_view_mode()
+        self.teardown_s = get_web_view_teardown_s() if teardown_s is None else teardown_s
+        self.teardown_timer = QTimer(self)
+        self.teardown_timer.setSingleShot(True)
+        self.teardown_timer.timeout.connect(self._teardown_web_view)
+        self.prewarm_timer = QTimer(self)
+        self.prewarm_timer.setSingleShot(True)
+        self.prewarm_timer.timeout.connect(self._on_prewarm_timer)
+        self._prewarm_is_idle: Optional[Callable[[], bool]] = None
+
         self._build_ui()
+        if self.web_view_mode == "eager":
+            self._ensure_web_view()
         self._load_token_auto()
 
     def _set_window_icon(self) -> None:
@@ -92,16 +117,15 @@ class DashboardWindow(QWidget):
         self.web_status = QLabel("")
         self.web_status.setStyleSheet("color:#555;")
         web_layout.addWidget(self.web_status)
+        self.web_layout = web_layout
 
-        if not self._ensure_web_view():
+        if QWebEngineView is None:
             msg = (
                 "WebEngine이 없어 대시보드를 표시할 수 없습니다.\n\n"
                 "1) venv에서 설치: pip install -U PyQt6 PyQt6-WebEngine\n\n"
                 f"Import error: {_WEBENGINE_IMPORT_ERROR}"
             )
             self.web_status.setText(msg)
-        else:
-            web_layout.addWidget(self.web_view, stretch=1)  # type: ignore[arg-type]
 
         layout.addWidget(self.login_panel)
         layout.addWidget(self.web_container, stretch=1)
@@ -141,14 +165,57 @@ class DashboardWindow(QWidget):
         except Exception:
             pass
 
+        self.web_layout.addWidget(self.web_view, stretch=1)
         return True
 
+    def _teardown_web_view(self) -> None:
+        """Drop the web view (and with it the renderer process) while the window is closed."""
+        if self.web_view is None or self.isVisible():
+            return
+        view, self.web_view = self.web_view, None
+        self.web_layout.removeWidget(view)
+        view.setParent(None)
+        view.deleteLater()
+
+    def schedule_prewarm(self, is_idle: Optional[Callable[[], bool]] = None, delay_ms: int = PREWARM_DELAY_MS) -> None:
+        """Create and load the web view in the background once ``is_idle`` reports the user is away."""
+        self._prewarm_is_idle = is_idle
+        self.prewarm_timer.start(delay_ms)
+
+    def _on_prewarm_timer(self) -> None:
+        if self.web_view is not None or self.isVisible():
+            return
+        if self._prewarm_is_idle is not None and not self._prewarm_is_idle():
+            self.prewarm_timer.start(PREWARM_RETRY_MS)
+            return
+        self.prewarm()
+
+    def prewarm(self) -> None:
+        if self.web_view is not None or not self._ensure_web_view():
+            return
+        url = self._home_url()
+        if url is not None:
+            self.web_view.setUrl(url)
+        if not self.isVisible() and self.teardown_s > 0:
+            # A pre-warmed view that is never opened must not keep the renderer alive indefinitely.
+            self.teardown_timer.start(int(self.teardown_s * 1000))
+
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
+        self.teardown_timer.stop()
+        super().showEvent(event)
+        if self.web_view is None:
+            self.open_home()
+
+    def hideEvent(self, event: QHideEvent) -> None:  # noqa: N802
+        super().hideEvent(event)
+        if self.web_view is not None and self.teardown_s > 0:
+            self.teardown_timer.start(int(self.teardown_s * 1000))
+
     # ---- Auth ----
     def _load_token_auto(self) -> None:
-        token = load_token()
+        token = self.session.restore()
         if not token:
             return
-        self.api.set_token(token)
         self._fetch_me(token)
 
     def _on_login_clicked(self) -> None:
@@ -156,24 +223,16 @@ class DashboardWindow(QWidget):
         if not email:
             self.login_status.setText("Email is required.")
             return
-        if self.login_thread and self.login_thread.isRunning():
+        if self.login_task and self.login_task.is_running():
             self.login_status.setText("Loading...")
             return
         self.login_status.setText("Loading...")
+        self.login_task = get_executor().submit(
+            self.api.login, email, key=("login", email), on_done=self._on_login_finished
+        )
 
-        login_thread = QThread()
-        worker = Worker(lambda: self.api.login(email))
-        worker.moveToThread(login_thread)
-        worker.finished.connect(lambda result, error: self._on_login_finished(login_thread, worker, result, error))
-        login_thread.started.connect(worker.run)
-        login_thread.start()
-        self.login_thread = login_thread
-
-    def _on_login_finished(self, thread: QThread, worker: Worker, result, error) -> None:
-        thread.quit()
-        thread.wait()
-        worker.deleteLater()
-        self.login_thread = None
+    def _on_login_finished(self, result, error) -> None:
+        self.login_task = None
 
         if error:
             self.login_status.setText(f"Login failed: {error}")
@@ -184,35 +243,43 @@ class DashboardWindow(QWidget):
             self.login_status.setText("Login failed: token missing.")
             return
 
-        save_token(token)
-        self.api.set_token(token)
+        self.session.login(token)
         self.login_status.setText("")
         self._fetch_me(token)
 
     def _fetch_me(self, token: str) -> None:
-        if self.me_thread and self.me_thread.isRunning():
-            self.me_thread.quit()
-            self.me_thread.wait()
-
-        thread = QThread()
-        worker = Worker(self.api.me)
-        worker.moveToThread(thread)
-        worker.finished.connect(lambda result, error: self._on_me_finished(thread, worker, result, error, token))
-        thread.started.connect(worker.run)
-        thread.start()
-        self.me_thread = thread
-
-    def _on_me_finished(self, thread: QThread, worker: Worker, result, error, token: str) -> None:
-        thread.quit()
-        thread.wait()
-        worker.deleteLater()
-        self.me_thread = None
+        get_executor().cancel(self.me_task, self.me_callback)
+        if self.me_future:
+            self.me_future.cancel()
+        if self.async_api:
+            self.me_future = get_async_bridge().submit(
+                self.async_api.me_and_notices(limit=1),
+                on_done=lambda result, error: self._on_profile_finished(result, error, token),
+            )
+            return
+        self.me_callback = lambda result, error: self._on_me_finished(result, error, token)
+        self.me_task = get_executor().submit(self.api.me, key=("me", token), on_done=self.me_callback)
 
+    def _on_profile_finished(self, result, error, token: str) -> None:
+        self.me_future = None
+        me, notices = result if result else (None, [])
+        self._on_me_finished(me, error, token)
         if error:
-            clear_token()
-            self.api.set_token(None)
-            self.session_invalid.emit()
-            self.login_status.setText(f"Session invalid: {error}")
+            return
+        if isinstance(notices, BaseException):
+            # The session is fine; the badge just waits for the next poll.
+            print(f"Failed to load notices: {notices}")
+            return
+        self.notices_loaded.emit(notices or [])
+
+    def _on_me_finished(self, result, error, token: str) -> None:
+        self.me_task = None
+
+        if error:
+            # A 401 has already been handled through session.expired.
+            if self.session.token == token:
+                self.session.logout()
+                self._show_session_invalid(error)
             return
 
         user_id = (result or {}).get("user_id", "")
@@ -229,15 +296,10 @@ class DashboardWindow(QWidget):
         self.open_home()
 
     # ---- Web ----
-    def open_home(self) -> None:
-        if self.web_view is None:
-            return
-
+    def _home_url(self) -> Optional[QUrl]:
         dev_url = os.environ.get("MEOWBUDDY_DASHBOARD_URL", "").strip()
         if dev_url:
-            self.web_view.setUrl(QUrl(dev_url))
-            self.web_status.setText("")
-            return
+            return QUrl(dev_url)
 
         dist_index = Path(__file__).resolve().parent / "web" / "dist" / "index.html"
         if not dist_index.exists():
@@ -246,25 +308,51 @@ class DashboardWindow(QWidget):
                 "app/web에서 npm run build 실행 후 다시 시도해주세요.\n\n"
                 f"expected: {dist_index}"
             )
-            return
+            return None
+        return QUrl.fromLocalFile(str(dist_index))
 
-        self.web_view.setUrl(QUrl.fromLocalFile(str(dist_index)))
+    def open_home(self) -> None:
+        # Nothing to render while logged out or closed; showEvent calls back in.
+        if self.web_container.isHidden() or not self.isVisible() or not self._ensure_web_view():
+            return
+        url = self._home_url()
+        if url is None:
+            return
         self.web_status.setText("")
+        # Already on home (pre-warmed or just created by showEvent): keep the loaded page.
+        if self.web_view.url() != url:
+            self.web_view.setUrl(url)
 
     def _on_load_finished(self, ok: bool) -> None:
-        if ok:
+        if ok or not self.isVisible():
             return
         url = self.web_view.url().toString() if self.web_view else ""
         QMessageBox.warning(self, "Dashboard Load Failed", f"Failed to load:\n{url}")
 
     def _on_render_terminated(self, *args, **kwargs) -> None:  # noqa: ANN001, D401
         # 렌더 프로세스 종료 시 단순히 상태만 보여줌
+        if not self.isVisible():
+            self._teardown_web_view()
+            return
         QMessageBox.warning(self, "Dashboard", "렌더러가 중단되어 페이지를 다시 로드합니다.")
         self.open_home()
 
+    def _on_session_expired(self) -> None:
+        get_executor().cancel(self.me_task, self.me_callback)
+        if self.me_future:
+            self.me_future.cancel()
+        self.me_task = None
+        self.me_future = None
+        self._show_session_invalid("token expired")
+
+    def _show_session_invalid(self, reason) -> None:
+        self.session_invalid.emit()
+        self.login_status.setText(f"Session invalid: {reason}")
+        self.web_container.setVisible(False)
+        self.login_panel.setVisible(True)
+
     def logout(self) -> None:
-        clear_token()
-        self.api.set_token(None)
+        self.session.logout()
         self.logged_out.emit()
         self.web_container.setVisible(False)
         self.login_panel.setVisible(True)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Tuple
+
+
+@dataclass
+class KeyedDiff:
+    removed: List[int] = field(default_factory=list)  # indices into the old list, ascending
+    inserted: List[int] = field(default_factory=list)  # indices into the new list, ascending
+    changed: List[int] = field(default_factory=list)  # indices into the new list of kept keys whose value differs
+    moved: bool = False  # kept keys appear in a different relative order
+
+    @property
+    def empty(self) -> bool:
+        return not (self.removed or self.inserted or self.changed or self.moved)
+
+
+def diff_keyed(old: Sequence[Dict[str, Any]], new: Sequence[Dict[str, Any]], key: str = "id") -> KeyedDiff:
+    """Compare two lists of dicts by ``key`` in O(len(old) + len(new))."""
+    old_index = {item.get(key): i for i, item in enumerate(old)}
+    new_keys = {item.get(key) for item in new}
+
+    diff = KeyedDiff()
+    diff.removed = [i for i, item in enumerate(old) if item.get(key) not in new_keys]
+
+    last_old = -1
+    for i, item in enumerate(new):
+        j = old_index.get(item.get(key))
+        if j is None:
+            diff.inserted.append(i)
+            continue
+        if j < last_old:
+            diff.moved = True
+        last_old = j
+        if old[j] != item:
+            diff.changed.append(i)
+    return diff
+
+
+def contiguous_runs(indices: Sequence[int]) -> List[Tuple[int, int]]:
+    """Group ascending indices into inclusive (first, last) runs."""
+    runs: List[Tuple[int, int]] = []
+    for i in indices:
+        if runs and runs[-1][1] == i - 1:
+            runs[-1] = (runs[-1][0], i)
+        else:
+            runs.append((i, i))
+    return runs
@@ -1,20 +1,50 @@
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-from typing import Optional
-
-from PyQt6.QtWidgets import QApplication
-
-from app.dashboard import DashboardWindow
-from app.storage_paths import ensure_app_dirs
-from app.tray import TrayManager
-from app.notice_poller import NoticePoller
-from desktopcat.core.asset_manager import AssetManager
-from desktopcat.core.config_loader import ConfigLoader
-from desktopcat.core.context_config import ContextRulesLoader
-from desktopcat.core.context_manager import ContextManager
-from desktopcat.ui.widget import CatWidget
+import time
+
+_IMPORT_START = time.perf_counter()
+
+import sys  # noqa: E402
+from dataclasses import dataclass  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import TYPE_CHECKING, Optional  # noqa: E402
+
+from PyQt6.QtCore import QTimer  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from app.startup_profile import PROFILE_FLAG, StartupProfiler  # noqa: E402
+from app.storage_paths import ensure_app_dirs, get_assets_cache_dir  # noqa: E402
+from desktopcat.core.asset_manager import AssetManager  # noqa: E402
+from desktopcat.core.config_loader import ConfigLoader  # noqa: E402
+from desktopcat.ui.animation import AnimationPool  # noqa: E402
+from desktopcat.ui.widget import CatWidget  # noqa: E402
+
+# Only what the first cat frame needs is imported above. The dashboard
+# (QtWebEngine, requests), tray, notice polling and Win32 context tracking are
+# imported in _start_services once that frame is on screen.
+if TYPE_CHECKING:
+    from app.dashboard import DashboardWindow
+    from app.notice_poller import NoticePoller
+    from app.tray import TrayManager
+    from desktopcat.core.context_manager import ContextManager
+    from desktopcat.ui.frame_stats import FrameStatsLog
+    from desktopcat.ui.playback_governor import PlaybackGovernor
+
+
+PREWARM_IDLE_S = 10.0
+FIRST_FRAME_TIMEOUT_MS = 2000  # start services anyway if the widget never reports a paint
+MANIFEST_VERIFIED_FILE = "manifest_verified.json"  # which asset files already matched the manifest here
+
+
+@dataclass
+class _Services:
+    dashboard: Optional[DashboardWindow] = None
+    tray_manager: Optional[TrayManager] = None
+    context_manager: Optional[ContextManager] = None
+    notice_poller: Optional[NoticePoller] = None
+    playback_governor: Optional[PlaybackGovernor] = None
+    frame_stats_log: Optional[FrameStatsLog] = None
+    started: bool = False
 
 
 def _resolve_override_path(args: list[str]) -> Optional[Path]:
@@ -23,63 +53,149 @@ def _resolve_override_path(args: list[str]) -> Optional[Path]:
     return None
 
 
+def _start_services(
+    app: QApplication,
+    cat_widget: CatWidget,
+    asset_manager: AssetManager,
+    override_path: Optional[Path],
+    services: _Services,
+) -> None:
+    from app.dashboard import DashboardWindow
+    from app.notice_poller import NoticePoller
+    from app.state_store import get_state_store
+    from app.storage_paths import get_logs_dir
+    from app.tray import TrayManager
+    from desktopcat.ui.frame_stats import FrameStatsLog
+    from desktopcat.ui.playback_governor import PlaybackGovernor, PlaybackPolicy
+
+    services.started = True
+    if override_path is None:
+        from desktopcat.core.context_config import ContextRulesLoader
+        from desktopcat.core.context_manager import ContextManager
+
+        services.context_manager = ContextManager(cat_widget, asset_manager, ContextRulesLoader())
+        services.context_manager.start()
+        app.aboutToQuit.connect(services.context_manager.stop)
+
+    # Hidden-cat pausing works everywhere; idle and fullscreen probes come with the Win32 context tracking.
+    idle_seconds = is_fullscreen = None
+    if services.context_manager:
+        from desktopcat.core.window_info import get_idle_seconds, is_foreground_fullscreen
+
+        idle_seconds, is_fullscreen = get_idle_seconds, is_foreground_fullscreen
+    services.playback_governor = PlaybackGovernor(
+        cat_widget,
+        PlaybackPolicy.from_dict(asset_manager.config_loader.get_playback_settings()),
+        idle_seconds=idle_seconds,
+        is_fullscreen=is_fullscreen,
+    )
+    services.playback_governor.start()
+
+    # Frame timing is off unless configured or the tray HUD is open; the log only writes while it is on.
+    frame_settings = asset_manager.config_loader.get_frame_stats_settings()
+    if frame_settings.get("enabled"):
+        cat_widget.enable_frame_stats()
+    services.frame_stats_log = FrameStatsLog(
+        cat_widget, get_logs_dir(), float(frame_settings.get("log_interval_s", 60))
+    )
+    services.frame_stats_log.start()
+    app.aboutToQuit.connect(services.frame_stats_log.write)
+
+    dashboard = DashboardWindow()
+    services.dashboard = dashboard
+    if dashboard.web_view_mode == "prewarm":
+        from desktopcat.core.window_info import get_idle_seconds
+
+        dashboard.schedule_prewarm(is_idle=lambda: get_idle_seconds() >= PREWARM_IDLE_S)
+
+    def open_dashboard_home() -> None:
+        dashboard.show()
+        dashboard.raise_()
+        dashboard.activateWindow()
+        dashboard.open_home()
+
+        if services.notice_poller:
+            services.notice_poller.mark_seen()
+        cat_widget.set_notice_indicator(False)
+
+    cat_widget.set_notice_callback(open_dashboard_home)
+    services.tray_manager = TrayManager(cat_widget, dashboard, services.context_manager)
+
+    if services.context_manager:
+        from desktopcat.core.window_info import get_idle_seconds
+
+        notice_poller = NoticePoller(
+            on_new_notice=lambda has_new: cat_widget.set_notice_indicator(has_new),
+            idle_seconds=get_idle_seconds,
+            is_hidden=lambda: not cat_widget.isVisible(),
+        )
+        services.notice_poller = notice_poller
+        # The poller follows the shared ApiSession token; only the initial notices come from the dashboard.
+        dashboard.notices_loaded.connect(notice_poller.handle_notices)
+        app.aboutToQuit.connect(notice_poller.stop)
+    app.aboutToQuit.connect(get_state_store().flush)
+
+
 def main() -> int:
-    app = QApplication(sys.argv)
+    profiler = StartupProfiler(PROFILE_FLAG in sys.argv, origin=_IMPORT_START)
+    argv = [arg for arg in sys.argv if arg != PROFILE_FLAG]
+    profiler.mark("imports")
+
+    app = QApplication(argv)
     app.setQuitOnLastWindowClosed(False)
+    profiler.mark("qapplication")
 
     ensure_app_dirs()
 
     config_loader = ConfigLoader()
-    asset_manager = AssetManager(config_loader)
-    context_rules_loader = ContextRulesLoader()
-    override_path = _resolve_override_path(sys.argv)
+    asset_manager = AssetManager(
+        config_loader, watch=True, manifest_verified_path=get_assets_cache_dir() / MANIFEST_VERIFIED_FILE
+    )
+    override_path = _resolve_override_path(argv)
 
     try:
         asset = asset_manager.resolve_asset(override_path=override_path)
     except Exception as exc:  # noqa: BLE001
         print(f"Failed to load asset: {exc}")
         return 1
-
-    cat_widget = CatWidget(asset)
+    profiler.mark("asset_resolution")
+
+    cat_widget = CatWidget(
+        asset,
+        animation_pool=AnimationPool(config_loader.get_animation_pool_budget(), config_loader.get_frame_budget()),
+        render_mode=config_loader.get_render_mode(),
+        crossfade_ms=config_loader.get_crossfade_ms(),
+    )
     cat_widget.show()
+    profiler.mark("cat_widget")
 
-    context_manager: Optional[ContextManager] = None
-    if override_path is None:
-        context_manager = ContextManager(cat_widget, asset_manager, context_rules_loader)
-        context_manager.start()
-        app.aboutToQuit.connect(context_manager.stop)
+    services = _Services()
 
-    dashboard = DashboardWindow()
-    notice_poller: Optional[NoticePoller] = None
+    def on_first_frame(phase: str = "first_paint") -> None:
+        if services.started:
+            return
+        profiler.mark(phase)
+        _start_services(app, cat_widget, asset_manager, override_path, services)
+        profiler.mark("tray_ready")
+        profiler.finish()
 
-    def open_dashboard_home() -> None:
-        dashboard.show()
-        dashboard.raise_()
-        dashboard.activateWindow()
-        dashboard.open_home()
-
-        if notice_poller:
-            notice_poller.mark_seen()
-        cat_widget.set_notice_indicator(False)
-
-    cat_widget.set_notice_callback(open_dashboard_home)
-    tray_manager = TrayManager(cat_widget, dashboard, context_manager)
-
-    if context_manager:
-        notice_poller = NoticePoller(on_new_notice=lambda has_new: cat_widget.set_notice_indicator(has_new))
-        dashboard.logged_in.connect(lambda token, user_id: notice_poller.set_token(token) or notice_poller.start())
-        dashboard.logged_out.connect(notice_poller.stop)
-        dashboard.session_invalid.connect(notice_poller.stop)
-        app.aboutToQuit.connect(notice_poller.stop)
+    cat_widget.first_frame_shown.connect(on_first_frame)
+    QTimer.singleShot(FIRST_FRAME_TIMEOUT_MS, lambda: on_first_frame("first_paint_timeout"))
 
     exit_code = app.exec()
 
     # Clean shutdown
-    if context_manager:
-        context_manager.stop()
-    if notice_poller:
-        notice_poller.stop()
-    tray_manager.tray.hide()
+    from app.async_api_client import shutdown_async_bridge
+    from app.task_executor import get_executor
+
+    if services.context_manager:
+        services.context_manager.stop()
+    if services.notice_poller:
+        services.notice_poller.stop()
+    get_executor().shutdown()
+    shutdown_async_bridge()
+    if services.tray_manager:
+        services.tray_manager.tray.hide()
 
     return exit_code
 
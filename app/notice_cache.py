@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from app.storage_paths import get_settings_dir
+
+
+NOTICE_CACHE_FILE = "notice_cache.sqlite3"
+SYNC_PAGE_SIZE = 200  # server-side maximum for GET /notices
+
+
+def _token_key(token: Optional[str]) -> str:
+    # Only a digest is stored next to the feed; the token itself lives in token_store.
+    return hashlib.sha256(token.encode("utf-8")).hexdigest() if token else ""
+
+
+class NoticeCache:
+    """Local SQLite copy of the notice feed so the home page can render before the network answers.
+
+    The feed belongs to one user: ``sync_state`` records whose it is (user
+    id, a digest of the token and the subscriptions it was built from), and
+    ``load`` returns nothing for another token. ``sync`` fetches only newer
+    notices while all of that still holds and the delta came back shorter
+    than a page; otherwise it replaces the feed with a full fetch.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        self.db_path = Path(db_path) if db_path else get_settings_dir() / NOTICE_CACHE_FILE
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._connect()
+        try:
+            # WAL lets the UI thread read while a background sync writes.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS notices (
+                    id TEXT PRIMARY KEY,
+                    vtuber_id TEXT,
+                    title TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                );
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_notices_created ON notices (created_at DESC)")
+            conn.execute("CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _read_state(self, conn: sqlite3.Connection) -> Dict[str, str]:
+        return {row["key"]: row["value"] for row in conn.execute("SELECT key, value FROM sync_state")}
+
+    def load(self, token: Optional[str], limit: int = SYNC_PAGE_SIZE) -> List[Dict]:
+        """The cached feed if it was synced with ``token``, newest first; otherwise nothing."""
+        conn = self._connect()
+        try:
+            if self._read_state(conn).get("token") != _token_key(token):
+                return []
+            rows = conn.execute(
+                "SELECT id, vtuber_id, title, content, created_at FROM notices ORDER BY created_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+            return [dict(row) for row in rows]
+        finally:
+            conn.close()
+
+    def newest_created_at(self) -> Optional[str]:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT MAX(created_at) AS newest FROM notices").fetchone()
+            return row["newest"] if row else None
+        finally:
+            conn.close()
+
+    def upsert(self, notices: Iterable[Dict]) -> int:
+        conn = self._connect()
+        try:
+            count = self._upsert(conn, notices)
+            conn.commit()
+            return count
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, notices: Iterable[Dict]) -> int:
+        rows = [
+            (n.get("id"), n.get("vtuber_id"), n.get("title", ""), n.get("content", ""), n.get("created_at", ""))
+            for n in notices
+            if n.get("id")
+        ]
+        if rows:
+            conn.executemany(
+                """
+                INSERT INTO notices (id, vtuber_id, title, content, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    vtuber_id = excluded.vtuber_id,
+                    title = excluded.title,
+                    content = excluded.content,
+                    created_at = excluded.created_at
+                """,
+                rows,
+            )
+        return len(rows)
+
+    def replace(self, notices: Iterable[Dict], state: Dict[str, str]) -> None:
+        """Swap in a complete feed and who it belongs to, in one transaction."""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM notices")
+            conn.execute("DELETE FROM sync_state")
+            self._upsert(conn, notices)
+            conn.executemany("INSERT INTO sync_state (key, value) VALUES (?, ?)", state.items())
+            conn.commit()
+        finally:
+            conn.close()
+
+    def clear(self) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM notices")
+            conn.execute("DELETE FROM sync_state")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def sync(self, api) -> List[Dict]:
+        """Bring the cache up to date for ``api``'s user and return the feed.
+
+        A delta is only trusted when the user, token and subscriptions match
+        the cached feed and it came back shorter than a page; a full page may
+        have skipped notices in between. ``since`` is inclusive on the server,
+        so a notice sharing the newest cached timestamp is not missed; the
+        ones already held are deduped by id.
+        Anything else (re-login, (un)subscribing, a burst) refetches the feed,
+        which also drops unsubscribed creators and backfills new ones.
+        """
+        token = api.token
+        state = {
+            "owner": str((api.me() or {}).get("user_id", "")),
+            "token": _token_key(token),
+            "subscriptions": json.dumps(sorted(api.get_subscriptions())),
+        }
+        conn = self._connect()
+        try:
+            current = self._read_state(conn) == state
+        finally:
+            conn.close()
+        if current:
+            fresh = api.get_notices(limit=SYNC_PAGE_SIZE, since=self.newest_created_at())
+            if len(fresh) < SYNC_PAGE_SIZE:
+                self.upsert(fresh)
+                return self.load(token)
+        self.replace(api.get_notices(limit=SYNC_PAGE_SIZE), state)
+        return self.load(token)
@@ -1,83 +1,128 @@
 from __future__ import annotations
 
-from __future__ import annotations
-
-from typing import Optional, Callable
+from typing import Any, Dict, Optional, Callable
 
-from PyQt6.QtCore import QObject, QThread, QTimer
+from PyQt6.QtCore import QObject, QTimer
 import requests
 
-from app.api_client import ApiClient
 from app.notice_state import is_newer, load_last_seen, save_last_seen
-from app.worker import Worker
+from app.poll_scheduler import AdaptivePollScheduler, PollSchedulerConfig
+from app.session import ApiSession, get_api_session
+from app.task_executor import TaskHandle, get_executor
 
 
 class NoticePoller(QObject):
-    """Poll notices periodically and trigger indicator when new items exist."""
-
-    def __init__(self, on_new_notice: Callable[[bool], None], interval_ms: int = 10000) -> None:
+    """Poll notices on an adaptive schedule and trigger indicator when new items exist.
+
+    Runs while the shared ApiSession holds a token.
+    """
+
+    def __init__(
+        self,
+        on_new_notice: Callable[[bool], None],
+        interval_ms: int = 10000,
+        scheduler_config: Optional[PollSchedulerConfig] = None,
+        idle_seconds: Optional[Callable[[], float]] = None,
+        is_hidden: Optional[Callable[[], bool]] = None,
+        session: Optional[ApiSession] = None,
+    ) -> None:
         super().__init__()
         self.on_new_notice = on_new_notice
         self.interval_ms = interval_ms
+        self.scheduler = AdaptivePollScheduler(scheduler_config or PollSchedulerConfig(base_ms=interval_ms))
+        self.idle_seconds = idle_seconds
+        self.is_hidden = is_hidden
         self.timer = QTimer(self)
-        self.timer.setInterval(self.interval_ms)
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self._tick)
-        self.api = ApiClient()
-        self.current_thread: Optional[QThread] = None
+        self.session = session or get_api_session()
+        self.api = self.session.poll_client
+        self.current_task: Optional[TaskHandle] = None
         self.latest_created_at: Optional[str] = None
-
-    def set_token(self, token: Optional[str]) -> None:
-        self.api.set_token(token)
+        self.running = False
+        self.session.token_changed.connect(self._on_token_changed)
+        if self.session.token:
+            self.start()
+
+    def _on_token_changed(self, token: Optional[str]) -> None:
+        if token:
+            self.start()
+        else:
+            self.stop()
+            self.on_new_notice(False)
 
     def start(self) -> None:
-        if not self.timer.isActive():
-            self.timer.start()
+        if not self.running:
+            self.running = True
+            self._schedule_next()
 
     def stop(self) -> None:
+        self.running = False
         self.timer.stop()
-        if self.current_thread and self.current_thread.isRunning():
-            self.current_thread.quit()
-            self.current_thread.wait()
-        self.current_thread = None
+        get_executor().cancel(self.current_task, self._on_finished)
+        self.current_task = None
 
     def mark_seen(self) -> None:
         if self.latest_created_at:
             save_last_seen(self.latest_created_at)
         self.on_new_notice(False)
 
+    def scheduler_state(self) -> Dict[str, Any]:
+        state = self.scheduler.state()
+        state["running"] = self.running
+        state["next_poll_in_ms"] = self.timer.remainingTime() if self.timer.isActive() else None
+        return state
+
+    def _refresh_activity(self) -> None:
+        if self.idle_seconds:
+            try:
+                self.scheduler.set_idle(self.idle_seconds() >= self.scheduler.config.idle_after_s)
+            except Exception:
+                self.scheduler.set_idle(False)
+        if self.is_hidden:
+            self.scheduler.set_hidden(bool(self.is_hidden()))
+
+    def _schedule_next(self) -> None:
+        if not self.running:
+            return
+        self._refresh_activity()
+        self.timer.start(self.scheduler.next_delay_ms())
+
     def _tick(self) -> None:
-        if self.current_thread and self.current_thread.isRunning():
+        if self.current_task and self.current_task.is_running():
+            self._schedule_next()
             return
 
         def fetch():
-            return self.api.get_notices()
+            # The badge only needs the newest notice across subscribed creators.
+            return self.api.get_notices(limit=1)
 
-        self._run_in_thread(fetch, self._on_finished)
+        self.current_task = get_executor().submit(fetch, key=("notice_poll", self.api.token), on_done=self._on_finished)
 
-    def _run_in_thread(self, fn, on_done) -> None:
-        thread = QThread()
-        worker = Worker(fn)
-        worker.moveToThread(thread)
-        worker.finished.connect(lambda result, error: on_done(thread, worker, result, error))
-        thread.started.connect(worker.run)
-        thread.start()
-        self.current_thread = thread
-
-    def _on_finished(self, thread: QThread, worker: Worker, result, error) -> None:
-        thread.quit()
-        thread.wait()
-        worker.deleteLater()
-        self.current_thread = None
+    def _on_finished(self, result, error) -> None:
+        self.current_task = None
 
         if error:
-            if isinstance(error, requests.exceptions.HTTPError) and error.response is not None and error.response.status_code == 401:
-                self.on_new_notice(False)
+            response = getattr(error, "response", None) if isinstance(error, requests.exceptions.RequestException) else None
+            status_code = response.status_code if response is not None else None
+            retry_after = response.headers.get("Retry-After") if response is not None else None
+            self.scheduler.record_error(status_code, retry_after)
+            # A 401 logs the session out, which stops this poller via token_changed.
+            self._schedule_next()
             return
 
-        if not result:
+        previous = self.latest_created_at
+        self.handle_notices(result)
+        arrived = previous is not None and self.latest_created_at != previous
+        self.scheduler.record_success(arrived)
+        self._schedule_next()
+
+    def handle_notices(self, notices) -> None:
+        """Update the indicator from a newest-first notice list fetched elsewhere or by the poll."""
+        if not notices:
             self.on_new_notice(False)
             return
-        latest = result[0].get("created_at")
+        latest = notices[0].get("created_at")
         self.latest_created_at = latest
         last_seen = load_last_seen()
         has_new = bool(latest and is_newer(latest, last_seen))
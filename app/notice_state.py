@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from app.state_store import get_state_store
 from app.storage_paths import get_settings_dir
 
 
@@ -16,19 +16,11 @@ def _state_path() -> Path:
 
 
 def save_last_seen(created_at: str) -> None:
-    path = _state_path()
-    path.write_text(json.dumps({"last_seen": created_at}), encoding="utf-8")
+    get_state_store().set(_state_path(), "last_seen", created_at)
 
 
 def load_last_seen() -> Optional[str]:
-    path = _state_path()
-    if not path.exists():
-        return None
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return data.get("last_seen")
-    except Exception:
-        return None
+    return get_state_store().get(_state_path(), "last_seen")
 
 
 def is_newer(created_at: str, last_seen: Optional[str]) -> bool:
@@ -3,62 +3,273 @@ from __future__ import annotations
 from functools import partial
 from typing import Optional, List, Dict
 
-from PyQt6.QtCore import Qt, QThread
+from PyQt6 import sip
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QPoint, QPointF, QRectF, QSize, Qt
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen, QPixmap, QStaticText, QTextOption
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
     QPushButton,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTextEdit,
     QVBoxLayout,
     QWidget,
     QScrollArea,
-    QFrame,
 )
 
-from app.api_client import ApiClient
-from app.worker import Worker
+from app.keyed_diff import contiguous_runs, diff_keyed
+from app.notice_cache import NoticeCache
+from app.session import get_api_session
+from app.task_executor import TaskHandle, get_executor
+from app.thumbnails import ThumbKey, get_thumbnail_service
 
 
-class NoticeCard(QFrame):
-    def __init__(self, notice: dict):
-        super().__init__()
-        self.notice = notice
-        self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setStyleSheet(
-            """
-            QFrame {
-                background: #ffffff;
-                border: 1px solid #e5e5e8;
-                border-radius: 12px;
-            }
-            """
+NoticeRole = Qt.ItemDataRole.UserRole
+CLIP_THUMB_SIZE = QSize(480, 270)
+
+
+class NoticeListModel(QAbstractListModel):
+    """Notices exposed to the view a page at a time through ``fetchMore``."""
+
+    def __init__(self, page_size: int = 50, parent=None) -> None:
+        super().__init__(parent)
+        self.page_size = page_size
+        self._notices: List[Dict] = []
+        self._loaded = 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008, N802
+        return 0 if parent.isValid() else self._loaded
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        notice = self._notices[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return notice.get("title", "")
+        if role == NoticeRole:
+            return notice
+        return None
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:  # noqa: N802
+        return not parent.isValid() and self._loaded < len(self._notices)
+
+    def fetchMore(self, parent: QModelIndex) -> None:  # noqa: N802
+        if parent.isValid():
+            return
+        count = min(self.page_size, len(self._notices) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def set_notices(self, notices: List[Dict]) -> None:
+        """Patch the model toward ``notices`` by id so views keep scroll position and selection."""
+        new = list(notices)
+        if not self._notices or not new:
+            self.beginResetModel()
+            self._notices = new
+            self._loaded = min(self.page_size, len(new))
+            self.endResetModel()
+            return
+
+        diff = diff_keyed(self._notices, new)
+        if diff.empty:
+            return
+        if diff.moved:
+            self._relayout(new)
+            return
+
+        for first, last in reversed(contiguous_runs(diff.removed)):
+            self._remove_rows(first, last)
+        for first, last in contiguous_runs(diff.inserted):
+            self._insert_rows(first, new[first : last + 1])
+        self._notices = new
+        for first, last in contiguous_runs(diff.changed):
+            if first < self._loaded:
+                self.dataChanged.emit(self.index(first), self.index(min(last, self._loaded - 1)))
+
+    def _remove_rows(self, first: int, last: int) -> None:
+        if first >= self._loaded:
+            del self._notices[first : last + 1]
+            return
+        visible_last = min(last, self._loaded - 1)
+        self.beginRemoveRows(QModelIndex(), first, visible_last)
+        del self._notices[first : last + 1]
+        self._loaded -= visible_last - first + 1
+        self.endRemoveRows()
+
+    def _insert_rows(self, first: int, items: List[Dict]) -> None:
+        if first >= self._loaded:
+            self._notices[first:first] = items
+            return
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self._notices[first:first] = items
+        self._loaded += len(items)
+        self.endInsertRows()
+
+    def _relayout(self, new: List[Dict]) -> None:
+        # Reordered rows: remap persistent indexes by id instead of resetting.
+        self.layoutAboutToBeChanged.emit()
+        old_ids = [n.get("id") for n in self._notices]
+        new_rows = {n.get("id"): i for i, n in enumerate(new)}
+        self._notices = new
+        self._loaded = min(max(self._loaded, self.page_size), len(new))
+        persistent = self.persistentIndexList()
+        remapped = []
+        for index in persistent:
+            row = new_rows.get(old_ids[index.row()]) if index.row() < len(old_ids) else None
+            remapped.append(self.index(row) if row is not None and row < self._loaded else QModelIndex())
+        self.changePersistentIndexList(persistent, remapped)
+        self.layoutChanged.emit()
+
+    def total_count(self) -> int:
+        return len(self._notices)
+
+    def row_of(self, notice_id) -> int:
+        """Loaded row holding ``notice_id``, or -1."""
+        for row in range(self._loaded):
+            if self._notices[row].get("id") == notice_id:
+                return row
+        return -1
+
+
+class _CardLayout:
+    __slots__ = ("title", "body", "date", "height")
+
+    def __init__(self, title: str, body: QStaticText, date: str, height: int) -> None:
+        self.title = title
+        self.body = body
+        self.date = date
+        self.height = height
+
+
+class NoticeCardDelegate(QStyledItemDelegate):
+    """Paints notice cards directly; text layout and height are cached per (notice, width)."""
+
+    PADDING = 12
+    SPACING = 4
+    RADIUS = 12
+    PREVIEW_LENGTH = 120
+    CACHE_LIMIT = 2048
+    HEIGHT_CACHE_LIMIT = 65536
+
+    def __init__(self, view: QListView) -> None:
+        super().__init__(view)
+        self.view = view
+        self.title_font = QFont(view.font())
+        self.title_font.setPixelSize(15)
+        self.title_font.setWeight(QFont.Weight.DemiBold)
+        self.body_font = QFont(view.font())
+        self.date_font = QFont(view.font())
+        self.date_font.setPixelSize(12)
+        self._title_metrics = QFontMetrics(self.title_font)
+        self._date_metrics = QFontMetrics(self.date_font)
+        self._layouts: Dict[tuple, _CardLayout] = {}
+        # Heights are plain ints, so keep far more of them than text layouts;
+        # relayouts after an incremental update then only measure new or edited rows.
+        self._heights: Dict[tuple, int] = {}
+
+    def _preview(self, text: str) -> str:
+        return text if len(text) <= self.PREVIEW_LENGTH else text[: self.PREVIEW_LENGTH] + "…"
+
+    def _card_width(self) -> int:
+        return max(self.view.viewport().width() - 2 * self.view.spacing(), 120)
+
+    @staticmethod
+    def _key(notice: Dict, width: int) -> tuple:
+        return (notice.get("id"), notice.get("title"), notice.get("content"), width)
+
+    def _layout(self, notice: Dict, width: int) -> _CardLayout:
+        key = self._key(notice, width)
+        cached = self._layouts.get(key)
+        if cached is not None:
+            return cached
+        text_width = width - 2 * self.PADDING
+        title = self._title_metrics.elidedText(notice.get("title", ""), Qt.TextElideMode.ElideRight, text_width)
+        body = QStaticText(self._preview(notice.get("content", "")))
+        body.setTextFormat(Qt.TextFormat.PlainText)
+        body.setTextWidth(text_width)
+        body.setTextOption(QTextOption(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop))
+        body.prepare(font=self.body_font)
+        height = (
+            2 * self.PADDING
+            + self._title_metrics.height()
+            + self.SPACING
+            + int(body.size().height())
+            + self.SPACING
+            + self._date_metrics.height()
         )
-        layout = QVBoxLayout()
-        title = QLabel(notice.get("title", ""))
-        title.setStyleSheet("font-weight: 600; font-size: 15px;")
-        content = QLabel(self._preview(notice.get("content", "")))
-        content.setWordWrap(True)
-        date = QLabel(notice.get("created_at", ""))
-        date.setAlignment(Qt.AlignmentFlag.AlignRight)
-        date.setStyleSheet("color: #777; font-size: 12px;")
-        layout.addWidget(title)
-        layout.addWidget(content)
-        layout.addWidget(date)
-        self.setLayout(layout)
-
-    def _preview(self, text: str, length: int = 120) -> str:
-        return text if len(text) <= length else text[:length] + "…"
+        if len(self._layouts) >= self.CACHE_LIMIT:
+            self._layouts.clear()
+        layout = _CardLayout(title, body, notice.get("created_at", ""), height)
+        self._layouts[key] = layout
+        return layout
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:  # noqa: N802
+        notice = index.data(NoticeRole)
+        if not isinstance(notice, dict):
+            return super().sizeHint(option, index)
+        width = self._card_width()
+        key = self._key(notice, width)
+        height = self._heights.get(key)
+        if height is None:
+            height = self._layout(notice, width).height
+            if len(self._heights) >= self.HEIGHT_CACHE_LIMIT:
+                self._heights.clear()
+            self._heights[key] = height
+        return QSize(width, height)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        notice = index.data(NoticeRole)
+        if not isinstance(notice, dict):
+            super().paint(painter, option, index)
+            return
+        rect = option.rect
+        layout = self._layout(notice, rect.width())
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.setPen(QPen(QColor("#c9c9d0" if hovered else "#e5e5e8"), 1))
+        painter.setBrush(QColor("#ffffff"))
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), self.RADIUS, self.RADIUS)
+
+        x = rect.left() + self.PADDING
+        y = rect.top() + self.PADDING
+        text_width = rect.width() - 2 * self.PADDING
+        painter.setPen(QColor("#000000"))
+        painter.setFont(self.title_font)
+        painter.drawText(QRectF(x, y, text_width, self._title_metrics.height()), Qt.AlignmentFlag.AlignLeft, layout.title)
+        y += self._title_metrics.height() + self.SPACING
+
+        painter.setFont(self.body_font)
+        painter.drawStaticText(QPointF(x, y), layout.body)
+        y += int(layout.body.size().height()) + self.SPACING
+
+        painter.setPen(QColor("#777777"))
+        painter.setFont(self.date_font)
+        painter.drawText(QRectF(x, y, text_width, self._date_metrics.height()), Qt.AlignmentFlag.AlignRight, layout.date)
+        painter.restore()
 
 
 class HomePage(QWidget):
     def __init__(self) -> None:
         super().__init__()
-        self.api = ApiClient()
-        self.current_thread: Optional[QThread] = None
+        self.session = get_api_session()
+        self.api = self.session.client
+        self.session.token_changed.connect(self._on_token_changed)
+        self.cache = NoticeCache()
+        self.current_task: Optional[TaskHandle] = None
+        self.clip_thumb: Optional[ThumbKey] = None
         self._build_ui()
+        # Show whatever was cached last session right away; refresh_notices reconciles it.
+        self._render_notices(self.cache.load(self.api.token))
 
     def _build_ui(self) -> None:
         main_layout = QHBoxLayout()
@@ -71,11 +282,36 @@ class HomePage(QWidget):
         header.setStyleSheet("font-weight: 600; font-size: 16px;")
         left.addWidget(header)
 
-        self.notice_list = QListWidget()
+        self.notice_status = QLabel("")
+        self.notice_status.setStyleSheet("color: #777; font-size: 12px;")
+        self.notice_status.setVisible(False)
+        left.addWidget(self.notice_status)
+
+        self.notice_model = NoticeListModel(parent=self)
+        self.notice_list = QListView()
         self.notice_list.setSpacing(8)
-        self.notice_list.itemClicked.connect(self._on_notice_clicked)
+        self.notice_list.setMouseTracking(True)
+        self.notice_list.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.notice_list.setResizeMode(QListView.ResizeMode.Adjust)
+        self.notice_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.notice_list.setModel(self.notice_model)
+        self.notice_delegate = NoticeCardDelegate(self.notice_list)
+        self.notice_list.setItemDelegate(self.notice_delegate)
+        # Edited notices may change height; ask the view to re-measure just those rows.
+        self.notice_model.dataChanged.connect(
+            lambda top, bottom, *_: [
+                self.notice_delegate.sizeHintChanged.emit(self.notice_model.index(row))
+                for row in range(top.row(), bottom.row() + 1)
+            ]
+        )
+        self.notice_list.clicked.connect(self._on_notice_clicked)
         left.addWidget(self.notice_list, stretch=2)
 
+        self.notice_empty = QLabel("아직 공지가 없습니다")
+        self.notice_empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.notice_empty.setStyleSheet("color: #777;")
+        left.addWidget(self.notice_empty, stretch=2)
+
         streams_label = QLabel("Recent Streams")
         streams_label.setStyleSheet("font-weight: 600; font-size: 16px; margin-top:8px;")
         left.addWidget(streams_label)
@@ -112,48 +348,77 @@ class HomePage(QWidget):
 
         self._load_mock_streams()
 
-    def set_token(self, token: Optional[str]) -> None:
-        self.api.set_token(token)
+    def _on_token_changed(self, token: Optional[str]) -> None:
+        if token is None:
+            self.cache.clear()
+            self._render_notices([])
 
     def refresh_notices(self) -> None:
-        if self.current_thread and self.current_thread.isRunning():
+        if self.current_task and self.current_task.is_running():
             return
-        thread = QThread()
-        worker = Worker(self.api.get_notices)
-        worker.moveToThread(thread)
-        worker.finished.connect(lambda result, error: self._on_notices_finished(thread, worker, result, error))
-        thread.started.connect(worker.run)
-        thread.start()
-        self.current_thread = thread
-
-    def _on_notices_finished(self, thread: QThread, worker: Worker, result, error) -> None:
-        thread.quit()
-        thread.wait()
-        worker.deleteLater()
-        self.current_thread = None
+        self.current_task = get_executor().submit(
+            self.cache.sync, self.api, key=("notices", self.api.token), on_done=self._on_notices_finished
+        )
+
+    def _on_notices_finished(self, result, error) -> None:
+        self.current_task = None
 
         if error:
-            QMessageBox.warning(self, "Notice Error", f"Failed to load notices: {error}")
+            # Keep the cached list on screen; only say that it may be stale.
+            self.notice_status.setText(f"오프라인: 저장된 공지를 표시합니다 ({error.__class__.__name__})")
+            self.notice_status.setVisible(True)
             return
+        self.notice_status.setVisible(False)
         self._render_notices(result or [])
 
     def _render_notices(self, notices: List[Dict]) -> None:
-        self.notice_list.clear()
-        if not notices:
-            self.notice_list.addItem("아직 공지가 없습니다")
-            self.notice_list.setEnabled(False)
-            return
-        self.notice_list.setEnabled(True)
-        for notice in notices:
-            item = QListWidgetItem()
-            card = NoticeCard(notice)
-            item.setSizeHint(card.sizeHint())
-            item.setData(Qt.ItemDataRole.UserRole, notice)
-            self.notice_list.addItem(item)
-            self.notice_list.setItemWidget(item, card)
-
-    def _on_notice_clicked(self, item: QListWidgetItem) -> None:
-        data = item.data(Qt.ItemDataRole.UserRole)
+        # Anchor the top visible notice so rows inserted above it don't shift the view.
+        view = self.notice_list
+        anchor = self._top_visible_index()
+        anchor_id = anchor.data(NoticeRole).get("id") if anchor.isValid() else None
+        anchor_top = view.visualRect(anchor).top() if anchor.isValid() else 0
+
+        self.notice_model.set_notices(notices)
+
+        if anchor_id is not None and anchor.row() > 0:
+            row = self.notice_model.row_of(anchor_id)
+            if row >= 0 and row != anchor.row():
+                view.doItemsLayout()
+                shift = view.visualRect(self.notice_model.index(row)).top() - anchor_top
+                if shift:
+                    bar = view.verticalScrollBar()
+                    bar.setValue(bar.value() + shift)
+        self.notice_list.setVisible(bool(notices))
+        self.notice_empty.setVisible(not notices)
+
+    def set_clip_image(self, path) -> None:
+        """Show a clip thumbnail; decoded in the background, placeholder text until then."""
+        thumbnails = get_thumbnail_service()
+        if self.clip_thumb is not None:
+            # A slower decode of the previous clip must not land over this one.
+            thumbnails.discard(self.clip_thumb, self._on_clip_thumbnail)
+            self.clip_thumb = None
+        self.clip_image.setPixmap(QPixmap())
+        self.clip_image.setText("Clip Placeholder")
+        if path:
+            self.clip_thumb = thumbnails.request(path, CLIP_THUMB_SIZE, self._on_clip_thumbnail)
+
+    def _on_clip_thumbnail(self, pixmap) -> None:
+        if pixmap is not None and not sip.isdeleted(self):
+            self.clip_image.setPixmap(pixmap)
+
+    def _top_visible_index(self) -> QModelIndex:
+        view = self.notice_list
+        x = view.viewport().width() // 2
+        # The top edge may fall in the spacing between two cards.
+        for y in range(0, 2 * view.spacing() + 2, 2):
+            index = view.indexAt(QPoint(x, y))
+            if index.isValid():
+                return index
+        return QModelIndex()
+
+    def _on_notice_clicked(self, index: QModelIndex) -> None:
+        data = index.data(NoticeRole)
         if not isinstance(data, dict):
             return
         title = data.get("title", "")
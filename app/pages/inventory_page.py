@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import List, Dict
+from typing import Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt
+from PyQt6 import sip
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import (
     QGridLayout,
     QLabel,
@@ -12,6 +14,11 @@ from PyQt6.QtWidgets import (
     QFrame,
 )
 
+from app.thumbnails import ThumbKey, get_thumbnail_service
+
+
+THUMB_SIZE = QSize(240, 160)
+
 
 class ItemCard(QFrame):
     def __init__(self, item: Dict, locked: bool = False, equipped: bool = False, on_action=None):
@@ -20,40 +27,80 @@ class ItemCard(QFrame):
         self.locked = locked
         self.equipped = equipped
         self.on_action = on_action
+        self.cell: Tuple[int, int] = (-1, -1)
+        self.thumb: Optional[ThumbKey] = None
+        # Copy, since the page mutates its item dicts in place.
+        self._snapshot = dict(item)
         self.setFrameShape(QFrame.Shape.StyledPanel)
         self.setStyleSheet("background: #fff; border: 1px solid #e5e5e8; border-radius: 12px;")
         self._build()
 
     def _build(self) -> None:
         layout = QVBoxLayout()
-        img = QLabel()
-        img.setStyleSheet("background:#eceff3; border-radius: 12px; min-height: 160px;")
-        img.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        img.setText(self.item.get("name", ""))
-
-        name = QLabel(self.item.get("name", ""))
-        name.setStyleSheet("font-weight: 600;")
-        price = QLabel(self.item.get("price", ""))
-        price.setAlignment(Qt.AlignmentFlag.AlignRight)
-        price.setStyleSheet("color: #7b1fa2;")
-
-        btn = QPushButton()
-        if self.locked:
-            btn.setText("Purchase")
-        else:
-            btn.setText("Equipped" if self.equipped else "Equip")
-            btn.setEnabled(not self.equipped)
+        self.img = QLabel()
+        self.img.setStyleSheet("background:#eceff3; border-radius: 12px; min-height: 160px;")
+        self.img.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.name = QLabel()
+        self.name.setStyleSheet("font-weight: 600;")
+        self.price = QLabel()
+        self.price.setAlignment(Qt.AlignmentFlag.AlignRight)
+        self.price.setStyleSheet("color: #7b1fa2;")
 
-        btn.clicked.connect(self._handle_action)
+        self.btn = QPushButton()
+        self.btn.clicked.connect(self._handle_action)
+        self._apply()
 
-        layout.addWidget(img)
+        layout.addWidget(self.img)
         header = QVBoxLayout()
-        header.addWidget(name)
-        header.addWidget(price)
+        header.addWidget(self.name)
+        header.addWidget(self.price)
         layout.addLayout(header)
-        layout.addWidget(btn)
+        layout.addWidget(self.btn)
         self.setLayout(layout)
 
+    def _apply(self, image_changed: bool = True) -> None:
+        if image_changed:
+            self._apply_image()
+        self.name.setText(self.item.get("name", ""))
+        self.price.setText(self.item.get("price", ""))
+        if self.locked:
+            self.btn.setText("Purchase")
+            self.btn.setEnabled(True)
+        else:
+            self.btn.setText("Equipped" if self.equipped else "Equip")
+            self.btn.setEnabled(not self.equipped)
+
+    def _apply_image(self) -> None:
+        # Show the name until the thumbnail arrives; it is decoded off the UI thread.
+        thumbnails = get_thumbnail_service()
+        if self.thumb is not None:
+            # The previous image may still be decoding; it must not replace this one.
+            thumbnails.discard(self.thumb, self._on_thumbnail)
+            self.thumb = None
+        self.img.setPixmap(QPixmap())
+        self.img.setText(self.item.get("name", ""))
+        image = self.item.get("image")
+        if image:
+            self.thumb = thumbnails.request(image, THUMB_SIZE, self._on_thumbnail)
+
+    def _on_thumbnail(self, pixmap) -> None:
+        if sip.isdeleted(self) or pixmap is None:
+            return
+        self.img.setPixmap(pixmap)
+
+    def update_item(self, item: Dict, locked: bool, equipped: bool) -> bool:
+        """Refresh labels in place; returns False when nothing visible changed."""
+        self.item = item
+        if item == self._snapshot and locked == self.locked and equipped == self.equipped:
+            return False
+        image_changed = item.get("image") != self._snapshot.get("image")
+        self._snapshot = dict(item)
+        self.locked = locked
+        self.equipped = equipped
+        self._apply(image_changed)
+        return True
+
     def _handle_action(self):
         if self.on_action:
             self.on_action(self.item, self.locked)
@@ -64,6 +111,9 @@ class InventoryPage(QWidget):
         super().__init__()
         self.owned_items: List[Dict] = []
         self.shop_items: List[Dict] = []
+        # Cards keyed by item id so re-renders only touch what changed.
+        self.owned_cards: Dict[str, ItemCard] = {}
+        self.shop_cards: Dict[str, ItemCard] = {}
         self._build()
 
     def _build(self) -> None:
@@ -106,23 +156,32 @@ class InventoryPage(QWidget):
         self.render()
 
     def render(self) -> None:
-        # Owned
-        for i in reversed(range(self.owned_grid.count())):
-            item = self.owned_grid.itemAt(i).widget()
-            if item:
-                item.setParent(None)
-        for idx, item in enumerate(self.owned_items):
-            card = ItemCard(item, locked=False, equipped=item.get("equipped", False), on_action=self._on_own_action)
-            self.owned_grid.addWidget(card, idx // 3, idx % 3)
-
-        # Shop
-        for i in reversed(range(self.shop_grid.count())):
-            item = self.shop_grid.itemAt(i).widget()
-            if item:
-                item.setParent(None)
-        for idx, item in enumerate(self.shop_items):
-            card = ItemCard(item, locked=True, equipped=False, on_action=self._on_shop_action)
-            self.shop_grid.addWidget(card, idx // 3, idx % 3)
+        self._sync_grid(self.owned_grid, self.owned_cards, self.owned_items, locked=False, on_action=self._on_own_action)
+        self._sync_grid(self.shop_grid, self.shop_cards, self.shop_items, locked=True, on_action=self._on_shop_action)
+
+    def _sync_grid(self, grid: QGridLayout, cards: Dict[str, ItemCard], items: List[Dict], locked: bool, on_action) -> None:
+        """Reconcile a grid with ``items`` by id: reuse, patch, move or drop cards."""
+        keep = {item["id"] for item in items}
+        for key in [k for k in cards if k not in keep]:
+            card = cards.pop(key)
+            grid.removeWidget(card)
+            card.setParent(None)
+            card.deleteLater()
+
+        for idx, item in enumerate(items):
+            equipped = False if locked else item.get("equipped", False)
+            cell = (idx // 3, idx % 3)
+            card = cards.get(item["id"])
+            if card is None:
+                card = ItemCard(item, locked=locked, equipped=equipped, on_action=on_action)
+                cards[item["id"]] = card
+            else:
+                card.update_item(item, locked, equipped)
+                if card.cell == cell:
+                    continue
+                grid.removeWidget(card)
+            grid.addWidget(card, *cell)
+            card.cell = cell
 
     def _on_own_action(self, item: Dict, locked: bool) -> None:
         # Stub equip toggle: set this item equipped, others unequipped
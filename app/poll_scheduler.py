@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass
+class PollSchedulerConfig:
+    base_ms: int = 10_000
+    min_ms: int = 5_000
+    max_ms: int = 300_000
+    error_max_ms: int = 600_000
+    boost_ms: int = 5_000
+    boost_duration_s: float = 120
+    idle_after_s: float = 300
+    idle_multiplier: float = 4
+    hidden_multiplier: float = 6
+    quiet_after_s: float = 3600
+    quiet_multiplier: float = 3
+    jitter: float = 0.1  # +/- fraction applied to healthy intervals so clients don't align
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Return the Retry-After delay in seconds (delta-seconds or HTTP-date form)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max((when - now).total_seconds(), 0.0)
+
+
+class AdaptivePollScheduler:
+    """Decide how long to wait before the next notice poll.
+
+    Healthy polls run at ``base_ms``, stretched while the user is idle, the cat
+    is hidden, or nothing has arrived for ``quiet_after_s``, and shortened to
+    ``boost_ms`` for a while after a new notice. Errors back off exponentially
+    with jitter up to ``error_max_ms`` and never poll before ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        config: Optional[PollSchedulerConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.config = config or PollSchedulerConfig()
+        self._clock = clock
+        self._rng = rng
+        self.consecutive_errors = 0
+        self.retry_after_s: Optional[float] = None
+        self.last_status: Optional[int] = None
+        self.idle = False
+        self.hidden = False
+        self._last_new_at: Optional[float] = None
+        self._started_at = clock()
+        self.last_delay_ms: Optional[int] = None
+        self.reason = "base"
+
+    def record_success(self, has_new: bool) -> None:
+        self.consecutive_errors = 0
+        self.retry_after_s = None
+        self.last_status = 200
+        if has_new:
+            self._last_new_at = self._clock()
+
+    def record_error(self, status_code: Optional[int] = None, retry_after: Optional[str] = None) -> None:
+        self.consecutive_errors += 1
+        self.last_status = status_code
+        self.retry_after_s = parse_retry_after(retry_after)
+
+    def set_idle(self, idle: bool) -> None:
+        self.idle = idle
+
+    def set_hidden(self, hidden: bool) -> None:
+        self.hidden = hidden
+
+    def next_delay_ms(self) -> int:
+        cfg = self.config
+        if self.consecutive_errors:
+            ceiling = min(cfg.error_max_ms, cfg.base_ms * 2 ** self.consecutive_errors)
+            delay = ceiling / 2 + self._rng() * ceiling / 2
+            self.reason = f"error x{self.consecutive_errors}"
+            if self.retry_after_s is not None and self.retry_after_s * 1000 > delay:
+                delay = self.retry_after_s * 1000
+                self.reason = "retry-after"
+            self.last_delay_ms = int(delay)
+            return self.last_delay_ms
+
+        now = self._clock()
+        delay = float(cfg.base_ms)
+        self.reason = "base"
+        if self._last_new_at is not None and now - self._last_new_at < cfg.boost_duration_s:
+            delay = cfg.boost_ms
+            self.reason = "boost"
+        else:
+            multiplier = 1.0
+            if self.hidden:
+                multiplier, self.reason = max(multiplier, cfg.hidden_multiplier), "hidden"
+            if self.idle and cfg.idle_multiplier > multiplier:
+                multiplier, self.reason = cfg.idle_multiplier, "idle"
+            quiet_since = self._last_new_at if self._last_new_at is not None else self._started_at
+            if now - quiet_since >= cfg.quiet_after_s:
+                multiplier *= cfg.quiet_multiplier
+                self.reason += "+quiet"
+            delay *= multiplier
+        delay *= 1 + cfg.jitter * (2 * self._rng() - 1)
+        self.last_delay_ms = int(min(max(delay, cfg.min_ms), cfg.max_ms))
+        return self.last_delay_ms
+
+    def state(self) -> Dict[str, Any]:
+        return {
+            "reason": self.reason,
+            "last_delay_ms": self.last_delay_ms,
+            "consecutive_errors": self.consecutive_errors,
+            "last_status": self.last_status,
+            "retry_after_s": self.retry_after_s,
+            "idle": self.idle,
+            "hidden": self.hidden,
+            "seconds_since_new": None if self._last_new_at is None else self._clock() - self._last_new_at,
+        }
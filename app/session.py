@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import requests
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from app.api_client import ApiClient, ResponseCache, get_polling_session, get_shared_session
+from app.async_api_client import AsyncApiClient, async_available
+from app.settings import get_api_base_url
+from app.token_store import clear_token, load_token, save_token
+
+
+class ApiSession(QObject):
+    """App-wide API context shared by the dashboard, pages and pollers.
+
+    Owns the base URL (read once), the access token, the pooled sync/async
+    clients and their response cache. Components use ``client`` /
+    ``async_client`` (pollers ``poll_client``, which leaves 5xx to their
+    scheduler) and subscribe to ``token_changed``; login, logout and a
+    rejected token are handled here once.
+    """
+
+    token_changed = pyqtSignal(object)  # Optional[str]
+    expired = pyqtSignal()  # the server rejected the current token
+    _unauthorized = pyqtSignal(object)  # rejected token; emitted from worker threads, handled on the UI thread
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        http_session: Optional[requests.Session] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.base_url = (base_url or get_api_base_url()).rstrip("/")
+        self.token: Optional[str] = None
+        self.cache = ResponseCache()
+        self.client = ApiClient(
+            session=http_session or get_shared_session(),
+            base_url=self.base_url,
+            on_unauthorized=self._unauthorized.emit,
+            cache=self.cache,
+        )
+        self.poll_client = ApiClient(
+            session=get_polling_session(),
+            base_url=self.base_url,
+            on_unauthorized=self._unauthorized.emit,
+        )
+        self.async_client: Optional[AsyncApiClient] = (
+            AsyncApiClient(base_url=self.base_url, on_unauthorized=self._unauthorized.emit) if async_available() else None
+        )
+        self._unauthorized.connect(self._on_unauthorized)
+
+    def restore(self) -> Optional[str]:
+        """Adopt the token saved by a previous run, if any."""
+        token = load_token()
+        if token:
+            self._apply(token)
+        return token
+
+    def login(self, token: str) -> None:
+        save_token(token)
+        self._apply(token)
+
+    def logout(self) -> None:
+        clear_token()
+        self._apply(None)
+
+    def _apply(self, token: Optional[str]) -> None:
+        if token == self.token:
+            return
+        self.token = token
+        self.client.set_token(token)
+        self.poll_client.set_token(token)
+        if self.async_client:
+            self.async_client.set_token(token)
+        self.cache.clear()
+        self.token_changed.emit(token)
+
+    def _on_unauthorized(self, token: Optional[str]) -> None:
+        # Several in-flight requests may fail with the same token; only the first one counts.
+        if token is None or token != self.token:
+            return
+        self.logout()
+        self.expired.emit()
+
+
+_session: Optional[ApiSession] = None
+
+
+def get_api_session() -> ApiSession:
+    global _session
+    if _session is None:
+        _session = ApiSession()
+    return _session
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 import os
 from pathlib import Path
 from typing import Optional
 
+from app.state_store import get_state_store
 from app.storage_paths import get_settings_dir
 
 
@@ -20,18 +20,35 @@ def get_api_base_url() -> str:
     env_val = os.getenv("MEOWBUDDY_API_BASE")
     if env_val:
         return env_val
-    path = _config_path()
-    if path.exists():
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            url = data.get("api_base_url")
-            if url:
-                return url
-        except Exception:
-            pass
-    return DEFAULT_API_BASE
+    return get_state_store().get(_config_path(), "api_base_url") or DEFAULT_API_BASE
 
 
 def save_api_base_url(url: str) -> None:
-    path = _config_path()
-    path.write_text(json.dumps({"api_base_url": url}), encoding="utf-8")
+    get_state_store().set(_config_path(), "api_base_url", url)
+
+
+DASHBOARD_CONFIG_FILE = "dashboard.json"
+WEB_VIEW_MODES = ("lazy", "prewarm", "eager")
+DEFAULT_WEB_VIEW_MODE = "lazy"
+DEFAULT_WEB_VIEW_TEARDOWN_S = 300.0
+
+
+def _dashboard_config_path() -> Path:
+    return get_settings_dir() / DASHBOARD_CONFIG_FILE
+
+
+def get_web_view_mode() -> str:
+    """When the dashboard creates its QWebEngineView: on open, pre-warmed while idle, or at startup."""
+    value = os.getenv("MEOWBUDDY_WEBVIEW_MODE") or get_state_store().get(_dashboard_config_path(), "web_view_mode")
+    return value if value in WEB_VIEW_MODES else DEFAULT_WEB_VIEW_MODE
+
+
+def get_web_view_teardown_s() -> float:
+    """Seconds the dashboard stays closed before its renderer is torn down; 0 keeps it."""
+    value = os.getenv("MEOWBUDDY_WEBVIEW_TEARDOWN_S")
+    if value is None:
+        value = get_state_store().get(_dashboard_config_path(), "web_view_teardown_s")
+    try:
+        return max(float(value), 0.0) if value is not None else DEFAULT_WEB_VIEW_TEARDOWN_S
+    except (TypeError, ValueError):
+        return DEFAULT_WEB_VIEW_TEARDOWN_S
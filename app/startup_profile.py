@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from app.storage_paths import get_logs_dir
+
+
+PROFILE_FLAG = "--profile-startup"
+REPORT_FILE = "startup_profile.jsonl"
+
+
+class StartupProfiler:
+    """Wall-clock marks for startup phases; every call is a no-op unless enabled.
+
+    ``mark(name)`` closes the phase that started at the previous mark (or at
+    ``origin``). ``finish`` prints a table and appends one JSON line to
+    ``logs/startup_profile.jsonl``.
+    """
+
+    def __init__(self, enabled: bool, origin: Optional[float] = None) -> None:
+        self.enabled = enabled
+        self.origin = time.perf_counter() if origin is None else origin
+        self._last = self.origin
+        self.phases: List[Tuple[str, float]] = []  # name, duration in seconds
+        self.finished = False
+
+    def mark(self, name: str) -> None:
+        if not self.enabled or self.finished:
+            return
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    def total(self) -> float:
+        return self._last - self.origin
+
+    def report(self) -> str:
+        lines = ["Startup profile"]
+        elapsed = 0.0
+        for name, seconds in self.phases:
+            elapsed += seconds
+            lines.append(f"  {name:<16} {seconds * 1000:8.1f} ms  (t={elapsed * 1000:8.1f} ms)")
+        return "\n".join(lines)
+
+    def finish(self, log_dir: Optional[Path] = None) -> Optional[Path]:
+        if not self.enabled or self.finished:
+            return None
+        self.finished = True
+        print(self.report())
+        record = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "total_ms": round(self.total() * 1000, 2),
+            "phases": {name: round(seconds * 1000, 2) for name, seconds in self.phases},
+        }
+        path = (log_dir or get_logs_dir()) / REPORT_FILE
+        try:
+            with path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as exc:
+            print(f"Failed to write startup profile: {exc}")
+            return None
+        return path
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+DEFAULT_DEBOUNCE_S = 0.5
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write via a temp file + fsync + os.replace so readers never see a torn file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class StateStore:
+    """Small JSON state files served from memory.
+
+    Each file is parsed once on first access. Writes update memory immediately
+    and are persisted by a background thread after ``debounce_s`` of quiet,
+    using an atomic replace. ``flush`` writes anything pending synchronously,
+    waits for a batch the background thread is still writing, and is called on
+    quit; when it returns every version written so far is on disk.
+    """
+
+    def __init__(self, debounce_s: float = DEFAULT_DEBOUNCE_S) -> None:
+        self.debounce_s = debounce_s
+        self._docs: Dict[Path, Optional[Dict[str, Any]]] = {}  # None = delete the file
+        self._deadlines: Dict[Path, float] = {}
+        self._versions: Dict[Path, int] = {}
+        self._written: Dict[Path, int] = {}
+        self._in_flight = 0  # batches taken by the background thread but not yet persisted
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---- Reads ----
+    def get(self, path: Path, key: str, default: Any = None) -> Any:
+        with self._cond:
+            doc = self._load(path)
+            return default if doc is None else doc.get(key, default)
+
+    def _load(self, path: Path) -> Optional[Dict[str, Any]]:
+        if path in self._docs:
+            return self._docs[path]
+        doc: Dict[str, Any] = {}
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if isinstance(data, dict):
+                    doc = data
+            except Exception:
+                pass
+        self._docs[path] = doc
+        return doc
+
+    # ---- Writes ----
+    def set(self, path: Path, key: str, value: Any) -> None:
+        self.update(path, {key: value})
+
+    def update(self, path: Path, values: Dict[str, Any]) -> None:
+        with self._cond:
+            doc = self._load(path)
+            doc = dict(doc or {})
+            doc.update(values)
+            self._docs[path] = doc
+            self._schedule(path)
+
+    def delete(self, path: Path) -> None:
+        with self._cond:
+            self._docs[path] = None
+            self._schedule(path)
+
+    def _schedule(self, path: Path) -> None:
+        self._versions[path] = self._versions.get(path, 0) + 1
+        self._deadlines[path] = time.monotonic() + self.debounce_s
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="meowbuddy-state", daemon=True)
+            self._thread.start()
+        # flush() may be waiting on the same condition; make sure the writer thread wakes.
+        self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._deadlines:
+                    self._cond.wait()
+                now = time.monotonic()
+                due = [p for p, deadline in self._deadlines.items() if deadline <= now]
+                if not due:
+                    self._cond.wait(min(self._deadlines.values()) - now)
+                    continue
+                batch = [self._snapshot(p) for p in due]
+                for p in due:
+                    del self._deadlines[p]
+                self._in_flight += 1
+            try:
+                for path, version, payload in batch:
+                    self._persist(path, version, payload)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def flush(self) -> None:
+        with self._cond:
+            batch = [self._snapshot(p) for p in self._deadlines]
+            self._deadlines.clear()
+        for path, version, payload in batch:
+            self._persist(path, version, payload)
+        with self._cond:
+            while self._in_flight:
+                self._cond.wait()
+
+    def _snapshot(self, path: Path) -> Tuple[Path, int, Optional[str]]:
+        doc = self._docs.get(path)
+        return path, self._versions.get(path, 0), None if doc is None else json.dumps(doc)
+
+    def _persist(self, path: Path, version: int, payload: Optional[str]) -> None:
+        with self._io_lock:
+            # A flush on another thread may already have written a newer snapshot.
+            if version <= self._written.get(path, 0):
+                return
+            self._written[path] = version
+            try:
+                if payload is None:
+                    path.unlink(missing_ok=True)
+                else:
+                    atomic_write_text(path, payload)
+            except OSError as exc:
+                print(f"Failed to persist {path}: {exc}")
+
+
+_store: Optional[StateStore] = None
+
+
+def get_state_store() -> StateStore:
+    global _store
+    if _store is None:
+        _store = StateStore()
+        atexit.register(_store.flush)
+    return _store
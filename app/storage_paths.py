@@ -1,51 +1,135 @@
 from __future__ import annotations
 
 import os
+import sys
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 
 APP_NAME = "MeowBuddy"
+PORTABLE_ENV = "MEOWBUDDY_HOME"
+
+
+@dataclass(frozen=True)
+class AppLayout:
+    """Resolved app data directories; created once by ``ensure``."""
+
+    root: Path
+    tokens: Path
+    settings: Path
+    assets_cache: Path
+    logs: Path
+
+    @classmethod
+    def from_root(cls, root: Path) -> "AppLayout":
+        """Everything under one directory (Windows APPDATA, portable installs, tests)."""
+        root = Path(root)
+        return cls(
+            root=root,
+            tokens=root / "tokens",
+            settings=root / "settings",
+            assets_cache=root / "assets_cache",
+            logs=root / "logs",
+        )
+
+    @classmethod
+    def xdg(cls) -> "AppLayout":
+        """Split across the XDG base directories on Linux."""
+        home = Path.home()
+
+        def base(env: str, fallback: Path) -> Path:
+            value = os.getenv(env)
+            return Path(value) if value else fallback
+
+        data = base("XDG_DATA_HOME", home / ".local" / "share") / APP_NAME
+        state = base("XDG_STATE_HOME", home / ".local" / "state") / APP_NAME
+        return cls(
+            root=data,
+            tokens=data / "tokens",
+            settings=base("XDG_CONFIG_HOME", home / ".config") / APP_NAME,
+            assets_cache=base("XDG_CACHE_HOME", home / ".cache") / APP_NAME / "assets",
+            logs=state / "logs",
+        )
+
+    def as_dict(self) -> Dict[str, Path]:
+        return {
+            "root": self.root,
+            "tokens": self.tokens,
+            "settings": self.settings,
+            "assets_cache": self.assets_cache,
+            "logs": self.logs,
+        }
+
+    def ensure(self) -> "AppLayout":
+        for path in self.as_dict().values():
+            path.mkdir(parents=True, exist_ok=True)
+        return self
+
+
+def _legacy_root() -> Path:
+    return Path.home() / "AppData" / "Roaming" / APP_NAME
+
+
+def default_layout() -> AppLayout:
+    """Pick the layout for this process: portable override, APPDATA, XDG, then the legacy path."""
+    portable = os.getenv(PORTABLE_ENV)
+    if portable:
+        return AppLayout.from_root(Path(portable).expanduser())
+    appdata = os.getenv("APPDATA")
+    if appdata:
+        return AppLayout.from_root(Path(appdata) / APP_NAME)
+    # Keep using the old fallback directory where an install already created it.
+    if sys.platform.startswith("linux") and not _legacy_root().exists():
+        return AppLayout.xdg()
+    return AppLayout.from_root(_legacy_root())
+
+
+_layout: Optional[AppLayout] = None
+_layout_lock = threading.Lock()
+
+
+def get_layout() -> AppLayout:
+    """Process-wide layout; directories are created on first use only."""
+    global _layout
+    layout = _layout
+    if layout is None:
+        with _layout_lock:
+            if _layout is None:
+                _layout = default_layout().ensure()
+            layout = _layout
+    return layout
+
+
+def set_layout(layout: Optional[AppLayout]) -> None:
+    """Override the layout (tests, portable installs); ``None`` re-resolves on next use."""
+    global _layout
+    with _layout_lock:
+        _layout = layout.ensure() if layout is not None else None
 
 
 def get_app_root() -> Path:
-    """Resolve the root app data directory (Windows APPDATA preferred)."""
-    appdata = os.getenv("APPDATA")
-    base = Path(appdata) if appdata else Path.home() / "AppData" / "Roaming"
-    return base / APP_NAME
+    """Resolve the root app data directory."""
+    return get_layout().root
 
 
 def ensure_app_dirs() -> Dict[str, Path]:
     """Create the root and subdirectories; return their paths."""
-    root = get_app_root()
-    root.mkdir(parents=True, exist_ok=True)
-
-    subdirs = {
-        "tokens": root / "tokens",
-        "settings": root / "settings",
-        "assets_cache": root / "assets_cache",
-        "logs": root / "logs",
-    }
-    for path in subdirs.values():
-        path.mkdir(parents=True, exist_ok=True)
-    return {"root": root, **subdirs}
+    return get_layout().ensure().as_dict()
 
 
 def get_tokens_dir() -> Path:
-    dirs = ensure_app_dirs()
-    return dirs["tokens"]
+    return get_layout().tokens
 
 
 def get_settings_dir() -> Path:
-    dirs = ensure_app_dirs()
-    return dirs["settings"]
+    return get_layout().settings
 
 
 def get_assets_cache_dir() -> Path:
-    dirs = ensure_app_dirs()
-    return dirs["assets_cache"]
+    return get_layout().assets_cache
 
 
 def get_logs_dir() -> Path:
-    dirs = ensure_app_dirs()
-    return dirs["logs"]
+    return get_layout().logs
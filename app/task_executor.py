@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+DoneCallback = Callable[[Any, Optional[Exception]], None]  # result, error
+
+
+class TaskHandle:
+    """Caller-side view of a submitted task."""
+
+    def __init__(self, key: Optional[Hashable]) -> None:
+        self.key = key
+        self.callbacks: List[DoneCallback] = []
+        self.cancelled = False
+        self.done = False
+        self.submitted_at = time.perf_counter()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._runnable: Optional[QRunnable] = None
+
+    @property
+    def queued_ms(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return (self.started_at - self.submitted_at) * 1000
+
+    @property
+    def elapsed_ms(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return (self.finished_at - self.started_at) * 1000
+
+    def is_running(self) -> bool:
+        return not self.done and not self.cancelled
+
+
+class _Task(QRunnable):
+    def __init__(self, executor: "TaskExecutor", handle: TaskHandle, fn: Callable, args, kwargs) -> None:
+        super().__init__()
+        self.executor = executor
+        self.handle = handle
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self) -> None:
+        if self.handle.cancelled:
+            self.executor._completed.emit(self.handle, None, None)
+            return
+        self.handle.started_at = time.perf_counter()
+        try:
+            result, error = self.fn(*self.args, **self.kwargs), None
+        except Exception as exc:
+            result, error = None, exc
+        self.handle.finished_at = time.perf_counter()
+        # Emitted from the pool thread; the executor lives on the UI thread, so this is queued.
+        self.executor._completed.emit(self.handle, result, error)
+
+
+class TaskExecutor(QObject):
+    """App-wide bounded worker pool that reports results on the UI thread.
+
+    Tasks submitted with the same ``key`` while one is in flight share that
+    task instead of starting another. ``cancel(handle, on_done)`` unsubscribes
+    one caller; the task itself is only cancelled once nobody is waiting on
+    it. Cancelling drops the result; a task that is already running still
+    finishes in the background.
+    """
+
+    task_finished = pyqtSignal(object, float)  # key, elapsed_ms
+    _completed = pyqtSignal(object, object, object)  # handle, result, error
+
+    def __init__(self, max_threads: int = 4, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._inflight: Dict[Hashable, TaskHandle] = {}
+        self._active: Set[TaskHandle] = set()  # keeps queued runnables alive until they report back
+        self._completed.connect(self._on_completed)
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        key: Optional[Hashable] = None,
+        on_done: Optional[DoneCallback] = None,
+        **kwargs,
+    ) -> TaskHandle:
+        if key is not None:
+            existing = self._inflight.get(key)
+            if existing and existing.is_running():
+                if on_done:
+                    existing.callbacks.append(on_done)
+                return existing
+
+        handle = TaskHandle(key)
+        if on_done:
+            handle.callbacks.append(on_done)
+        task = _Task(self, handle, fn, args, kwargs)
+        task.setAutoDelete(False)
+        handle._runnable = task
+        self._active.add(handle)
+        if key is not None:
+            self._inflight[key] = handle
+        self.pool.start(task)
+        return handle
+
+    def cancel(self, handle: Optional[TaskHandle], on_done: Optional[DoneCallback] = None) -> None:
+        """Remove ``on_done`` from a shared task, cancelling it when no callbacks are left.
+
+        Without ``on_done`` the task is cancelled for every subscriber (shutdown).
+        """
+        if handle is None or handle.done:
+            return
+        if on_done is not None:
+            if on_done in handle.callbacks:
+                handle.callbacks.remove(on_done)
+            if handle.callbacks:
+                return
+        handle.cancelled = True
+        handle.callbacks.clear()
+        if handle._runnable is not None and self.pool.tryTake(handle._runnable):
+            handle._runnable = None
+            self._active.discard(handle)
+        if handle.key is not None and self._inflight.get(handle.key) is handle:
+            del self._inflight[handle.key]
+
+    def shutdown(self, timeout_ms: int = 3000) -> None:
+        for handle in list(self._inflight.values()):
+            self.cancel(handle)
+        self.pool.clear()
+        self.pool.waitForDone(timeout_ms)
+
+    def _on_completed(self, handle: TaskHandle, result, error) -> None:
+        handle.done = True
+        handle._runnable = None
+        self._active.discard(handle)
+        if handle.key is not None and self._inflight.get(handle.key) is handle:
+            del self._inflight[handle.key]
+        if handle.cancelled:
+            return
+        self.task_finished.emit(handle.key, handle.elapsed_ms or 0.0)
+        for callback in handle.callbacks:
+            callback(result, error)
+
+
+_executor: Optional[TaskExecutor] = None
+
+
+def get_executor() -> TaskExecutor:
+    global _executor
+    if _executor is None:
+        _executor = TaskExecutor()
+    return _executor
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+
+from app.storage_paths import get_assets_cache_dir
+from app.task_executor import get_executor
+
+
+DEFAULT_MEMORY_BUDGET = 32 * 1024 * 1024  # bytes of decoded pixmaps kept in memory
+THUMBS_DIR_NAME = "thumbs"
+
+ThumbKey = Tuple[str, int, int]  # source path, width, height
+ReadyCallback = Callable[[Optional[QPixmap]], None]
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PixmapLRU:
+    """QPixmaps bounded by their decoded size in bytes; UI thread only."""
+
+    def __init__(self, budget_bytes: int = DEFAULT_MEMORY_BUDGET) -> None:
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._items: "OrderedDict[ThumbKey, QPixmap]" = OrderedDict()
+
+    @staticmethod
+    def cost(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, key: ThumbKey) -> Optional[QPixmap]:
+        pixmap = self._items.get(key)
+        if pixmap is not None:
+            self._items.move_to_end(key)
+        return pixmap
+
+    def put(self, key: ThumbKey, pixmap: QPixmap) -> None:
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.used_bytes -= self.cost(old)
+        self._items[key] = pixmap
+        self.used_bytes += self.cost(pixmap)
+        while self.used_bytes > self.budget_bytes and len(self._items) > 1:
+            _, evicted = self._items.popitem(last=False)
+            self.used_bytes -= self.cost(evicted)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.used_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class ThumbnailService:
+    """Decodes downscaled thumbnails on the task executor.
+
+    Lookups go memory LRU -> disk cache (``assets_cache/thumbs``, keyed by the
+    source file's SHA-256 and the target size) -> decode with
+    ``QImageReader.setScaledSize`` so full-size pixels are never materialized.
+    Only QImage is touched off the UI thread; pixmaps are created on delivery.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else get_assets_cache_dir() / THUMBS_DIR_NAME
+        self.memory = PixmapLRU(memory_budget)
+        self._waiters: Dict[ThumbKey, List[ReadyCallback]] = {}
+        # (path, size, mtime_ns) -> sha256, so unchanged sources are hashed once per run.
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
+
+    def request(self, source, size: QSize, on_ready: ReadyCallback) -> ThumbKey:
+        """Deliver a pixmap fitting ``size`` to ``on_ready`` (None if it can't be read).
+
+        Memory hits call back immediately; otherwise on the UI thread once decoded.
+        """
+        key = (str(source), size.width(), size.height())
+        pixmap = self.memory.get(key)
+        if pixmap is not None:
+            on_ready(pixmap)
+            return key
+        waiters = self._waiters.setdefault(key, [])
+        waiters.append(on_ready)
+        if len(waiters) == 1:
+            get_executor().submit(
+                self._load, key, key=("thumbnail", key), on_done=lambda image, error: self._on_loaded(key, image, error)
+            )
+        return key
+
+    def discard(self, key: ThumbKey, on_ready: ReadyCallback) -> None:
+        """Stop delivering ``key`` to ``on_ready`` (e.g. the card was recycled)."""
+        waiters = self._waiters.get(key)
+        if waiters and on_ready in waiters:
+            waiters.remove(on_ready)
+
+    def _on_loaded(self, key: ThumbKey, image: Optional[QImage], error: Optional[Exception]) -> None:
+        waiters = self._waiters.pop(key, [])
+        pixmap = None
+        if error:
+            print(f"Thumbnail failed for {key[0]}: {error}")
+        elif image is not None and not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            self.memory.put(key, pixmap)
+        for callback in waiters:
+            callback(pixmap)
+
+    # ---- Worker thread ----
+    def _source_hash(self, path: Path) -> str:
+        stat = path.stat()
+        ident = (str(path), stat.st_size, stat.st_mtime_ns)
+        digest = self._hashes.get(ident)
+        if digest is None:
+            digest = _file_sha256(path)
+            self._hashes[ident] = digest
+        return digest
+
+    def thumb_path(self, source: Path, width: int, height: int) -> Path:
+        return self.cache_dir / f"{self._source_hash(source)}_{width}x{height}.png"
+
+    def _load(self, key: ThumbKey) -> Optional[QImage]:
+        source, width, height = Path(key[0]), key[1], key[2]
+        if not source.exists():
+            return None
+        cached = self.thumb_path(source, width, height)
+        if cached.exists():
+            image = QImageReader(str(cached)).read()
+            if not image.isNull():
+                return image
+
+        reader = QImageReader(str(source))
+        reader.setAutoTransform(True)
+        full = reader.size()
+        if full.isValid():
+            target = full.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio)
+            if target.width() < full.width():
+                reader.setScaledSize(target)
+        image = reader.read()
+        if image.isNull():
+            raise ValueError(reader.errorString())
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        if image.save(str(tmp), "PNG"):
+            os.replace(tmp, cached)
+        return image
+
+
+_service: Optional[ThumbnailService] = None
+
+
+def get_thumbnail_service() -> ThumbnailService:
+    global _service
+    if _service is None:
+        _service = ThumbnailService()
+    return _service
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Optional
 
+from app.state_store import get_state_store
 from app.storage_paths import get_tokens_dir
 
 
@@ -15,22 +15,12 @@ def _token_path() -> Path:
 
 
 def save_token(token: str) -> None:
-    path = _token_path()
-    path.write_text(json.dumps({"access_token": token}), encoding="utf-8")
+    get_state_store().set(_token_path(), "access_token", token)
 
 
 def load_token() -> Optional[str]:
-    path = _token_path()
-    if not path.exists():
-        return None
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return data.get("access_token")
-    except Exception:
-        return None
+    return get_state_store().get(_token_path(), "access_token")
 
 
 def clear_token() -> None:
-    path = _token_path()
-    if path.exists():
-        path.unlink()
+    get_state_store().delete(_token_path())
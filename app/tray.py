@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from PyQt6.QtCore import QObject
 from PyQt6.QtGui import QAction, QGuiApplication, QIcon
 from PyQt6.QtWidgets import QMenu, QMessageBox, QStyle, QSystemTrayIcon
 
-from desktopcat.core.context_manager import ContextManager
-from desktopcat.ui.widget import CatWidget
-from app.dashboard import DashboardWindow
+if TYPE_CHECKING:
+    from app.dashboard import DashboardWindow
+    from desktopcat.core.context_manager import ContextManager
+    from desktopcat.ui.widget import CatWidget
 
 
 class TrayManager(QObject):
@@ -37,6 +38,11 @@ class TrayManager(QObject):
         self.action_toggle_cat.triggered.connect(self._toggle_cat_visibility)
         self.menu.addAction(self.action_toggle_cat)
 
+        self.action_frame_stats = QAction("Show Frame Stats", self)
+        self.action_frame_stats.setCheckable(True)
+        self.action_frame_stats.toggled.connect(self.cat_widget.set_hud_visible)
+        self.menu.addAction(self.action_frame_stats)
+
         self.action_check_updates = QAction("Check Updates", self)
         self.action_check_updates.triggered.connect(self._check_updates)
         self.menu.addAction(self.action_check_updates)
@@ -1,20 +0,0 @@
-from __future__ import annotations
-
-from PyQt6.QtCore import QObject, pyqtSignal
-
-
-class Worker(QObject):
-    finished = pyqtSignal(object, object)  # result, error
-
-    def __init__(self, fn, *args, **kwargs):
-        super().__init__()
-        self.fn = fn
-        self.args = args
-        self.kwargs = kwargs
-
-    def run(self):
-        try:
-            result = self.fn(*self.args, **self.kwargs)
-            self.finished.emit(result, None)
-        except Exception as exc:
-            self.finished.emit(None, exc)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+SUPPORTED_MEDIA_TYPES = {
+    ".png": "image",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".bmp": "image",
+    ".gif": "gif",
+    ".mp4": "video",
+    ".mov": "video",
+}
+
+
+@dataclass
+class FolderIndex:
+    mtime_ns: int
+    files: List[Path] = field(default_factory=list)  # supported media, sorted by path
+    names: Dict[str, Path] = field(default_factory=dict)  # every regular file by name
+
+
+class AssetCatalog:
+    """In-memory index of the asset folders under ``assets_base``.
+
+    ``files``/``find`` answer from memory. Top-level folders are indexed up
+    front; a nested folder (``"cats/idle"``) is indexed the first time it is
+    asked for and refreshed like the others after that. ``refresh`` re-lists
+    only folders whose mtime changed; with ``watch`` (needs a running QCoreApplication) a
+    QFileSystemWatcher calls it when a folder changes. ``version`` increases on
+    every change so callers can drop anything derived from the old index.
+    """
+
+    def __init__(self, assets_base: Path, watch: bool = False) -> None:
+        self.assets_base = Path(assets_base)
+        self.version = 0
+        self._base_mtime_ns: Optional[int] = None
+        self._folders: Dict[str, FolderIndex] = {}
+        self._listeners: List[Callable[[], None]] = []
+        self._watcher = None
+        self.refresh()
+        if watch:
+            self._start_watcher()
+
+    # ---- Lookups (no syscalls once a folder is indexed) ----
+    def has_folder(self, folder: str) -> bool:
+        return self._index(folder) is not None
+
+    def files(self, folder: str) -> List[Path]:
+        index = self._index(folder)
+        return index.files if index else []
+
+    def find(self, folder: str, name: str) -> Optional[Path]:
+        index = self._index(folder)
+        return index.names.get(name) if index else None
+
+    def _index(self, folder: str) -> Optional[FolderIndex]:
+        key = folder.replace("\\", "/").strip("/")
+        index = self._folders.get(key)
+        if index is None and "/" in key and (self.assets_base / key).is_dir():
+            self._scan_folder(key)
+            index = self._folders.get(key)
+        return index
+
+    def on_change(self, callback: Callable[[], None]) -> None:
+        self._listeners.append(callback)
+
+    # ---- Refresh ----
+    def refresh(self) -> bool:
+        """Rescan by mtime; returns True if anything changed."""
+        changed = False
+        mtime = self._mtime_ns(self.assets_base)
+        if mtime is None:
+            changed = bool(self._folders)
+            self._folders.clear()
+        else:
+            if mtime != self._base_mtime_ns:
+                # Folders were added, removed or renamed.
+                names = {entry.name for entry in os.scandir(self.assets_base) if entry.is_dir()}
+                top_level = {name for name in self._folders if "/" not in name}
+                for gone in top_level - names:
+                    del self._folders[gone]
+                    changed = True
+                for name in names - set(self._folders):
+                    changed |= self._scan_folder(name)
+            for name in list(self._folders):
+                changed |= self._scan_folder(name)
+        self._base_mtime_ns = mtime
+        if changed:
+            self._changed()
+        return changed
+
+    def _scan_folder(self, name: str) -> bool:
+        path = self.assets_base / name
+        mtime = self._mtime_ns(path)
+        if mtime is None:
+            return self._folders.pop(name, None) is not None
+        current = self._folders.get(name)
+        if current is not None and current.mtime_ns == mtime:
+            return False
+        names: Dict[str, Path] = {}
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    names[entry.name] = Path(entry.path)
+        files = sorted(p for p in names.values() if p.suffix.lower() in SUPPORTED_MEDIA_TYPES)
+        self._folders[name] = FolderIndex(mtime_ns=mtime, files=files, names=names)
+        if self._watcher is not None:
+            self._watch(path)
+        return True
+
+    @staticmethod
+    def _mtime_ns(path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _changed(self) -> None:
+        self.version += 1
+        for callback in self._listeners:
+            callback()
+
+    # ---- Watching ----
+    def _start_watcher(self) -> None:
+        from PyQt6.QtCore import QFileSystemWatcher
+
+        self._watcher = QFileSystemWatcher()
+        self._watcher.directoryChanged.connect(lambda _path: self.refresh())
+        self._watch(self.assets_base)
+        for name in self._folders:
+            self._watch(self.assets_base / name)
+
+    def _watch(self, path: Path) -> None:
+        if self._watcher is not None and path.exists() and str(path) not in self._watcher.directories():
+            self._watcher.addPath(str(path))
@@ -2,34 +2,41 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
+from .asset_catalog import SUPPORTED_MEDIA_TYPES, AssetCatalog
+from .asset_manifest import AssetManifest, AssetMeta
 from .config_loader import ConfigLoader
 
 
-SUPPORTED_MEDIA_TYPES = {
-    ".png": "image",
-    ".jpg": "image",
-    ".jpeg": "image",
-    ".bmp": "image",
-    ".gif": "gif",
-    ".mp4": "video",
-    ".mov": "video",
-}
-
-
 @dataclass
 class AssetDescriptor:
     path: Path
     media_type: str  # image | gif | video
     category: str
+    meta: Optional[AssetMeta] = None  # from assets/manifest.json when it is current for this file
 
 
 class AssetManager:
-    """Resolve asset paths based on configuration and optional user overrides."""
-
-    def __init__(self, config_loader: Optional[ConfigLoader] = None) -> None:
+    """Resolve asset paths based on configuration and optional user overrides.
+
+    Category lookups are answered from an AssetCatalog and memoized until the
+    catalog reports a change, so a context switch does no filesystem work.
+    """
+
+    def __init__(
+        self,
+        config_loader: Optional[ConfigLoader] = None,
+        catalog: Optional[AssetCatalog] = None,
+        watch: bool = False,
+        manifest_verified_path: Optional[Path] = None,
+    ) -> None:
         self.config_loader = config_loader or ConfigLoader()
+        self.catalog = catalog or AssetCatalog(self.config_loader.get_assets_base(), watch=watch)
+        # The app keeps what it verified of the manifest in its cache dir; the shipped manifest is never rewritten.
+        self.manifest = AssetManifest.load(self.config_loader.get_manifest_path(), verified_path=manifest_verified_path)
+        self._resolved: Dict[str, AssetDescriptor] = {}
+        self._resolved_version = self.catalog.version
 
     def resolve_asset(self, category: Optional[str] = None, override_path: Optional[str | Path] = None) -> AssetDescriptor:
         if override_path:
@@ -37,14 +44,26 @@ class AssetManager:
             if not path.exists():
                 raise FileNotFoundError(f"Override asset path not found: {path}")
             media_type = self._detect_media_type(path)
-            return AssetDescriptor(path=path, media_type=media_type, category=category or "override")
+            return AssetDescriptor(
+                path=path, media_type=media_type, category=category or "override", meta=self.manifest.get(path)
+            )
 
         category_name = category or self.config_loader.get_default_category()
         if not category_name:
             raise ValueError("No category provided and no default category configured.")
 
+        if self._resolved_version != self.catalog.version:
+            self._resolved.clear()
+            self._resolved_version = self.catalog.version
+            self.manifest.validate()
+        cached = self._resolved.get(category_name)
+        if cached is not None:
+            return cached
+
         entry = self.config_loader.get_category_entry(category_name)
-        return self._resolve_from_entry(category_name, entry)
+        asset = self._resolve_from_entry(category_name, entry)
+        self._resolved[category_name] = asset
+        return asset
 
     def _resolve_from_entry(self, category: str, entry: dict) -> AssetDescriptor:
         assets_base = self.config_loader.get_assets_base()
@@ -53,22 +72,30 @@ class AssetManager:
             raise ValueError(f"Category '{category}' is missing a 'folder' entry in config.")
 
         folder_path = assets_base / folder_name
-        if not folder_path.exists():
+        if not self.catalog.has_folder(folder_name):
             raise FileNotFoundError(f"Folder for category '{category}' not found at {folder_path}")
 
         preferred = entry.get("preferred_file") or entry.get("file") or ""
         if preferred:
-            candidate = folder_path / preferred
-            if not candidate.exists():
-                raise FileNotFoundError(f"Preferred file for category '{category}' not found: {candidate}")
-            return AssetDescriptor(path=candidate, media_type=self._detect_media_type(candidate), category=category)
-
-        files = sorted([p for p in folder_path.iterdir() if p.is_file() and p.suffix.lower() in SUPPORTED_MEDIA_TYPES])
+            candidate = self.catalog.find(folder_name, preferred)
+            if candidate is None and Path(preferred).name != preferred:
+                # Nested paths are outside the folder index; check them directly.
+                nested = folder_path / preferred
+                candidate = nested if nested.is_file() else None
+            if candidate is None:
+                raise FileNotFoundError(f"Preferred file for category '{category}' not found: {folder_path / preferred}")
+            return self._descriptor(candidate, category)
+
+        files = self.catalog.files(folder_name)
         if not files:
             raise FileNotFoundError(f"No supported media found in {folder_path}")
 
-        selected = files[0]
-        return AssetDescriptor(path=selected, media_type=self._detect_media_type(selected), category=category)
+        return self._descriptor(files[0], category)
+
+    def _descriptor(self, path: Path, category: str) -> AssetDescriptor:
+        return AssetDescriptor(
+            path=path, media_type=self._detect_media_type(path), category=category, meta=self.manifest.get(path)
+        )
 
     @staticmethod
     def _detect_media_type(path: Path) -> str:
@@ -0,0 +1,269 @@
+"""
+Precomputed metadata for the cat assets.
+
+``assets/manifest.json`` records, per file: size, SHA-256, media type,
+dimensions, frame count, per-frame delays and whether any frame has alpha, so
+the widget can size itself and budget memory before opening the file.
+
+mtimes are machine-local, so they are not shipped: the app passes a
+``verified_path`` in its cache directory that remembers which (size, mtime)
+of each file already hashed to the manifest's value.
+
+Usage:
+    python -m desktopcat.core.asset_manifest            # (re)generate, re-probing changed files only
+    python -m desktopcat.core.asset_manifest --check    # exit 1 if the manifest is stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .asset_catalog import SUPPORTED_MEDIA_TYPES
+
+MANIFEST_VERSION = 2  # 2: no mtime_ns in the shipped manifest
+VERIFIED_VERSION = 1
+BYTES_PER_PIXEL = 4  # ARGB32
+
+
+@dataclass
+class AssetMeta:
+    path: str  # relative to the manifest's directory, POSIX separators
+    size: int
+    sha256: str
+    media_type: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    frame_count: Optional[int] = None  # None for video
+    delays_ms: List[int] = field(default_factory=list)
+    has_alpha: Optional[bool] = None
+
+    @property
+    def duration_ms(self) -> int:
+        return sum(self.delays_ms)
+
+    def decoded_bytes(self, width: Optional[int] = None, height: Optional[int] = None) -> Optional[int]:
+        """Bytes to keep every frame decoded at ``width`` x ``height`` (default: source size)."""
+        w, h = width or self.width, height or self.height
+        if not w or not h or not self.frame_count:
+            return None
+        return w * h * BYTES_PER_PIXEL * self.frame_count
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def probe(path: Path, root: Path) -> AssetMeta:
+    """Read metadata for one file by decoding it once."""
+    stat = path.stat()
+    media_type = SUPPORTED_MEDIA_TYPES[path.suffix.lower()]
+    meta = AssetMeta(
+        path=path.relative_to(root).as_posix(),
+        size=stat.st_size,
+        sha256=_sha256(path),
+        media_type=media_type,
+    )
+    if media_type == "video":
+        return meta
+
+    from PyQt6.QtGui import QImageReader
+
+    reader = QImageReader(str(path))
+    size = reader.size()
+    if size.isValid():
+        meta.width, meta.height = size.width(), size.height()
+    delays: List[int] = []
+    has_alpha = False
+    while reader.canRead():
+        delay = reader.nextImageDelay() if media_type == "gif" else 0
+        image = reader.read()
+        if image.isNull():
+            break
+        has_alpha = has_alpha or image.hasAlphaChannel()
+        delays.append(max(delay, 0))
+        if media_type != "gif":
+            break
+    meta.frame_count = len(delays)
+    meta.delays_ms = delays if media_type == "gif" else []
+    meta.has_alpha = has_alpha
+    return meta
+
+
+class AssetManifest:
+    """Loaded manifest; ``get`` only returns entries that still match the file on disk.
+
+    The manifest itself is only written by ``save`` (the CLI). What was
+    verified on this machine goes to ``verified_path``, if given, and never
+    into the assets folder, which may be a read-only install.
+    """
+
+    def __init__(
+        self, path: Path, entries: Optional[Dict[str, AssetMeta]] = None, verified_path: Optional[Path] = None
+    ) -> None:
+        self.path = Path(path)
+        self.root = self.path.parent
+        self.entries: Dict[str, AssetMeta] = entries or {}
+        self.verified_path = Path(verified_path) if verified_path else None
+        # Absolute path -> (size, mtime_ns, sha256) seen on this machine.
+        self._verified: Dict[str, Tuple[int, int, str]] = {}
+        self._verified_dirty = False
+        self._load_verified()
+
+    @classmethod
+    def load(cls, path: Path, validate: bool = True, verified_path: Optional[Path] = None) -> "AssetManifest":
+        manifest = cls(path, verified_path=verified_path)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return manifest
+        if data.get("version") != MANIFEST_VERSION:
+            return manifest
+        for raw in data.get("files", []):
+            try:
+                meta = AssetMeta(**raw)
+            except TypeError:
+                continue
+            manifest.entries[meta.path] = meta
+        if validate:
+            manifest.validate()
+        return manifest
+
+    def _load_verified(self) -> None:
+        if self.verified_path is None:
+            return
+        try:
+            data = json.loads(self.verified_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != VERIFIED_VERSION:
+            return
+        for file, entry in data.get("files", {}).items():
+            if isinstance(entry, list) and len(entry) == 3:
+                self._verified[file] = (entry[0], entry[1], entry[2])
+
+    def _save_verified(self) -> None:
+        if self.verified_path is None or not self._verified_dirty:
+            return
+        data = {"version": VERIFIED_VERSION, "files": {k: list(v) for k, v in sorted(self._verified.items())}}
+        try:
+            self.verified_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.verified_path.with_name(self.verified_path.name + ".tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.verified_path)
+        except OSError as exc:
+            print(f"Failed to write {self.verified_path}: {exc}")
+            return
+        self._verified_dirty = False
+
+    def _key(self, path: Path) -> Optional[str]:
+        try:
+            return Path(path).resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return None
+
+    def get(self, path: Path) -> Optional[AssetMeta]:
+        key = self._key(path)
+        return self.entries.get(key) if key else None
+
+    def _is_current(self, meta: AssetMeta) -> bool:
+        file = self.root / meta.path
+        try:
+            stat = file.stat()
+        except OSError:
+            return False
+        if stat.st_size != meta.size:
+            return False
+        ident = str(file.resolve())
+        if self._verified.get(ident) == (stat.st_size, stat.st_mtime_ns, meta.sha256):
+            return True
+        # New on this machine, or touched since: same bytes means the metadata still holds.
+        if _sha256(file) != meta.sha256:
+            return False
+        self._verified[ident] = (stat.st_size, stat.st_mtime_ns, meta.sha256)
+        self._verified_dirty = True
+        return True
+
+    def validate(self) -> List[str]:
+        """Drop entries whose file changed or disappeared; return their paths.
+
+        Files are hashed only when their size and mtime were not verified
+        before; new verifications are kept in ``verified_path``.
+        """
+        stale = [key for key, meta in self.entries.items() if not self._is_current(meta)]
+        for key in stale:
+            del self.entries[key]
+        self._save_verified()
+        return stale
+
+    def update(self, assets_base: Path) -> Dict[str, List[str]]:
+        """Re-probe new or changed files under ``assets_base`` and forget deleted ones."""
+        report: Dict[str, List[str]] = {"probed": [], "kept": [], "removed": []}
+        seen = set()
+        for dirpath, _dirnames, filenames in os.walk(assets_base):
+            for name in sorted(filenames):
+                file = Path(dirpath) / name
+                if file.suffix.lower() not in SUPPORTED_MEDIA_TYPES:
+                    continue
+                key = file.relative_to(self.root).as_posix()
+                seen.add(key)
+                meta = self.entries.get(key)
+                if meta is not None and self._is_current(meta):
+                    report["kept"].append(key)
+                    continue
+                self.entries[key] = probe(file, self.root)
+                report["probed"].append(key)
+        for key in [k for k in self.entries if k not in seen]:
+            del self.entries[key]
+            report["removed"].append(key)
+        return report
+
+    def save(self) -> None:
+        # One file per line keeps diffs readable without spreading delay lists over hundreds of lines.
+        files = ",\n".join(f"    {json.dumps(asdict(self.entries[k]), ensure_ascii=False)}" for k in sorted(self.entries))
+        text = f'{{\n  "version": {MANIFEST_VERSION},\n  "files": [\n{files}\n  ]\n}}\n'
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def main() -> None:
+    from .config_loader import ConfigLoader
+
+    parser = argparse.ArgumentParser(description="Generate or check the asset metadata manifest.")
+    parser.add_argument("--config", type=Path, default=None, help="asset_mapping.json (default: config/)")
+    parser.add_argument("--check", action="store_true", help="only report; exit 1 if anything is stale")
+    args = parser.parse_args()
+
+    loader = ConfigLoader(args.config)
+    manifest = AssetManifest.load(loader.get_manifest_path(), validate=False)
+    before = {k: asdict(v) for k, v in manifest.entries.items()}
+    report = manifest.update(loader.get_assets_base())
+    for key in report["probed"]:
+        meta = manifest.entries[key]
+        print(f"probed  {key}: {meta.media_type} {meta.width}x{meta.height} frames={meta.frame_count}")
+    for key in report["removed"]:
+        print(f"removed {key}")
+    stale = bool(report["probed"] or report["removed"])
+    if args.check:
+        print("manifest is stale" if stale else "manifest is up to date")
+        sys.exit(1 if stale else 0)
+    if stale or before != {k: asdict(v) for k, v in manifest.entries.items()}:
+        manifest.save()
+        print(f"wrote {manifest.path} ({len(manifest.entries)} files)")
+    else:
+        print("manifest is up to date")
+
+
+if __name__ == "__main__":
+    main()
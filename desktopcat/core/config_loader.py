@@ -29,6 +29,33 @@ class ConfigLoader:
         assets_base = self._config.get("assets_base", "assets/cats")
         return self.project_root / assets_base
 
+    def get_manifest_path(self) -> Path:
+        return self.project_root / self._config.get("manifest", "assets/manifest.json")
+
+    def get_animation_pool_budget(self) -> int:
+        """Bytes of decoded GIF frames CatWidget may keep across categories."""
+        return int(self._config.get("animation_pool_mb", 128)) * 1024 * 1024
+
+    def get_frame_budget(self) -> int:
+        """Bytes one animation may keep decoded; larger ones are decoded frame by frame while playing."""
+        return int(self._config.get("frame_budget_mb", 48)) * 1024 * 1024
+
+    def get_render_mode(self) -> str:
+        """How CatWidget draws pooled GIFs: "atlas" (paints itself) or "label"."""
+        return self._config.get("render_mode", "atlas")
+
+    def get_crossfade_ms(self) -> int:
+        """Crossfade between animations on a context switch (atlas render mode); 0 = cut."""
+        return int(self._config.get("crossfade_ms", 0))
+
+    def get_playback_settings(self) -> Dict[str, Any]:
+        """Frame-rate policy for PlaybackGovernor (fps_cap, idle_fps, idle_after_s, fullscreen_fps)."""
+        return dict(self._config.get("playback", {}))
+
+    def get_frame_stats_settings(self) -> Dict[str, Any]:
+        """Frame timing: ``enabled`` collects from startup, ``log_interval_s`` paces the log line (0 = no log)."""
+        return dict(self._config.get("frame_stats", {}))
+
     def get_default_category(self) -> str:
         return self._config.get("default_category", "")
 
@@ -6,6 +6,7 @@ from PyQt6.QtCore import QObject, QTimer
 
 from desktopcat.core.asset_manager import AssetManager, AssetDescriptor
 from desktopcat.core.context_config import ContextRulesLoader
+from desktopcat.core.rule_matcher import RuleMatcher
 from desktopcat.core.window_info import get_foreground_window_info
 from desktopcat.ui.widget import CatWidget
 
@@ -27,6 +28,7 @@ class ContextManager(QObject):
         self.rules: List[Dict[str, Any]] = self.rules_loader.get_rules()
         self.default_category: str = self.rules_loader.get_default_category()
         self.poll_interval_ms: int = self.rules_loader.get_poll_interval_ms()
+        self.matcher = RuleMatcher(self.rules, self.default_category)
 
         self.current_category: Optional[str] = None
         self.timer = QTimer(self)
@@ -34,6 +36,18 @@ class ContextManager(QObject):
 
     def start(self) -> None:
         self.timer.start(self.poll_interval_ms)
+        self.widget.preload(self._rule_assets())
+
+    def _rule_assets(self) -> List[AssetDescriptor]:
+        """Assets of the categories the rules can switch to, default first."""
+        categories = [self.default_category] + [r.get("category") for r in self.rules]
+        assets: List[AssetDescriptor] = []
+        for category in dict.fromkeys(c for c in categories if c):
+            try:
+                assets.append(self.asset_manager.resolve_asset(category=category))
+            except Exception:  # noqa: BLE001 - a broken category is reported when it is switched to
+                continue
+        return assets
 
     def stop(self) -> None:
         self.timer.stop()
@@ -57,19 +71,4 @@ class ContextManager(QObject):
     def _match_category(self, info) -> str:
         if info is None:
             return self.default_category
-
-        proc = info.process_name.lower()
-        title = info.window_title.lower()
-
-        for rule in self.rules:
-            processes = [p.lower() for p in rule.get("process", [])]
-            title_subs = [t.lower() for t in rule.get("title_contains", [])]
-            if processes and proc not in processes:
-                continue
-            if title_subs:
-                if not any(sub in title for sub in title_subs):
-                    continue
-            category = rule.get("category") or self.default_category
-            return category
-
-        return self.default_category
+        return self.matcher.match(info.process_name, info.window_title)
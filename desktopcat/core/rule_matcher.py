@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import fnmatch
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+PROCESS_CACHE_SIZE = 256  # distinct foreground process names remembered with their candidate rules
+
+
+class AhoCorasick:
+    """Multi-pattern substring search: one pass over the text finds every pattern it contains."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        self.patterns: List[str] = []
+        for pattern in patterns:
+            self._add(pattern)
+        self._link()
+
+    def _add(self, pattern: str) -> None:
+        node = 0
+        for char in pattern:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        self._out[node] += (len(self.patterns),)
+        self.patterns.append(pattern)
+
+    def _link(self) -> None:
+        # Breadth-first, so every fail target is final before its dependants are linked.
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] += self._out[self._fail[child]]
+
+    def find(self, text: str) -> List[int]:
+        """Indices of the patterns found in ``text`` (a pattern may repeat)."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        found: List[int] = []
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                found.extend(out[node])
+        return found
+
+
+def _compile(kind: str, pattern: str, name: str) -> Optional[Pattern[str]]:
+    try:
+        if kind == "glob":
+            return re.compile(fnmatch.translate(pattern.lower()))
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as exc:
+        # A broken pattern never matches; the rest of the rule set keeps working.
+        print(f"Ignoring invalid {kind} {pattern!r} in context rule {name!r}: {exc}")
+        return None
+
+
+def _glob_literal(pattern: str) -> str:
+    """Longest run of plain characters in a glob; the title must contain it for the glob to match."""
+    plain = pattern.lower().split("[", 1)[0]  # bracket sets are not literal; stop at the first one
+    return max(re.split(r"[*?]", plain), key=len)
+
+
+@dataclass
+class _Rule:
+    category: str
+    processes: FrozenSet[str]
+    process_globs: List[Pattern[str]]
+    has_process: bool
+    has_title: bool
+    title_always: bool  # an empty title_contains entry matches any title
+    title_regexes: List[Pattern[str]] = field(default_factory=list)
+    title_globs: List[Pattern[str]] = field(default_factory=list)
+    gated: bool = False  # only tried when the automaton found one of its globs' literals
+
+    def title_matches(self, title: str) -> bool:
+        return any(r.search(title) for r in self.title_regexes) or any(g.match(title) for g in self.title_globs)
+
+
+class RuleMatcher:
+    """context_rules.json compiled once into indexes; ``match`` returns the first matching rule's category.
+
+    A rule's conditions, all case-insensitive:
+
+    - ``process``: exact process names; ``process_glob``: fnmatch patterns
+    - ``title_contains``: substrings; ``title_regex``: regular expressions
+      (searched); ``title_glob``: fnmatch patterns over the whole title
+
+    A rule matches when any of its process conditions and any of its title
+    conditions hold; a rule without process (or title) conditions matches
+    every process (or title). Rules keep their file order: the first match
+    wins, as before.
+
+    Candidate rules per process name come from a dict (plus glob rules,
+    resolved once per process name and cached), and every ``title_contains``
+    substring of every rule is found in one Aho-Corasick pass over the
+    title, so a lookup costs O(title length) however many rules there are.
+    Glob title rules are tried only when the same pass found their longest
+    literal; regex rules (and globs that are all wildcards) are tried in
+    order, and only while they could still beat the best match so far.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]], default_category: str) -> None:
+        self.default_category = default_category
+        self.rules: List[_Rule] = []
+        self._by_process: Dict[str, List[int]] = {}
+        self._any_process: List[int] = []
+        self._glob_process: List[int] = []
+        substrings: Dict[str, List[int]] = {}
+        gates: Dict[str, List[int]] = {}
+        for index, raw in enumerate(rules):
+            name = raw.get("name", f"#{index}")
+            processes = frozenset(p.lower() for p in raw.get("process", []))
+            process_globs = [g for g in (_compile("glob", p, name) for p in raw.get("process_glob", [])) if g]
+            contains = [t.lower() for t in raw.get("title_contains", [])]
+            regexes = raw.get("title_regex", [])
+            globs = raw.get("title_glob", [])
+            rule = _Rule(
+                category=raw.get("category") or default_category,
+                processes=processes,
+                process_globs=process_globs,
+                has_process=bool(processes or raw.get("process_glob")),
+                has_title=bool(contains or regexes or globs),
+                title_always="" in contains,
+            )
+            rule.title_regexes = [p for p in (_compile("regex", r, name) for r in regexes) if p]
+            rule.title_globs = [p for p in (_compile("glob", g, name) for g in globs) if p]
+            literals = [_glob_literal(g) for g in globs]
+            rule.gated = bool(rule.title_globs) and not rule.title_regexes and all(literals)
+            if rule.gated:
+                for literal in dict.fromkeys(literals):
+                    gates.setdefault(literal, []).append(index)
+            self.rules.append(rule)
+            for process in processes:
+                self._by_process.setdefault(process, []).append(index)
+            if process_globs:
+                self._glob_process.append(index)
+            if not rule.has_process:
+                self._any_process.append(index)
+            for sub in dict.fromkeys(contains):
+                if sub:
+                    substrings.setdefault(sub, []).append(index)
+        self._automaton = AhoCorasick(dict.fromkeys([*substrings, *gates]))
+        self._substring_rules: List[List[int]] = [substrings.get(p, []) for p in self._automaton.patterns]
+        self._gated_rules: List[List[int]] = [gates.get(p, []) for p in self._automaton.patterns]
+        self._candidates: Dict[str, Tuple[FrozenSet[int], int, List[int]]] = {}
+        self._last: Optional[Tuple[str, str, str]] = None
+
+    def match(self, process_name: str, window_title: str) -> str:
+        process, title = process_name.lower(), window_title.lower()
+        last = self._last
+        if last is not None and last[0] == process and last[1] == title:
+            return last[2]  # the foreground window usually has not changed since the last tick
+        index = self._first_match(process, title)
+        category = self.rules[index].category if index is not None else self.default_category
+        self._last = (process, title, category)
+        return category
+
+    def _first_match(self, process: str, title: str) -> Optional[int]:
+        candidates, first_untitled, pattern_rules = self._candidates_for(process)
+        best = first_untitled
+        for pattern in self._automaton.find(title):
+            for index in self._substring_rules[pattern]:
+                if index >= best:
+                    break
+                if index in candidates:
+                    best = index
+                    break
+            for index in self._gated_rules[pattern]:
+                if index >= best:
+                    break
+                if index in candidates and self.rules[index].title_matches(title):
+                    best = index
+                    break
+        for index in pattern_rules:
+            if index >= best:
+                break
+            if self.rules[index].title_matches(title):
+                best = index
+                break
+        return best if best < len(self.rules) else None
+
+    def _candidates_for(self, process: str) -> Tuple[FrozenSet[int], int, List[int]]:
+        """Rules that accept ``process``: their set, the first one without a title condition, and those to try one by one."""
+        cached = self._candidates.get(process)
+        if cached is not None:
+            return cached
+        indices = set(self._by_process.get(process, ()))
+        indices.update(self._any_process)
+        indices.update(i for i in self._glob_process if any(g.match(process) for g in self.rules[i].process_globs))
+        ordered = sorted(indices)
+        first_untitled = next(
+            (i for i in ordered if not self.rules[i].has_title or self.rules[i].title_always), len(self.rules)
+        )
+        with_patterns = [
+            i for i in ordered if (self.rules[i].title_regexes or self.rules[i].title_globs) and not self.rules[i].gated
+        ]
+        if len(self._candidates) >= PROCESS_CACHE_SIZE:
+            self._candidates.clear()
+        cached = self._candidates[process] = (frozenset(indices), first_untitled, with_patterns)
+        return cached
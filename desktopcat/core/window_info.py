@@ -18,6 +18,27 @@ GetWindowTextW = ctypes.windll.user32.GetWindowTextW
 OpenProcess = ctypes.windll.kernel32.OpenProcess
 CloseHandle = ctypes.windll.kernel32.CloseHandle
 QueryFullProcessImageNameW = ctypes.windll.kernel32.QueryFullProcessImageNameW
+GetLastInputInfo = ctypes.windll.user32.GetLastInputInfo
+GetTickCount = ctypes.windll.kernel32.GetTickCount
+GetWindowRect = ctypes.windll.user32.GetWindowRect
+GetShellWindow = ctypes.windll.user32.GetShellWindow
+GetDesktopWindow = ctypes.windll.user32.GetDesktopWindow
+MonitorFromWindow = ctypes.windll.user32.MonitorFromWindow
+GetMonitorInfoW = ctypes.windll.user32.GetMonitorInfoW
+MONITOR_DEFAULTTONEAREST = 2
+
+
+class LASTINPUTINFO(ctypes.Structure):
+    _fields_ = [("cbSize", wintypes.UINT), ("dwTime", wintypes.DWORD)]
+
+
+class MONITORINFO(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("rcMonitor", wintypes.RECT),
+        ("rcWork", wintypes.RECT),
+        ("dwFlags", wintypes.DWORD),
+    ]
 
 
 @dataclass
@@ -64,3 +85,34 @@ def get_foreground_window_info() -> WindowInfo | None:
     process_name = process_path.name.lower() if process_path else ""
     window_title = _get_window_title(hwnd)
     return WindowInfo(process_name=process_name, process_path=process_path, window_title=window_title)
+
+
+def get_idle_seconds() -> float:
+    """Seconds since the last keyboard or mouse input in this session."""
+    info = LASTINPUTINFO()
+    info.cbSize = ctypes.sizeof(LASTINPUTINFO)
+    if not GetLastInputInfo(ctypes.byref(info)):
+        return 0.0
+    # Both are 32-bit tick counts; mask so wrap-around after ~49 days stays positive.
+    return ((GetTickCount() - info.dwTime) & 0xFFFFFFFF) / 1000.0
+
+
+def is_foreground_fullscreen() -> bool:
+    """True when the foreground window covers its whole monitor (games, video players, presentations)."""
+    hwnd = GetForegroundWindow()
+    if not hwnd or hwnd in (GetShellWindow(), GetDesktopWindow()):
+        return False
+    rect = wintypes.RECT()
+    if not GetWindowRect(hwnd, ctypes.byref(rect)):
+        return False
+    info = MONITORINFO()
+    info.cbSize = ctypes.sizeof(MONITORINFO)
+    if not GetMonitorInfoW(MonitorFromWindow(hwnd, MONITOR_DEFAULTTONEAREST), ctypes.byref(info)):
+        return False
+    monitor = info.rcMonitor
+    return (
+        rect.left <= monitor.left
+        and rect.top <= monitor.top
+        and rect.right >= monitor.right
+        and rect.bottom >= monitor.bottom
+    )
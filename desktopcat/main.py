@@ -8,6 +8,9 @@ from desktopcat.core.asset_manager import AssetManager
 from desktopcat.core.config_loader import ConfigLoader
 from desktopcat.core.context_config import ContextRulesLoader
 from desktopcat.core.context_manager import ContextManager
+from desktopcat.core.window_info import get_idle_seconds, is_foreground_fullscreen
+from desktopcat.ui.animation import AnimationPool
+from desktopcat.ui.playback_governor import PlaybackGovernor, PlaybackPolicy
 from desktopcat.ui.widget import CatWidget
 
 
@@ -22,7 +25,7 @@ def run() -> None:
     app = QApplication(sys.argv)
 
     config_loader = ConfigLoader()
-    asset_manager = AssetManager(config_loader)
+    asset_manager = AssetManager(config_loader, watch=True)
     context_rules_loader = ContextRulesLoader()
     override_path = _resolve_override_path(sys.argv)
     try:
@@ -31,7 +34,12 @@ def run() -> None:
         print(f"Failed to load asset: {exc}")
         sys.exit(1)
 
-    widget = CatWidget(asset)
+    widget = CatWidget(
+        asset,
+        animation_pool=AnimationPool(config_loader.get_animation_pool_budget(), config_loader.get_frame_budget()),
+        render_mode=config_loader.get_render_mode(),
+        crossfade_ms=config_loader.get_crossfade_ms(),
+    )
     widget.show()
 
     context_manager: Optional[ContextManager] = None
@@ -39,6 +47,14 @@ def run() -> None:
         context_manager = ContextManager(widget, asset_manager, context_rules_loader)
         context_manager.start()
 
+    governor = PlaybackGovernor(
+        widget,
+        PlaybackPolicy.from_dict(config_loader.get_playback_settings()),
+        idle_seconds=get_idle_seconds,
+        is_fullscreen=is_foreground_fullscreen,
+    )
+    governor.start()
+
     sys.exit(app.exec())
 
 
@@ -0,0 +1,573 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from PyQt6.QtCore import QObject, QPoint, QRect, QRunnable, QSize, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPainter, QPixmap
+
+DEFAULT_POOL_BUDGET = 128 * 1024 * 1024  # bytes of decoded frames kept across animations
+DEFAULT_FRAME_BUDGET = 48 * 1024 * 1024  # one animation above this streams instead of being kept
+FRAME_FORMAT = QImage.Format.Format_ARGB32_Premultiplied  # what the raster paint engine blends natively
+BYTES_PER_PIXEL = 4
+MAX_ATLAS_SIDE = 8192  # widest sprite sheet before wrapping to more rows
+DEFAULT_FRAME_DELAY_MS = 100  # what browsers and QMovie use for GIFs with a 0/10 ms delay
+MIN_FRAME_DELAY_MS = 20
+
+AnimationKey = Tuple[Path, int, int]  # source path, requested width, height
+
+
+def _frame_delay(delay: int) -> int:
+    return DEFAULT_FRAME_DELAY_MS if delay < MIN_FRAME_DELAY_MS else delay
+
+
+def _image_bytes(image: QImage) -> int:
+    return image.width() * image.height() * max(image.depth(), 8) // 8
+
+
+def _open_reader(path: Path, size: QSize) -> QImageReader:
+    """Reader that decodes straight to ``size`` (aspect kept) rather than scaling afterwards."""
+    reader = QImageReader(str(path))
+    source = reader.size()
+    if source.isValid() and size.isValid() and not size.isEmpty():
+        reader.setScaledSize(source.scaled(size, Qt.AspectRatioMode.KeepAspectRatio))
+    return reader
+
+
+def _read_frame(reader: QImageReader) -> Tuple[Optional[QImage], int]:
+    delay = reader.nextImageDelay()
+    image = reader.read()
+    if image.isNull():
+        return None, 0
+    return image.convertToFormat(FRAME_FORMAT), _frame_delay(delay)
+
+
+def build_atlas(frames: List[QImage]) -> Tuple[QImage, List[QRect]]:
+    """Pack same-sized frames into one near-square sprite sheet; worker-thread safe."""
+    frame_size = frames[0].size()
+    count = len(frames)
+    # Near-square, but prefer a column count that leaves fewer empty cells (e.g. 51 frames -> 17 x 3).
+    widest = max(1, min(count, MAX_ATLAS_SIDE // max(frame_size.width(), 1)))
+    start = min(math.ceil(math.sqrt(count)), widest)
+    columns = min(range(start, widest + 1), key=lambda c: (math.ceil(count / c) * c - count, c))
+    rows = math.ceil(count / columns)
+    atlas = QImage(frame_size.width() * columns, frame_size.height() * rows, FRAME_FORMAT)
+    atlas.fill(Qt.GlobalColor.transparent)
+    rects: List[QRect] = []
+    painter = QPainter(atlas)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+    for i, image in enumerate(frames):
+        origin = QPoint((i % columns) * frame_size.width(), (i // columns) * frame_size.height())
+        painter.drawImage(origin, image)
+        rects.append(QRect(origin, frame_size))
+    painter.end()
+    return atlas, rects
+
+
+@dataclass
+class DecodedAnimation:
+    """Every frame of one GIF, decoded at display size into a single sprite atlas.
+
+    ``rects[i]`` is frame ``i``'s area of ``atlas``; painting a frame is one
+    drawImage from the shared sheet. The atlas stays a QImage so a decode
+    finished on the pool thread is handed over without a UI-thread conversion.
+    """
+
+    path: Path
+    size: QSize
+    atlas: QImage
+    rects: List[QRect] = field(default_factory=list)
+    delays_ms: List[int] = field(default_factory=list)
+    decode_ms: float = 0.0  # time the pool thread spent decoding and packing it
+
+    @property
+    def key(self) -> AnimationKey:
+        return (self.path, self.size.width(), self.size.height())
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.rects)
+
+    @property
+    def nbytes(self) -> int:
+        return _image_bytes(self.atlas)
+
+    def source(self, index: int) -> Tuple[QImage, QRect]:
+        return self.atlas, self.rects[index]
+
+    def frame(self, index: int) -> QPixmap:
+        """Frame ``index`` as its own pixmap, for widgets that take one (QLabel)."""
+        return QPixmap.fromImage(self.atlas.copy(self.rects[index]))
+
+    def delay(self, index: int) -> int:
+        return self.delays_ms[index]
+
+
+class StreamingAnimation:
+    """Decodes one frame at a time on the UI thread; only the current frame stays resident.
+
+    Used when keeping every frame would exceed the per-animation budget.
+    """
+
+    def __init__(self, path: Path, size: QSize, delays_ms: List[int], decode_ms: float = 0.0) -> None:
+        self.path = path
+        self.size = size
+        self.delays_ms = delays_ms
+        self.decode_ms = decode_ms  # the pool thread's pass over the file
+        self._reader: Optional[QImageReader] = None
+        self._index = -1
+        self._current = QImage()
+
+    @property
+    def key(self) -> AnimationKey:
+        return (self.path, self.size.width(), self.size.height())
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.delays_ms)
+
+    @property
+    def nbytes(self) -> int:
+        return _image_bytes(self._current)
+
+    def delay(self, index: int) -> int:
+        return self.delays_ms[index]
+
+    def source(self, index: int) -> Tuple[QImage, QRect]:
+        image = self._decode(index)
+        return image, image.rect()
+
+    def frame(self, index: int) -> QPixmap:
+        return QPixmap.fromImage(self._decode(index))
+
+    def _decode(self, index: int) -> QImage:
+        if index == self._index:
+            return self._current
+        if self._reader is None or index < self._index:
+            # GIF readers only go forward; looping back means reopening the file.
+            self._reader = _open_reader(self.path, self.size)
+            self._index = -1
+        while self._index < index:
+            image, _delay = _read_frame(self._reader)
+            if image is None:
+                break
+            self._index += 1
+            if self._index == index:
+                self._current = image
+        return self._current
+
+
+Animation = Union[DecodedAnimation, StreamingAnimation]
+
+
+def decode_frames(
+    path: Path,
+    size: QSize,
+    budget_bytes: int = DEFAULT_FRAME_BUDGET,
+    cancelled: Callable[[], bool] = lambda: False,
+) -> Tuple[List[QImage], List[int]]:
+    """Decode every frame of ``path`` at ``size``; safe to call from a worker thread.
+
+    Once the frames would exceed ``budget_bytes`` they are dropped and only
+    the delays are collected, so the caller can stream instead. ``cancelled``
+    is checked between frames; a cancelled decode returns no delays.
+    """
+    reader = _open_reader(path, size)
+    frames: List[QImage] = []
+    delays: List[int] = []
+    used = 0
+    streaming = False
+    while reader.canRead():
+        if cancelled():
+            return [], []
+        image, delay = _read_frame(reader)
+        if image is None:
+            break
+        delays.append(delay)
+        used += image.width() * image.height() * BYTES_PER_PIXEL
+        if used > budget_bytes:
+            streaming = True
+            frames.clear()
+        if not streaming:
+            frames.append(image)
+    if not delays:
+        raise ValueError(f"Could not decode {path}: {reader.errorString()}")
+    return frames, delays
+
+
+@dataclass
+class _Ticket:
+    """Shared between the pool (UI thread) and one queued decode; plain Python, so safe to flag across threads."""
+
+    cancellable: bool
+    cancelled: bool = False
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, pool: "AnimationPool", path: Path, size: QSize, ticket: _Ticket) -> None:
+        super().__init__()
+        self.pool = pool
+        self.path = path
+        self.size = QSize(size)
+        self.ticket = ticket
+
+    def run(self) -> None:
+        atlas: Optional[QImage] = None
+        rects: List[QRect] = []
+        delays: List[int] = []
+        error: Optional[str] = None
+        started = time.perf_counter()
+        try:
+            frames, delays = decode_frames(
+                self.path, self.size, self.pool.frame_budget_bytes, cancelled=lambda: self.ticket.cancelled
+            )
+            if frames:
+                atlas, rects = build_atlas(frames)
+        except Exception as exc:  # noqa: BLE001 - reported through AnimationPool.failed
+            error = str(exc)
+        decode_ms = (time.perf_counter() - started) * 1000
+        self._emit(self.pool._decoded, self.ticket, self.path, self.size, (atlas, rects, decode_ms), delays, error)
+
+    @staticmethod
+    def _emit(signal, *args) -> None:
+        try:
+            # Emitted from the pool thread; AnimationPool lives on the UI thread, so this is queued.
+            signal.emit(*args)
+        except RuntimeError:
+            pass  # the pool was deleted while this file was decoding (app shutdown)
+
+
+class _StillTask(_DecodeTask):
+    def run(self) -> None:
+        image = QImage()
+        error: Optional[str] = None
+        if not self.ticket.cancelled:
+            reader = QImageReader(str(self.path))
+            reader.setAutoTransform(True)
+            image = reader.read()
+            if image.isNull():
+                error = f"Could not decode {self.path}: {reader.errorString()}"
+        self._emit(self.pool._still_decoded, self.ticket, self.path, image, error)
+
+
+class AnimationPool(QObject):
+    """Decoded GIF animations kept in memory, least recently used first out.
+
+    Entries are keyed by path and display size and decoded at that size in
+    premultiplied ARGB32, so they cost width x height x 4 per frame rather
+    than the source resolution. ``get`` is a dictionary lookup, so switching
+    back to a pooled animation costs no I/O or decoding. ``warm`` decodes on
+    a background thread and ``ready`` fires on the UI thread when an entry
+    lands. An animation whose frames exceed ``frame_budget_bytes`` is pooled
+    as a StreamingAnimation instead.
+    """
+
+    ready = pyqtSignal(object)  # DecodedAnimation | StreamingAnimation
+    still_ready = pyqtSignal(object, object)  # path, QImage; answers decode_still
+    failed = pyqtSignal(object, str)  # path, error; a requested decode produced nothing
+    _decoded = pyqtSignal(object, object, object, object, object, object)  # ticket, path, size, (atlas, rects, ms), delays, error
+    _still_decoded = pyqtSignal(object, object, object, object)  # ticket, path, QImage, error
+
+    def __init__(
+        self,
+        budget_bytes: int = DEFAULT_POOL_BUDGET,
+        frame_budget_bytes: int = DEFAULT_FRAME_BUDGET,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.budget_bytes = budget_bytes
+        self.frame_budget_bytes = frame_budget_bytes
+        self.used_bytes = 0
+        self._items: "OrderedDict[AnimationKey, Animation]" = OrderedDict()
+        self._costs: Dict[AnimationKey, int] = {}
+        self._pending: Dict[AnimationKey, _Ticket] = {}
+        self._stills: Dict[Path, _Ticket] = {}
+        self._threads = QThreadPool(self)
+        self._threads.setMaxThreadCount(1)  # warm-up must not compete with the UI for cores
+        self._decoded.connect(self._on_decoded)
+        self._still_decoded.connect(self._on_still_decoded)
+
+    @staticmethod
+    def key(path: Path, size: QSize) -> AnimationKey:
+        return (Path(path), size.width(), size.height())
+
+    def get(self, path: Path, size: QSize) -> Optional[Animation]:
+        key = self.key(path, size)
+        animation = self._items.get(key)
+        if animation is not None:
+            self._items.move_to_end(key)
+        return animation
+
+    def put(self, animation: Animation) -> None:
+        key = animation.key
+        if key in self._items:
+            del self._items[key]
+            self.used_bytes -= self._costs.pop(key)
+        if isinstance(animation, StreamingAnimation):
+            cost = animation.size.width() * animation.size.height() * BYTES_PER_PIXEL  # one frame at a time
+        else:
+            cost = animation.nbytes
+        if cost > self.budget_bytes:
+            return
+        self._items[key] = animation
+        self._costs[key] = cost
+        self.used_bytes += cost
+        while self.used_bytes > self.budget_bytes and len(self._items) > 1:
+            evicted, _ = self._items.popitem(last=False)
+            self.used_bytes -= self._costs.pop(evicted)
+
+    def warm(self, requests: Iterable[Tuple[Path, QSize]], cancellable: bool = False) -> None:
+        """Decode (path, display size) pairs not pooled yet, in order, on the background thread.
+
+        ``cancellable`` requests (a widget's pending load) may be withdrawn with
+        ``cancel``; warm-up requests for the same key make it stick.
+        """
+        for path, size in requests:
+            key = self.key(path, size)
+            if key[0].suffix.lower() != ".gif" or key in self._items:
+                continue
+            ticket = self._pending.get(key)
+            if ticket is not None:
+                ticket.cancellable = ticket.cancellable and cancellable
+                continue
+            ticket = self._pending[key] = _Ticket(cancellable)
+            self._threads.start(_DecodeTask(self, key[0], size, ticket))
+
+    def cancel(self, path: Path, size: QSize) -> None:
+        """Withdraw a cancellable request; a decode in progress stops at the next frame."""
+        key = self.key(path, size)
+        ticket = self._pending.get(key)
+        if ticket is not None and ticket.cancellable:
+            ticket.cancelled = True
+            del self._pending[key]
+
+    def decode_still(self, path: Path) -> None:
+        """Decode a still image on the background thread; answered by ``still_ready`` or ``failed``."""
+        path = Path(path)
+        if path not in self._stills:
+            ticket = self._stills[path] = _Ticket(cancellable=True)
+            self._threads.start(_StillTask(self, path, QSize(), ticket))
+
+    def cancel_still(self, path: Path) -> None:
+        ticket = self._stills.pop(Path(path), None)
+        if ticket is not None:
+            ticket.cancelled = True
+
+    def is_pending(self, path: Path, size: QSize) -> bool:
+        return self.key(path, size) in self._pending
+
+    def has_pending(self) -> bool:
+        return bool(self._pending or self._stills)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._costs.clear()
+        self.used_bytes = 0
+
+    def shutdown(self) -> None:
+        self._threads.clear()
+        self._threads.waitForDone()
+
+    def _on_decoded(
+        self,
+        ticket: _Ticket,
+        path: Path,
+        size: QSize,
+        sheet: Tuple[Optional[QImage], List[QRect], float],
+        delays: List[int],
+        error: Optional[str],
+    ) -> None:
+        key = self.key(path, size)
+        if self._pending.get(key) is ticket:
+            del self._pending[key]
+        if error:
+            self.failed.emit(path, error)
+        if not delays:
+            return
+        atlas, rects, decode_ms = sheet
+        animation: Animation
+        if atlas is not None:
+            animation = DecodedAnimation(path, size, atlas, rects, delays, decode_ms)
+        else:
+            animation = StreamingAnimation(path, size, delays, decode_ms)
+        self.put(animation)
+        self.ready.emit(animation)
+
+    def _on_still_decoded(self, ticket: _Ticket, path: Path, image: QImage, error: Optional[str]) -> None:
+        if self._stills.get(path) is ticket:
+            del self._stills[path]
+        if ticket.cancelled:
+            return
+        if error:
+            self.failed.emit(path, error)
+        else:
+            self.still_ready.emit(path, image)
+
+
+class FrameClock(QObject):
+    """One timer for every AnimationPlayer, armed for the earliest due frame.
+
+    Frames are due at ``previous due + delay`` rather than ``now + delay``,
+    so timer latency does not accumulate into a slower animation.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._due: Dict["AnimationPlayer", float] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    def schedule(self, player: "AnimationPlayer", due: float) -> None:
+        self._due[player] = due
+        self._arm()
+
+    def cancel(self, player: "AnimationPlayer") -> None:
+        if self._due.pop(player, None) is not None:
+            self._arm()
+
+    def _tick(self) -> None:
+        now = time.perf_counter()
+        for player in [p for p, due in self._due.items() if due <= now + 0.001]:
+            del self._due[player]
+            player._advance(now)
+        self._arm()
+
+    def _arm(self) -> None:
+        if not self._due:
+            self._timer.stop()
+            return
+        wait_ms = (min(self._due.values()) - time.perf_counter()) * 1000
+        self._timer.start(max(0, int(wait_ms)))
+
+
+_frame_clock: Optional[FrameClock] = None
+
+
+def get_frame_clock() -> FrameClock:
+    global _frame_clock
+    if _frame_clock is None:
+        _frame_clock = FrameClock()
+    return _frame_clock
+
+
+class AnimationPlayer(QObject):
+    """Steps through an animation with the GIF's own frame delays, on the shared FrameClock.
+
+    Frame timing is wall-clock based: when a wake-up comes late or ``max_fps``
+    is below the GIF's own rate, frames whose time has passed are skipped so
+    the animation keeps its speed while painting less often. ``pause`` stops
+    scheduling entirely. Of the skipped frames, ``frames_dropped`` counts
+    only those lost to a late wake-up, not to ``max_fps``.
+    """
+
+    frame_changed = pyqtSignal(int)  # index into self.animation
+
+    def __init__(self, parent: Optional[QObject] = None, clock: Optional[FrameClock] = None) -> None:
+        super().__init__(parent)
+        self.animation: Optional[Animation] = None
+        self.index = 0
+        self.clock = clock or get_frame_clock()
+        self.max_fps = 0.0  # 0 = the GIF's own rate
+        self.paused = False
+        self.frames_shown = 0
+        self.frames_skipped = 0
+        self.frames_dropped = 0
+        self.last_dropped = 0  # dropped just before the frame on screen
+        self.paused_s = 0.0
+        self._frame_start = 0.0  # when the current frame became due
+        self._wake = 0.0  # when the next frame was scheduled to be shown
+        self._paused_at = 0.0
+
+    def play(self, animation: Animation, start_frame: int = 0) -> None:
+        self.animation = animation
+        self.index = start_frame % animation.frame_count
+        now = time.perf_counter()
+        self._frame_start = now
+        self.frames_shown += 1
+        self.last_dropped = 0
+        self.frame_changed.emit(self.index)
+        self._schedule(now)
+
+    def stop(self) -> None:
+        self.clock.cancel(self)
+        self.animation = None
+
+    def pause(self) -> None:
+        if self.paused:
+            return
+        self.paused = True
+        self._paused_at = time.perf_counter()
+        self.clock.cancel(self)
+
+    def resume(self) -> None:
+        if not self.paused:
+            return
+        now = time.perf_counter()
+        self.paused = False
+        self.paused_s += now - self._paused_at
+        self._frame_start = now
+        self._schedule(now)
+
+    def paused_seconds(self) -> float:
+        return self.paused_s + (time.perf_counter() - self._paused_at if self.paused else 0.0)
+
+    def set_max_fps(self, fps: float) -> None:
+        self.max_fps = max(0.0, fps)
+        if self.animation is not None and not self.paused:
+            self._schedule(time.perf_counter())
+
+    def is_playing(self) -> bool:
+        return self.animation is not None
+
+    @property
+    def frame_due(self) -> float:
+        """perf_counter time the frame on screen was due."""
+        return self._frame_start
+
+    def current_frame(self) -> Optional[QPixmap]:
+        return self.animation.frame(self.index) if self.animation else None
+
+    def native_fps(self) -> float:
+        animation = self.animation
+        if animation is None or animation.frame_count < 2:
+            return 0.0
+        return animation.frame_count * 1000 / sum(animation.delay(i) for i in range(animation.frame_count))
+
+    def _advance(self, now: float) -> None:
+        animation = self.animation
+        if animation is None or self.paused:
+            return
+        steps = due_since_wake = 0
+        # FrameClock fires up to 1 ms early; count that as on time.
+        while self._frame_start + animation.delay(self.index) / 1000 <= now + 0.001:
+            self._frame_start += animation.delay(self.index) / 1000
+            self.index = (self.index + 1) % animation.frame_count
+            steps += 1
+            if self._frame_start >= self._wake - 0.001:
+                due_since_wake += 1  # frames due before the wake-up were skipped on purpose (max_fps)
+            if steps >= animation.frame_count:
+                self._frame_start = now  # a whole loop behind (system sleep): restart timing here
+                break
+        if steps:
+            self.frames_shown += 1
+            self.frames_skipped += steps - 1
+            self.last_dropped = max(0, due_since_wake - 1)
+            self.frames_dropped += self.last_dropped
+            self.frame_changed.emit(self.index)
+        self._schedule(now)
+
+    def _schedule(self, now: float) -> None:
+        animation = self.animation
+        if animation is None or self.paused or animation.frame_count < 2:
+            return
+        due = self._frame_start + animation.delay(self.index) / 1000
+        if self.max_fps > 0:
+            due = max(due, now + 1 / self.max_fps)
+        self._wake = due
+        self.clock.schedule(self, due)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import statistics
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional
+
+from PyQt6.QtCore import QObject, Qt, QTimer
+from PyQt6.QtWidgets import QLabel
+
+if TYPE_CHECKING:
+    from desktopcat.ui.widget import CatWidget
+
+WINDOW_FRAMES = 120  # frames the rolling figures cover (4 s at 30 fps)
+WINDOW_DECODES = 16
+HUD_REFRESH_MS = 500
+LOG_FILE = "frame_stats.jsonl"
+
+
+def _p95(values) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+
+
+class FrameStats:
+    """Rolling frame timing for one CatWidget; only exists while enabled.
+
+    ``record_frame`` takes when a frame reached the screen and when it was
+    due. Jitter is how far each interval between shown frames strayed from
+    the interval between their due times, so a GIF's own uneven delays do not
+    count. Paint times cover the UI-thread work per frame (``paintEvent`` in
+    atlas mode, ``setPixmap`` in label mode); decode times are the pool
+    thread's per animation.
+    """
+
+    def __init__(self, window: int = WINDOW_FRAMES) -> None:
+        self.started = time.perf_counter()
+        self.frames = 0
+        self.dropped = 0
+        self.intervals_ms: Deque[float] = deque(maxlen=window)
+        self.jitter_ms: Deque[float] = deque(maxlen=window)
+        self.paint_ms: Deque[float] = deque(maxlen=window)
+        self.decode_ms: Deque[float] = deque(maxlen=WINDOW_DECODES)
+        self._last_shown: Optional[float] = None
+        self._last_due = 0.0
+
+    def record_frame(self, shown: float, due: float, dropped: int = 0) -> None:
+        self.frames += 1
+        self.dropped += dropped
+        if self._last_shown is not None:
+            interval = shown - self._last_shown
+            self.intervals_ms.append(interval * 1000)
+            self.jitter_ms.append(abs(interval - (due - self._last_due)) * 1000)
+        self._last_shown, self._last_due = shown, due
+
+    def restart_timing(self) -> None:
+        """Forget the previous frame, e.g. after a pause or a switch, so the gap is not counted."""
+        self._last_shown = None
+
+    def record_paint(self, ms: float) -> None:
+        self.paint_ms.append(ms)
+
+    def record_decode(self, ms: float) -> None:
+        self.decode_ms.append(ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        intervals = self.intervals_ms
+        span_s = sum(intervals) / 1000
+        return {
+            "fps": round(len(intervals) / span_s, 1) if span_s > 0 else 0.0,
+            "interval_ms": round(statistics.median(intervals), 2) if intervals else 0.0,
+            "jitter_ms": round(statistics.fmean(self.jitter_ms), 2) if self.jitter_ms else 0.0,
+            "jitter_p95_ms": round(_p95(self.jitter_ms), 2),
+            "paint_ms": round(statistics.median(self.paint_ms), 3) if self.paint_ms else 0.0,
+            "paint_p95_ms": round(_p95(self.paint_ms), 3),
+            "paint_max_ms": round(max(self.paint_ms, default=0.0), 3),
+            "decode_ms": round(statistics.median(self.decode_ms), 1) if self.decode_ms else 0.0,
+            "decode_max_ms": round(max(self.decode_ms, default=0.0), 1),
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "seconds": round(time.perf_counter() - self.started, 1),
+        }
+
+
+def format_stats(timing: Dict[str, Any]) -> str:
+    memory = timing.get("memory", {})
+    return (
+        f"{timing['fps']:.1f} fps  jitter {timing['jitter_ms']:.1f}/{timing['jitter_p95_ms']:.1f} ms\n"
+        f"paint {timing['paint_ms']:.2f} ms  p95 {timing['paint_p95_ms']:.2f}  max {timing['paint_max_ms']:.2f}\n"
+        f"decode {timing['decode_ms']:.0f} ms  dropped {timing['dropped']}/{timing['frames']}\n"
+        f"frames {memory.get('current', 0) / 1e6:.1f} MB  pool {memory.get('pool', 0) / 1e6:.1f}"
+        f"/{memory.get('pool_budget', 0) / 1e6:.0f} MB"
+    )
+
+
+class FrameStatsHud(QLabel):
+    """Small text overlay in the widget's top-left corner; ignores the mouse so dragging still works."""
+
+    def __init__(self, widget: CatWidget) -> None:
+        super().__init__(widget)
+        self.widget = widget
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        self.setStyleSheet(
+            "background-color: rgba(0, 0, 0, 170); color: #b6f5b6; padding: 3px;"
+            " font-family: monospace; font-size: 9px; border-radius: 3px;"
+        )
+        self.move(4, 28)  # below the notice and close buttons
+        self._timer = QTimer(self)
+        self._timer.setInterval(HUD_REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def start(self) -> None:
+        self.refresh()
+        self.show()
+        self.raise_()
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self.hide()
+
+    def refresh(self) -> None:
+        timing = self.widget.frame_timing()
+        if timing is None:
+            return
+        self.setText(format_stats(timing))
+        self.adjustSize()
+
+
+class FrameStatsLog(QObject):
+    """Appends one JSON line of ``CatWidget.frame_timing()`` every ``interval_s`` while stats are enabled."""
+
+    def __init__(self, widget: CatWidget, log_dir: Path, interval_s: float = 60.0) -> None:
+        super().__init__(widget)
+        self.widget = widget
+        self.path = Path(log_dir) / LOG_FILE
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.write)
+        self._interval_ms = int(interval_s * 1000)
+
+    def start(self) -> None:
+        if self._interval_ms > 0:
+            self._timer.start(self._interval_ms)
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def write(self) -> Optional[Path]:
+        timing = self.widget.frame_timing()
+        if timing is None:
+            return None
+        record = {"timestamp": datetime.now().isoformat(timespec="seconds"), "asset": self.widget.asset.path.name, **timing}
+        try:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as exc:
+            print(f"Failed to write frame stats: {exc}")
+            return None
+        return self.path
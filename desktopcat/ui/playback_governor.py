@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from PyQt6.QtCore import QEvent, QObject, QTimer, pyqtSignal
+
+from desktopcat.ui.widget import CatWidget
+
+STATES = ("active", "idle", "fullscreen", "hidden")
+
+
+@dataclass
+class PlaybackPolicy:
+    """Frame-rate limits per state; an fps of 0 pauses playback in that state."""
+
+    fps_cap: float = 30.0  # applies while active; 0 = the GIF's own rate
+    idle_fps: float = 5.0
+    idle_after_s: float = 120.0
+    fullscreen_fps: float = 0.0
+    poll_interval_ms: int = 2000
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "PlaybackPolicy":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+class PlaybackGovernor(QObject):
+    """Pauses or slows CatWidget's animation when nobody is looking at it.
+
+    - hidden (tray "Hide Cat"): paused, reacting to Show/Hide immediately
+    - a fullscreen app in the foreground: ``fullscreen_fps``
+    - no input for ``idle_after_s``: ``idle_fps``
+    - otherwise: ``fps_cap``
+
+    Idle and fullscreen are polled every ``poll_interval_ms`` through the
+    injected probes (desktopcat.core.window_info on Windows); without them
+    only the hidden state applies. ``report`` gives the process CPU time
+    spent in each state and what throttling saved: frames not drawn, their
+    paint cost, and the CPU the throttled states used below the active rate.
+    """
+
+    state_changed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        widget: CatWidget,
+        policy: Optional[PlaybackPolicy] = None,
+        idle_seconds: Optional[Callable[[], float]] = None,
+        is_fullscreen: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        super().__init__(widget)
+        self.widget = widget
+        self.policy = policy or PlaybackPolicy()
+        self.idle_seconds = idle_seconds
+        self.is_fullscreen = is_fullscreen
+        self.state: Optional[str] = None
+        self._seconds: Dict[str, float] = dict.fromkeys(STATES, 0.0)
+        self._cpu_s: Dict[str, float] = dict.fromkeys(STATES, 0.0)
+        self._since = time.perf_counter()
+        self._cpu_since = time.process_time()
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.evaluate)
+
+    def start(self) -> None:
+        self.widget.installEventFilter(self)
+        self.evaluate()
+        if self.idle_seconds or self.is_fullscreen:
+            self._timer.start(self.policy.poll_interval_ms)
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self.widget.removeEventFilter(self)
+        self._account()
+        self.state = None
+        self.widget.set_playback(paused=False, max_fps=self.policy.fps_cap)
+
+    def eventFilter(self, obj, event) -> bool:  # noqa: N802
+        if obj is self.widget and event.type() in (QEvent.Type.Show, QEvent.Type.Hide):
+            # Hide arrives before the window is unmapped; defer so isVisible() is current.
+            QTimer.singleShot(0, self.evaluate)
+        return super().eventFilter(obj, event)
+
+    def current_state(self) -> str:
+        if not self.widget.isVisible():
+            return "hidden"
+        try:
+            if self.is_fullscreen and self.is_fullscreen():
+                return "fullscreen"
+            if self.idle_seconds and self.idle_seconds() >= self.policy.idle_after_s:
+                return "idle"
+        except OSError:
+            pass  # a failed probe must not stop the cat
+        return "active"
+
+    def evaluate(self) -> None:
+        state = self.current_state()
+        if state == self.state:
+            return
+        self._account()
+        self.state = state
+        fps = {
+            "active": self.policy.fps_cap,
+            "idle": self.policy.idle_fps,
+            "fullscreen": self.policy.fullscreen_fps,
+            "hidden": 0.0,
+        }[state]
+        paused = state != "active" and fps <= 0
+        self.widget.set_playback(paused=paused, max_fps=fps)
+        self.state_changed.emit(state)
+
+    def _account(self) -> None:
+        now, cpu = time.perf_counter(), time.process_time()
+        if self.state is not None:
+            self._seconds[self.state] += now - self._since
+            self._cpu_s[self.state] += cpu - self._cpu_since
+        self._since, self._cpu_since = now, cpu
+
+    def report(self) -> Dict[str, Any]:
+        """Time and process CPU per state, plus frames and CPU saved by skipping or pausing."""
+        self._account()
+        player = self.widget.player
+        paused_s = player.paused_seconds()
+        saved_frames = player.frames_skipped + paused_s * player.native_fps()
+        # Measured: what the other states would have cost at the active state's CPU rate, minus what they did cost.
+        saved_cpu_s = 0.0
+        if self._seconds["active"] > 0:
+            rate = self._cpu_s["active"] / self._seconds["active"]
+            saved_cpu_s = sum(
+                max(0.0, rate * self._seconds[k] - self._cpu_s[k]) for k in STATES if k != "active"
+            )
+        return {
+            "state": self.state,
+            "seconds": {k: round(v, 1) for k, v in self._seconds.items()},
+            "cpu_ms": {k: round(v * 1000, 1) for k, v in self._cpu_s.items()},
+            "frames_shown": player.frames_shown,
+            "frames_skipped": player.frames_skipped,
+            "paused_s": round(paused_s, 1),
+            "frame_cost_ms": round(self.widget.frame_cost_ms, 3),
+            "saved_frames": int(saved_frames),
+            "saved_paint_ms": round(saved_frames * self.widget.frame_cost_ms, 1),
+            "saved_cpu_ms": round(saved_cpu_s * 1000, 1),
+        }
+
+    def summary(self) -> str:
+        r = self.report()
+        return (
+            f"playback: {r['frames_shown']} frames shown, {r['saved_frames']} not drawn "
+            f"(~{r['saved_cpu_ms'] / 1000:.2f} s process CPU saved); state {r['state']}"
+        )
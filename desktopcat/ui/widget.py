@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 
-from PyQt6.QtCore import QPoint, Qt, QTimer, QUrl, QEvent
-from PyQt6.QtGui import QGuiApplication, QMovie, QPixmap
-from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
-from PyQt6.QtMultimediaWidgets import QVideoWidget
+from PyQt6.QtCore import QPoint, QRect, QSize, Qt, QTimer, QUrl, QEvent, pyqtSignal
+from PyQt6.QtGui import QGuiApplication, QImage, QMovie, QPainter, QPixmap
 from PyQt6.QtWidgets import QApplication, QLabel, QPushButton, QSizeGrip, QStackedLayout, QVBoxLayout, QWidget, QSizePolicy
 
 from desktopcat.core.asset_manager import AssetDescriptor
+from desktopcat.ui.animation import Animation, AnimationKey, AnimationPlayer, AnimationPool, StreamingAnimation
+from desktopcat.ui.frame_stats import FrameStats, FrameStatsHud
+
+DEFAULT_SIZE = 260
+RENDER_MODES = ("atlas", "label")
+RESIZE_SETTLE_MS = 150  # one high-quality rescale this long after the last resize event
+SCALED_STILL_CACHE = 4  # smooth-scaled variants of the current still image, by size
+CROSSFADE_FRAME_MS = 16
+
+if TYPE_CHECKING:
+    # QtMultimedia loads the platform media backend; imported on the first video asset only.
+    from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
+    from PyQt6.QtMultimediaWidgets import QVideoWidget
+
+
+@dataclass
+class _PendingLoad:
+    generation: int
+    asset: AssetDescriptor
+    key: AnimationKey  # pool key for GIFs; (path, 0, 0) for stills
 
 
 class CatWidget(QWidget):
@@ -17,21 +38,71 @@ class CatWidget(QWidget):
     Minimal floating widget:
     - Frameless, always-on-top, transparent background
     - Draggable + resizable
-    - Shows PNG/JPG/GIF (animates via QMovie) or MP4 via QMediaPlayer
+    - Shows PNG/JPG/GIF or MP4 via QMediaPlayer; GIFs play from the AnimationPool
+      once decoded there, QMovie covers the first showing
+    - render_mode "atlas": pooled GIFs are painted by the widget itself from the
+      sprite atlas, with the label and drag overlay hidden; "label" feeds frames
+      to the QLabel instead
+    - load_asset decodes off the UI thread and keeps the current animation on
+      screen until the new one is ready (optionally crossfading in atlas mode)
+    - Frame timing (fps, jitter, paint/decode times, dropped frames) is only
+      collected while enabled: enable_frame_stats / set_hud_visible
     - No shape masking: transparent background + rectangular window
     """
 
-    def __init__(self, asset: AssetDescriptor, parent: Optional[QWidget] = None) -> None:
+    first_frame_shown = pyqtSignal()
+
+    def __init__(
+        self,
+        asset: AssetDescriptor,
+        parent: Optional[QWidget] = None,
+        animation_pool: Optional[AnimationPool] = None,
+        render_mode: str = "atlas",
+        crossfade_ms: int = 0,
+    ) -> None:
         super().__init__(parent)
+        if render_mode not in RENDER_MODES:
+            raise ValueError(f"render_mode must be one of {RENDER_MODES}, got {render_mode!r}")
         self.asset = asset
+        self.render_mode = render_mode
+        self._self_painted = False
+        self._source_pixmap: Optional[QPixmap] = None
+        self._scaled_stills: "OrderedDict[Tuple[int, int], QPixmap]" = OrderedDict()
+        self._resize_settle = QTimer(self)
+        self._resize_settle.setSingleShot(True)
+        self._resize_settle.setInterval(RESIZE_SETTLE_MS)
+        self._resize_settle.timeout.connect(self._on_resize_settled)
+        self._playback_paused = False
+        self.frame_cost_ms = 0.0  # moving average of the UI-thread time to show one animation frame
+        self.frame_stats: Optional[FrameStats] = None  # None unless enabled; hooks check this and return
+        self._hud: Optional[FrameStatsHud] = None
+        self._hud_owns_stats = False
+        self._movie_due = 0.0
+        self.crossfade_ms = crossfade_ms
+        self._fade_from: Optional[Tuple[QImage, QRect, QRect]] = None  # sheet, source, target of the old frame
+        self._fade_started = 0.0
+        self._fade_timer = QTimer(self)
+        self._fade_timer.setInterval(CROSSFADE_FRAME_MS)
+        self._fade_timer.timeout.connect(self._on_fade_tick)
+        self._load_generation = 0  # bumped by every load_asset; results for older generations are dropped
+        self._pending_load: Optional[_PendingLoad] = None
+        self._has_shown = False
         self.dragging = False
         self.drag_position = QPoint()
         self.movie: Optional[QMovie] = None
         self.media_player: Optional[QMediaPlayer] = None
         self.audio_output: Optional[QAudioOutput] = None
+        self.video_widget: Optional[QVideoWidget] = None
+        self._first_frame_pending = True
         self.drag_overlay: Optional[QWidget] = None
         self.notice_button: Optional[QPushButton] = None
         self._notice_callback = None
+        self.animation_pool = animation_pool or AnimationPool(parent=self)
+        self.animation_pool.ready.connect(self._on_animation_ready)
+        self.animation_pool.still_ready.connect(self._on_still_ready)
+        self.animation_pool.failed.connect(self._on_load_failed)
+        self.player = AnimationPlayer(self)
+        self.player.frame_changed.connect(self._show_frame)
 
         self._setup_window()
         self._build_ui()
@@ -47,7 +118,94 @@ class CatWidget(QWidget):
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
         self.setMouseTracking(True)
-        self.resize(260, 260)
+        self.resize(self._initial_size())
+
+    def _initial_size(self) -> QSize:
+        # With manifest metadata the window opens at the asset's aspect ratio instead of a square.
+        meta = self.asset.meta
+        if not meta or not meta.width or not meta.height:
+            return QSize(DEFAULT_SIZE, DEFAULT_SIZE)
+        return QSize(meta.width, meta.height).scaled(
+            DEFAULT_SIZE, DEFAULT_SIZE, Qt.AspectRatioMode.KeepAspectRatio
+        )
+
+    def _display_size(self, asset: Optional[AssetDescriptor] = None) -> QSize:
+        meta = (asset or self.asset).meta
+        if not meta or not meta.width or not meta.height:
+            return self.size()
+        return QSize(meta.width, meta.height).scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio)
+
+    def _decode_size(self, asset: Optional[AssetDescriptor] = None) -> QSize:
+        """Device pixels the frames are decoded at, so nothing is scaled per frame."""
+        return self._display_size(asset) * self.devicePixelRatioF()
+
+    def _gif_cache_mode(self) -> QMovie.CacheMode:
+        meta = self.asset.meta
+        if meta is None:
+            return QMovie.CacheMode.CacheAll
+        size = self._decode_size()
+        decoded = meta.decoded_bytes(size.width(), size.height())
+        if decoded is not None and decoded > self.animation_pool.frame_budget_bytes:
+            return QMovie.CacheMode.CacheNone
+        return QMovie.CacheMode.CacheAll
+
+    def frame_memory(self) -> dict:
+        """Bytes of decoded frames held for this widget: the pool and the animation on screen."""
+        animation = self.player.animation
+        current = animation.nbytes if animation is not None else 0
+        if self.movie is not None and self.movie.cacheMode() == QMovie.CacheMode.CacheAll:
+            size = self.movie.scaledSize()
+            current = size.width() * size.height() * 4 * max(self.movie.frameCount(), 1)
+        return {
+            "current": current,
+            "pool": self.animation_pool.used_bytes,
+            "pool_budget": self.animation_pool.budget_bytes,
+            "streaming": isinstance(animation, StreamingAnimation),
+        }
+
+    def enable_frame_stats(self, enabled: bool = True) -> None:
+        """Start (fresh) or stop collecting frame timing."""
+        if not enabled:
+            self.frame_stats = None
+            self._hud_owns_stats = False
+            return
+        self.frame_stats = FrameStats()
+        self._movie_due = 0.0
+
+    def frame_timing(self) -> Optional[dict]:
+        """Rolling fps, jitter, paint/decode times, dropped frames and frame memory; None while disabled."""
+        if self.frame_stats is None:
+            return None
+        timing = self.frame_stats.snapshot()
+        timing["memory"] = self.frame_memory()
+        timing["max_fps"] = self.player.max_fps
+        timing["paused"] = self._playback_paused
+        return timing
+
+    def set_hud_visible(self, visible: bool) -> None:
+        """Show the frame timing overlay; collects stats while shown if nothing else enabled them."""
+        if visible:
+            if self.frame_stats is None:
+                self.enable_frame_stats()
+                self._hud_owns_stats = True
+            if self._hud is None:
+                self._hud = FrameStatsHud(self)
+            self._hud.start()
+        elif self._hud is not None:
+            self._hud.stop()
+            if self._hud_owns_stats:
+                self.enable_frame_stats(False)
+
+    def is_hud_visible(self) -> bool:
+        return self._hud is not None and self._hud.isVisible()
+
+    def _on_movie_frame(self, _frame: int) -> None:
+        if self.frame_stats is None or self.movie is None:
+            return
+        now = time.perf_counter()
+        # QMovie times each frame from when the previous one was shown.
+        self.frame_stats.record_frame(now, self._movie_due or now)
+        self._movie_due = now + max(self.movie.nextFrameDelay(), 0) / 1000
 
     def _build_ui(self) -> None:
         self.layout = QVBoxLayout(self)
@@ -66,15 +224,9 @@ class CatWidget(QWidget):
         self.image_label.setStyleSheet("background: transparent;")
         self.image_label.setScaledContents(True)
         self.image_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        self.image_label.installEventFilter(self)
         self.content_layout.addWidget(self.image_label)
 
-        # Video display
-        self.video_widget = QVideoWidget(self)
-        self.video_widget.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        self.video_widget.setStyleSheet("background: transparent;")
-        self.video_widget.installEventFilter(self)
-        self.content_layout.addWidget(self.video_widget)
-
         self.layout.addWidget(self.content_widget)
 
         # Size grip for resizing
@@ -137,9 +289,98 @@ class CatWidget(QWidget):
         self.size_grip.raise_()
         if self.notice_button:
             self.notice_button.raise_()
+        if self._hud is not None:
+            self._hud.raise_()
 
     def load_asset(self, asset: AssetDescriptor) -> None:
+        """Switch to ``asset`` without decoding on the UI thread.
+
+        A pooled GIF is swapped in at once. Otherwise the file is decoded on
+        the pool thread while the current asset keeps playing, and swapped in
+        when it lands; a newer call cancels a load still in flight. The first
+        asset (nothing on screen yet) and video, which QMediaPlayer already
+        opens asynchronously, are applied directly.
+        """
+        self._load_generation += 1
+        self._cancel_pending_load()
+        if asset.media_type == "gif":
+            animation = self.animation_pool.get(asset.path, self._decode_size(asset))
+            if animation is not None:
+                self._swap_in(asset, animation)
+                return
+        if not self._has_shown or asset.media_type == "video":
+            self._apply_asset(asset)
+            return
+        if asset.media_type == "gif":
+            size = self._decode_size(asset)
+            self._pending_load = _PendingLoad(self._load_generation, asset, AnimationPool.key(asset.path, size))
+            self.animation_pool.warm([(asset.path, size)], cancellable=True)
+        else:
+            self._pending_load = _PendingLoad(self._load_generation, asset, (asset.path, 0, 0))
+            self.animation_pool.decode_still(asset.path)
+
+    def is_loading(self) -> bool:
+        return self._pending_load is not None
+
+    def _cancel_pending_load(self) -> None:
+        pending, self._pending_load = self._pending_load, None
+        if pending is None:
+            return
+        if pending.asset.media_type == "gif":
+            self.animation_pool.cancel(pending.asset.path, QSize(pending.key[1], pending.key[2]))
+        else:
+            self.animation_pool.cancel_still(pending.asset.path)
+
+    def _take_pending(self, key: AnimationKey) -> Optional[_PendingLoad]:
+        pending = self._pending_load
+        if pending is None or pending.key != key or pending.generation != self._load_generation:
+            return None
+        self._pending_load = None
+        return pending
+
+    def _on_still_ready(self, path: Path, image: QImage) -> None:
+        pending = self._take_pending((Path(path), 0, 0))
+        if pending is None:
+            return
+        self._reset_content(pending.asset)
+        self._set_self_painted(False)
+        self._source_pixmap = QPixmap.fromImage(image)
+        self.image_label.setMovie(None)
+        self._update_scaled_media(smooth=True)
+        self.content_layout.setCurrentWidget(self.image_label)
+
+    def _on_load_failed(self, path: Path, error: str) -> None:
+        pending = self._pending_load
+        if pending is None or pending.asset.path != Path(path):
+            return
+        # Fall back to the direct path, which shows whatever Qt manages to read (as before async loading).
+        self._pending_load = None
+        self._apply_asset(pending.asset)
+
+    def _swap_in(self, asset: AssetDescriptor, animation: Animation) -> None:
+        """Show a decoded animation: a pointer swap, no file access."""
+        fade_from = self._fade_snapshot()
+        self._reset_content(asset)
+        self.content_layout.setCurrentWidget(self.image_label)
+        self.player.play(animation)
+        self._start_crossfade(fade_from)
+        if animation.key != AnimationPool.key(asset.path, self._decode_size()):
+            self._retarget_animation()  # resized while it was decoding
+
+    def _reset_content(self, asset: AssetDescriptor) -> None:
         self.asset = asset
+        self._has_shown = True
+        self._source_pixmap = None
+        self._scaled_stills.clear()
+        self._stop_video()
+        self._stop_gif()
+
+    def _apply_asset(self, asset: AssetDescriptor) -> None:
+        """Open ``asset`` synchronously on the UI thread."""
+        self.asset = asset
+        self._has_shown = True
+        self._source_pixmap = None
+        self._scaled_stills.clear()
         if asset.media_type == "video":
             self._show_video(asset.path)
         else:
@@ -148,34 +389,185 @@ class CatWidget(QWidget):
     def _show_image_or_gif(self, path: Path, media_type: str) -> None:
         self._stop_video()
         if media_type == "gif":
+            animation = self.animation_pool.get(path, self._decode_size())
+            if animation is not None:
+                self._swap_in(self.asset, animation)
+                return
+            self._stop_gif()
+            self._set_self_painted(False)
             self.movie = QMovie(str(path))
-            self.movie.setCacheMode(QMovie.CacheMode.CacheAll)
-            self.movie.setScaledSize(self.size())
+            self.movie.setCacheMode(self._gif_cache_mode())
+            self.movie.setScaledSize(self._display_size())
+            self._movie_due = 0.0
+            self.movie.frameChanged.connect(self._on_movie_frame)  # returns at once unless stats are on
             self.image_label.setMovie(self.movie)
             self.movie.start()
+            self.movie.setPaused(self._playback_paused)
+            self.animation_pool.warm([(path, self._decode_size())])
         else:
-            pixmap = QPixmap(str(path))
-            self.image_label.setPixmap(pixmap)
+            self._stop_gif()
+            self._set_self_painted(False)
+            self._source_pixmap = QPixmap(str(path))
             self.image_label.setMovie(None)
-            self._update_scaled_media()
+            self._update_scaled_media(smooth=True)
 
         self.content_layout.setCurrentWidget(self.image_label)
 
+    def _ensure_video_widget(self) -> QVideoWidget:
+        if self.video_widget is None:
+            from PyQt6.QtMultimediaWidgets import QVideoWidget
+
+            self.video_widget = QVideoWidget(self)
+            self.video_widget.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+            self.video_widget.setStyleSheet("background: transparent;")
+            self.video_widget.installEventFilter(self)
+            self.content_layout.addWidget(self.video_widget)
+            self._raise_controls()
+        return self.video_widget
+
     def _show_video(self, path: Path) -> None:
         self._stop_gif()
+        self._set_self_painted(False)
+        self._ensure_video_widget()
         if not self.media_player:
+            from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
+
             self.media_player = QMediaPlayer(self)
             self.audio_output = QAudioOutput(self)
             self.media_player.setAudioOutput(self.audio_output)
             self.media_player.setVideoOutput(self.video_widget)
 
         self.media_player.setSource(QUrl.fromLocalFile(str(path)))
-        loops_value = getattr(QMediaPlayer.Loops, "Infinite", 0)
+        loops_value = getattr(type(self.media_player).Loops, "Infinite", 0)
         self.media_player.setLoops(loops_value)
         self.content_layout.setCurrentWidget(self.video_widget)
-        self.media_player.play()
+        if not self._playback_paused:
+            self.media_player.play()
+
+    def preload(self, assets: Iterable[AssetDescriptor]) -> None:
+        """Decode these GIFs into the animation pool in the background."""
+        self.animation_pool.warm((a.path, self._decode_size(a)) for a in assets if a.media_type == "gif")
+
+    def _on_animation_ready(self, animation: Animation) -> None:
+        if self.frame_stats is not None:
+            self.frame_stats.record_decode(animation.decode_ms)
+        pending = self._take_pending(animation.key)
+        if pending is not None:
+            self._swap_in(pending.asset, animation)
+            return
+        # Hand the current asset over to frames decoded for the current size, from QMovie or an older size.
+        if animation.key != AnimationPool.key(self.asset.path, self._decode_size()):
+            return
+        if self.movie is not None:
+            frame = self.movie.currentFrameNumber()
+        elif self.player.animation is not None and self.player.animation.path == animation.path:
+            if self.player.animation.key == animation.key:
+                return
+            frame = self.player.index
+        else:
+            return
+        self._stop_gif()
+        self.player.play(animation, start_frame=max(frame, 0))
+
+    def set_playback(self, paused: bool, max_fps: float = 0.0) -> None:
+        """Pause animation, or cap pooled GIFs at ``max_fps`` (0 = native rate). Used by PlaybackGovernor."""
+        self.player.set_max_fps(max_fps)
+        if paused == self._playback_paused:
+            return
+        self._playback_paused = paused
+        if self.frame_stats is not None:
+            self.frame_stats.restart_timing()
+        if paused:
+            self.player.pause()
+        else:
+            self.player.resume()
+        if self.movie:
+            self.movie.setPaused(paused)
+        if self.media_player and self.asset.media_type == "video":
+            if paused:
+                self.media_player.pause()
+            else:
+                self.media_player.play()
+
+    def _note_frame_cost(self, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.frame_cost_ms = elapsed_ms if not self.frame_cost_ms else self.frame_cost_ms * 0.9 + elapsed_ms * 0.1
+        if self.frame_stats is not None:
+            self.frame_stats.record_paint(elapsed_ms)
+
+    def _show_frame(self, index: int) -> None:
+        if self.frame_stats is not None:
+            self.frame_stats.record_frame(time.perf_counter(), self.player.frame_due, self.player.last_dropped)
+        if self.render_mode == "atlas":
+            self._set_self_painted(True)
+            self.update(self._frame_rect())
+        else:
+            started = time.perf_counter()
+            self.image_label.setPixmap(self.player.animation.frame(index))
+            self._note_frame_cost(started)
+
+    def _fade_snapshot(self) -> Optional[Tuple[QImage, QRect, QRect]]:
+        if self.crossfade_ms <= 0 or not self._self_painted or self.player.animation is None:
+            return None
+        image, source = self.player.animation.source(self.player.index)
+        return image, QRect(source), self._frame_rect()
+
+    def _start_crossfade(self, fade_from: Optional[Tuple[QImage, QRect, QRect]]) -> None:
+        if fade_from is None or self.render_mode != "atlas":
+            return
+        self._fade_from = fade_from
+        self._fade_started = time.perf_counter()
+        self._fade_timer.start()
+
+    def _fade_progress(self) -> float:
+        return min(1.0, (time.perf_counter() - self._fade_started) * 1000 / max(self.crossfade_ms, 1))
+
+    def _on_fade_tick(self) -> None:
+        if self._fade_from is None or self._fade_progress() >= 1.0:
+            self._fade_from = None
+            self._fade_timer.stop()
+        self.update()
+
+    def _set_self_painted(self, enabled: bool) -> None:
+        # Child widgets are only needed for QMovie, stills and video; pooled GIFs are painted in paintEvent.
+        if enabled == self._self_painted:
+            return
+        self._self_painted = enabled
+        self.content_widget.setVisible(not enabled)
+        self.drag_overlay.setVisible(not enabled)
+        if enabled:
+            self.image_label.clear()
+        self.update()
+
+    def _frame_rect(self) -> QRect:
+        rect = QRect(QPoint(0, 0), self._display_size())
+        rect.moveCenter(self.rect().center())
+        return rect
+
+    def paintEvent(self, event) -> None:  # noqa: N802
+        animation = self.player.animation
+        if not self._self_painted or animation is None:
+            super().paintEvent(event)
+            return
+        started = time.perf_counter()
+        image, source = animation.source(self.player.index)
+        painter = QPainter(self)
+        fade = self._fade_progress() if self._fade_from is not None else 1.0
+        if fade < 1.0:
+            old_image, old_source, old_target = self._fade_from
+            painter.setOpacity(1.0 - fade)
+            painter.drawImage(old_target, old_image, old_source)
+            painter.setOpacity(fade)
+        # Frames match the target except mid-resize, where a fast stretch is fine until the re-decode lands.
+        painter.drawImage(self._frame_rect(), image, source)
+        painter.end()
+        self._note_frame_cost(started)
+        if self._first_frame_pending:
+            self._first_frame_pending = False
+            QTimer.singleShot(0, self.first_frame_shown.emit)
 
     def _stop_gif(self) -> None:
+        self.player.stop()
         if self.movie:
             self.movie.stop()
             self.movie = None
@@ -214,23 +606,62 @@ class CatWidget(QWidget):
         super().mouseReleaseEvent(event)
 
     def resizeEvent(self, event) -> None:
-        self._update_scaled_media()
+        self._update_scaled_media(smooth=False)
+        self._resize_settle.start()
         self._position_close_button()
         self._position_notice_button()
         self._update_drag_overlay_geometry()
         self._raise_controls()
         super().resizeEvent(event)
 
-    def _update_scaled_media(self) -> None:
+    def _on_resize_settled(self) -> None:
+        self._update_scaled_media(smooth=True)
+
+    def _update_scaled_media(self, smooth: bool) -> None:
+        """Rescale for the current size; ``smooth=False`` is the cheap path used while a resize is in progress."""
         if self.movie:
-            self.movie.setScaledSize(self.size())
+            # A new scaled size makes QMovie re-decode; until the drag settles image_label stretches the old frames.
+            if smooth:
+                self.movie.setScaledSize(self._display_size())
+        elif self.player.is_playing():
+            # Until then pooled frames are stretched at paint time; afterwards they are re-decoded from the file.
+            if smooth:
+                self._retarget_animation()
+        elif self._source_pixmap is not None and not self._source_pixmap.isNull():
+            self.image_label.setPixmap(self._scaled_still(smooth))
+
+    def _scaled_still(self, smooth: bool) -> QPixmap:
+        # Always scaled from the original file's pixmap, never from the previous result.
+        size = self.size()
+        if not smooth:
+            return self._source_pixmap.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation)
+        key = (size.width(), size.height())
+        scaled = self._scaled_stills.get(key)
+        if scaled is None:
+            scaled = self._source_pixmap.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            self._scaled_stills[key] = scaled
+            if len(self._scaled_stills) > SCALED_STILL_CACHE:
+                self._scaled_stills.popitem(last=False)
+        else:
+            self._scaled_stills.move_to_end(key)
+        return scaled
+
+    def _retarget_animation(self) -> None:
+        size = self._decode_size()
+        current = self.player.animation
+        if current is None or current.key == AnimationPool.key(current.path, size):
+            return
+        animation = self.animation_pool.get(current.path, size)
+        if animation is not None:
+            self.player.play(animation, start_frame=self.player.index)
         else:
-            pixmap = self.image_label.pixmap()
-            if pixmap:
-                scaled = pixmap.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                self.image_label.setPixmap(scaled)
+            self.animation_pool.warm([(current.path, size)])  # swapped in by _on_animation_ready
 
     def eventFilter(self, obj, event):
+        if self._first_frame_pending and event.type() == QEvent.Type.Paint and obj in (self.image_label, self.video_widget):
+            # Reported once the event loop returns, i.e. after this first paint has been drawn.
+            self._first_frame_pending = False
+            QTimer.singleShot(0, self.first_frame_shown.emit)
         overlay = self.drag_overlay
         if obj in (self.video_widget, overlay) and event.type() in (
             QEvent.Type.MouseButtonPress,
@@ -270,6 +701,7 @@ class CatWidget(QWidget):
     def closeEvent(self, event) -> None:  # noqa: N802
         self._stop_video()
         self._stop_gif()
+        self.animation_pool.shutdown()
         super().closeEvent(event)
 
     def _update_drag_overlay_geometry(self) -> None:
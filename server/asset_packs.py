@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+
+DEFAULT_ASSETS_DIR = Path(os.getenv("ASSET_PACKS_DIR", Path(__file__).resolve().parents[1] / "assets" / "cats"))
+DEFAULT_PACK_NAME = "cats"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_HASH_BLOCK = 1024 * 1024
+
+
+@dataclass
+class AssetFile:
+    path: str  # posix path relative to the pack root
+    sha256: str
+    size: int
+    mtime_ns: int
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class AssetPackIndex:
+    """Content-addressed index of an asset directory.
+
+    Files are re-hashed only when their size or mtime changes, so repeated
+    manifest requests cost one ``stat`` per file. ``blob_path`` checks the
+    file it is about to serve the same way and rescans first if it changed,
+    so a hash never maps to bytes that no longer have it.
+    """
+
+    def __init__(self, root: Path = DEFAULT_ASSETS_DIR, pack_name: str = DEFAULT_PACK_NAME) -> None:
+        self.root = Path(root)
+        self.pack_name = pack_name
+        self._files: Dict[str, AssetFile] = {}
+        self._by_hash: Dict[str, AssetFile] = {}
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def manifest(self) -> Dict[str, Any]:
+        with self._lock:
+            self._rescan()
+            if self._manifest is None:
+                self._manifest = self._build_manifest()
+            return self._manifest
+
+    def blob_path(self, sha256: str) -> Optional[Path]:
+        with self._lock:
+            if not self._files:
+                self._rescan()
+            entry = self._by_hash.get(sha256)
+            if entry is not None and not self._unchanged(entry):
+                # Replaced since indexing: the old hash may now be gone (404) or belong to another file.
+                self._rescan()
+                entry = self._by_hash.get(sha256)
+            if entry is None or not self._unchanged(entry):
+                return None
+            return self.root / entry.path
+
+    def _unchanged(self, entry: AssetFile) -> bool:
+        try:
+            st = (self.root / entry.path).stat()
+        except OSError:
+            return False
+        return st.st_size == entry.size and st.st_mtime_ns == entry.mtime_ns
+
+    def _rescan(self) -> bool:
+        seen: Dict[str, AssetFile] = {}
+        changed = False
+        if self.root.exists():
+            for path in sorted(p for p in self.root.rglob("*") if p.is_file()):
+                rel = path.relative_to(self.root).as_posix()
+                st = path.stat()
+                known = self._files.get(rel)
+                if known and known.size == st.st_size and known.mtime_ns == st.st_mtime_ns:
+                    seen[rel] = known
+                    continue
+                seen[rel] = AssetFile(path=rel, sha256=_sha256_file(path), size=st.st_size, mtime_ns=st.st_mtime_ns)
+                changed = True
+        if changed or seen.keys() != self._files.keys():
+            self._files = seen
+            self._by_hash = {f.sha256: f for f in seen.values()}
+            self._manifest = None  # a rescan from blob_path must not leave the old manifest behind
+            return True
+        return False
+
+    def _build_manifest(self) -> Dict[str, Any]:
+        files = [
+            {"path": f.path, "sha256": f.sha256, "size": f.size}
+            for f in sorted(self._files.values(), key=lambda f: f.path)
+        ]
+        version = hashlib.sha256(json.dumps(files, sort_keys=True).encode("utf-8")).hexdigest()
+        return {"pack": self.pack_name, "version": version, "files": files}
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single ``bytes=`` range into an inclusive (start, end) pair.
+
+    Returns None when the header is absent or not a byte range; raises 416 when
+    the range cannot be satisfied. Multi-range requests are not supported.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_s, _, end_s = spec.strip().partition("-")
+    try:
+        if start_s:
+            start = int(start_s)
+            end = int(end_s) if end_s else size - 1
+        else:
+            suffix = int(end_s)
+            if suffix <= 0:
+                raise ValueError
+            start = max(size - suffix, 0)
+            end = size - 1
+    except ValueError:
+        return None
+    end = min(end, size - 1)
+    if start > end or start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+def read_range(path: Path, start: int, end: int) -> bytes:
+    with path.open("rb") as f:
+        f.seek(start)
+        return f.read(end - start + 1)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+asset_index = AssetPackIndex()
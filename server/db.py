@@ -6,6 +6,7 @@ from pathlib import Path
 
 
 DEFAULT_DB_PATH = Path(os.getenv("DB_PATH", "./server_data.db"))
+DEFAULT_VTUBER_ID = "vtuber-1"
 
 
 def get_connection() -> sqlite3.Connection:
@@ -48,5 +49,27 @@ def init_db() -> None:
         );
         """
     )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_notices_vtuber_created ON notices (vtuber_id, created_at DESC)"
+    )
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'subscriptions'")
+    had_subscriptions = cur.fetchone() is not None
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS subscriptions (
+            user_id TEXT NOT NULL,
+            vtuber_id TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            PRIMARY KEY (user_id, vtuber_id),
+            FOREIGN KEY(user_id) REFERENCES users(id)
+        );
+        """
+    )
+    if not had_subscriptions:
+        # Existing users saw every notice before subscriptions existed; keep them on the default creator.
+        cur.execute(
+            "INSERT INTO subscriptions (user_id, vtuber_id, created_at) SELECT id, ?, created_at FROM users",
+            (DEFAULT_VTUBER_ID,),
+        )
     conn.commit()
     conn.close()
@@ -21,7 +21,7 @@ else:
     else:
         load_dotenv()
 
-from server.db import get_connection, init_db  # noqa: E402
+from server.db import DEFAULT_VTUBER_ID, get_connection, init_db  # noqa: E402
 from server.routes import router  # noqa: E402
 
 app = FastAPI(title="MeowBuddy API")
@@ -67,7 +67,7 @@ def _seed_notices() -> None:
             INSERT INTO notices (id, vtuber_id, title, content, created_at)
             VALUES (?, ?, ?, ?, ?)
             """,
-            (notice_id, "vtuber-1", title, content, now),
+            (notice_id, DEFAULT_VTUBER_ID, title, content, now),
         )
     conn.commit()
     conn.close()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import heapq
+import sqlite3
+import threading
+from itertools import islice, takewhile
+from typing import Any, Dict, List, Optional
+
+from server.db import get_connection
+
+
+CACHE_DEPTH = 200
+
+
+def notice_row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "vtuber_id": row["vtuber_id"],
+        "title": row["title"],
+        "content": row["content"],
+        "created_at": row["created_at"],
+    }
+
+
+class NoticeCache:
+    """Newest notices per creator, served from memory.
+
+    Each creator's list is loaded through ``idx_notices_vtuber_created`` and is
+    dropped only when that creator publishes, so other creators' lists stay warm.
+    A load that raced with ``invalidate`` is returned but not kept.
+    """
+
+    def __init__(self, depth: int = CACHE_DEPTH) -> None:
+        self.depth = depth
+        self._lists: Dict[str, List[Dict[str, Any]]] = {}
+        self._generations: Dict[str, int] = {}  # bumped by invalidate
+        self._lock = threading.Lock()
+
+    def for_vtuber(self, conn: sqlite3.Connection, vtuber_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            cached = self._lists.get(vtuber_id)
+            generation = self._generations.get(vtuber_id, 0)
+        if cached is not None:
+            return cached
+        cur = conn.cursor()
+        cur.execute(
+            """
+            SELECT id, vtuber_id, title, content, created_at
+            FROM notices
+            WHERE vtuber_id = ?
+            ORDER BY created_at DESC
+            LIMIT ?
+            """,
+            (vtuber_id, self.depth),
+        )
+        notices = [notice_row_to_dict(row) for row in cur.fetchall()]
+        with self._lock:
+            # A publish during the SELECT may have been missed; let the next reader load again.
+            if self._generations.get(vtuber_id, 0) == generation:
+                self._lists[vtuber_id] = notices
+        return notices
+
+    def invalidate(self, vtuber_id: str) -> None:
+        with self._lock:
+            self._lists.pop(vtuber_id, None)
+            self._generations[vtuber_id] = self._generations.get(vtuber_id, 0) + 1
+
+
+notice_cache = NoticeCache()
+
+
+def get_subscriptions(conn: sqlite3.Connection, user_id: str) -> List[str]:
+    cur = conn.cursor()
+    cur.execute("SELECT vtuber_id FROM subscriptions WHERE user_id = ? ORDER BY vtuber_id", (user_id,))
+    return [row["vtuber_id"] for row in cur.fetchall()]
+
+
+def list_notices_for_user(user_id: str, limit: int, since: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Merge the cached per-creator lists of the user's subscriptions, newest first.
+
+    With ``since``, only notices created at or after it are returned: another
+    notice may share the newest timestamp a client has, and callers dedupe by id.
+    """
+    conn = get_connection()
+    try:
+        lists = [notice_cache.for_vtuber(conn, vtuber_id) for vtuber_id in get_subscriptions(conn, user_id)]
+    finally:
+        conn.close()
+    merged = heapq.merge(*lists, key=lambda n: n["created_at"], reverse=True)
+    if since:
+        merged = takewhile(lambda n: n["created_at"] >= since, merged)
+    return list(islice(merged, limit))
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import json
 import uuid
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Header, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Response, status
+from fastapi.responses import FileResponse
 
+from server.asset_packs import IMMUTABLE_CACHE_CONTROL, asset_index, etag_matches, parse_range, read_range
 from server.auth import create_token, get_current_user
-from server.db import get_connection
+from server.db import DEFAULT_VTUBER_ID, get_connection
 from server.models import User
+from server.notices import CACHE_DEPTH, get_subscriptions, list_notices_for_user, notice_cache
 import os
 
 def _admin_secret() -> str:
@@ -36,6 +40,10 @@ def login(payload: Dict[str, str]):
             "INSERT INTO users (id, email, created_at) VALUES (?, ?, ?)",
             (user_id, email, now),
         )
+        cur.execute(
+            "INSERT INTO subscriptions (user_id, vtuber_id, created_at) VALUES (?, ?, ?)",
+            (user_id, DEFAULT_VTUBER_ID, now),
+        )
         conn.commit()
     conn.close()
 
@@ -52,23 +60,52 @@ def me(current_user: User = Depends(get_current_user)):
 
 
 @router.get("/notices")
-def list_notices(current_user: User = Depends(get_current_user)):
+def list_notices(
+    limit: int = Query(50, ge=1, le=CACHE_DEPTH),
+    since: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+):
+    return list_notices_for_user(current_user.id, limit, since)
+
+
+@router.get("/subscriptions")
+def list_subscriptions(current_user: User = Depends(get_current_user)):
+    conn = get_connection()
+    try:
+        return {"vtuber_ids": get_subscriptions(conn, current_user.id)}
+    finally:
+        conn.close()
+
+
+@router.post("/subscriptions")
+def subscribe(payload: Dict[str, str], current_user: User = Depends(get_current_user)):
+    vtuber_id = (payload.get("vtuber_id") or "").strip()
+    if not vtuber_id:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="vtuber_id is required")
     conn = get_connection()
     try:
         cur = conn.cursor()
         cur.execute(
-            "SELECT id, title, content, created_at FROM notices ORDER BY created_at DESC"
+            "INSERT OR IGNORE INTO subscriptions (user_id, vtuber_id, created_at) VALUES (?, ?, ?)",
+            (current_user.id, vtuber_id, datetime.utcnow().isoformat()),
         )
-        rows = cur.fetchall()
-        return [
-            {
-                "id": row["id"],
-                "title": row["title"],
-                "content": row["content"],
-                "created_at": row["created_at"],
-            }
-            for row in rows
-        ]
+        conn.commit()
+        return {"vtuber_ids": get_subscriptions(conn, current_user.id)}
+    finally:
+        conn.close()
+
+
+@router.delete("/subscriptions/{vtuber_id}")
+def unsubscribe(vtuber_id: str, current_user: User = Depends(get_current_user)):
+    conn = get_connection()
+    try:
+        cur = conn.cursor()
+        cur.execute(
+            "DELETE FROM subscriptions WHERE user_id = ? AND vtuber_id = ?",
+            (current_user.id, vtuber_id),
+        )
+        conn.commit()
+        return {"vtuber_ids": get_subscriptions(conn, current_user.id)}
     finally:
         conn.close()
 
@@ -94,7 +131,7 @@ def admin_create_notice(
         cur = conn.cursor()
         notice_id = str(uuid.uuid4())
         now = datetime.utcnow().isoformat()
-        vtuber_id = payload.get("vtuber_id") or "vtuber-1"
+        vtuber_id = payload.get("vtuber_id") or DEFAULT_VTUBER_ID
         cur.execute(
             """
             INSERT INTO notices (id, vtuber_id, title, content, created_at)
@@ -103,7 +140,8 @@ def admin_create_notice(
             (notice_id, vtuber_id, title, content, now),
         )
         conn.commit()
-        return {"id": notice_id, "title": title, "content": content, "created_at": now}
+        notice_cache.invalidate(vtuber_id)
+        return {"id": notice_id, "vtuber_id": vtuber_id, "title": title, "content": content, "created_at": now}
     finally:
         conn.close()
 
@@ -142,7 +180,7 @@ def create_notice(payload: Dict[str, str]):
         cur = conn.cursor()
         notice_id = str(uuid.uuid4())
         now = datetime.utcnow().isoformat()
-        vtuber_id = payload.get("vtuber_id") or "vtuber-1"
+        vtuber_id = payload.get("vtuber_id") or DEFAULT_VTUBER_ID
         cur.execute(
             """
             INSERT INTO notices (id, vtuber_id, title, content, created_at)
@@ -151,6 +189,45 @@ def create_notice(payload: Dict[str, str]):
             (notice_id, vtuber_id, title, content, now),
         )
         conn.commit()
-        return {"id": notice_id, "created_at": now}
+        notice_cache.invalidate(vtuber_id)
+        return {"id": notice_id, "vtuber_id": vtuber_id, "created_at": now}
     finally:
         conn.close()
+
+
+@router.get("/assets/manifest")
+def asset_manifest(if_none_match: str = Header(None)):
+    manifest = asset_index.manifest()
+    etag = f'"{manifest["version"]}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=json.dumps(manifest), media_type="application/json", headers=headers)
+
+
+@router.get("/assets/blobs/{sha256}")
+def asset_blob(
+    sha256: str,
+    range: str = Header(None),
+    if_none_match: str = Header(None),
+):
+    path = asset_index.blob_path(sha256.lower())
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found")
+    etag = f'"{sha256.lower()}"'
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL, "Accept-Ranges": "bytes"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    size = path.stat().st_size
+    byte_range = parse_range(range, size)
+    if byte_range is None:
+        return FileResponse(path, media_type="application/octet-stream", headers=headers)
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return Response(
+        content=read_range(path, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type="application/octet-stream",
+        headers=headers,
+    )
@@ -0,0 +1,80 @@
+"""
+Benchmark of CatWidget category switches with and without the animation pool.
+
+Cycles ``load_asset`` through the coding/youtube/music assets (the same
+rotation ContextManager produces when the foreground app changes) and times
+each call, first with an empty pool (QMovie opens and decodes the file, as
+before the pool existed) and then after ``preload`` has warmed it.
+
+Usage:
+    python tools/bench_animation_pool.py --switches 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from desktopcat.core.asset_manager import AssetManager  # noqa: E402
+
+CATEGORIES = ("coding", "youtube", "music")
+
+
+def _time_switches(widget, assets, switches: int) -> list:
+    samples = []
+    for i in range(switches):
+        asset = assets[i % len(assets)]
+        start = time.perf_counter()
+        widget.load_asset(asset)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label: str, samples: list) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label:<28} median {statistics.median(samples):7.3f} ms   p95 {p95:7.3f} ms   max {max(samples):7.3f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark category switching.")
+    parser.add_argument("--switches", type=int, default=60)
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication
+
+    from desktopcat.ui.animation import AnimationPool
+    from desktopcat.ui.widget import CatWidget
+
+    app = QApplication(sys.argv)
+    manager = AssetManager()
+    assets = [manager.resolve_asset(category=c) for c in CATEGORIES]
+
+    # Budget 0: nothing is ever pooled, every switch takes the QMovie path.
+    cold = CatWidget(assets[0], animation_pool=AnimationPool(budget_bytes=0))
+    cold.show()
+    _report("QMovie per switch (old)", _time_switches(cold, assets, args.switches))
+    cold.close()
+
+    pool = AnimationPool()
+    warm = CatWidget(assets[0], animation_pool=pool)
+    warm.show()
+    start = time.perf_counter()
+    warm.preload(assets)
+    while pool.has_pending():
+        app.processEvents()
+        time.sleep(0.001)
+    print(f"background warm-up           {(time.perf_counter() - start) * 1000:7.1f} ms  ({pool.used_bytes / 1e6:.1f} MB pooled)")
+    _report("pooled switch", _time_switches(warm, assets, args.switches))
+    warm.close()
+
+
+if __name__ == "__main__":
+    main()
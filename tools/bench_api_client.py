@@ -0,0 +1,90 @@
+"""
+Per-request latency of notice polling with and without the pooled session.
+
+Starts a local HTTP/1.1 keep-alive stand-in for ``GET /notices`` and polls it
+with one-shot ``requests.get`` calls (new TCP connection each time) and with
+``ApiClient`` on its shared pooled session.
+
+Usage:
+    python tools/bench_api_client.py --requests 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, List
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+_BODY = json.dumps(
+    [{"id": "n1", "vtuber_id": "vtuber-1", "title": "방송 공지", "content": "오늘 밤 8시", "created_at": "2024-01-01T00:00:00"}]
+).encode("utf-8")
+
+
+class _NoticeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this Nagle + delayed ACK adds ~40 ms per keep-alive request.
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, format, *args) -> None:  # noqa: A002
+        pass
+
+
+def _measure(fn: Callable[[], object], count: int) -> List[float]:
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label: str, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{label:<12} mean={statistics.mean(samples):7.3f} ms  p50={statistics.median(samples):7.3f} ms  p95={p95:7.3f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs unpooled notice polling.")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per mode.")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _NoticeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ["MEOWBUDDY_API_BASE"] = base_url
+
+    from app.api_client import ApiClient
+
+    client = ApiClient(token="bench")
+    unpooled = _measure(lambda: requests.get(f"{base_url}/notices", timeout=10).json(), args.requests)
+    client.get_notices()  # open the pooled connection once
+    pooled = _measure(client.get_notices, args.requests)
+    server.shutdown()
+
+    print(f"{args.requests} requests per mode against {base_url}")
+    _report("unpooled", unpooled)
+    _report("pooled", pooled)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Micro-benchmark of category -> asset resolution.
+
+Builds a temporary asset tree (``--folders`` folders of ``--files`` files),
+then compares the previous per-call directory listing with AssetManager's
+catalog-backed lookup while rotating through categories the way
+ContextManager does. Also reports the cost of an mtime refresh with nothing
+changed, and how long the QFileSystemWatcher takes to pick up a new file.
+
+Usage:
+    python tools/bench_asset_catalog.py --folders 8 --files 40 --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from desktopcat.core.asset_catalog import SUPPORTED_MEDIA_TYPES  # noqa: E402
+from desktopcat.core.asset_manager import AssetDescriptor, AssetManager  # noqa: E402
+from desktopcat.core.config_loader import ConfigLoader  # noqa: E402
+
+
+def _legacy_resolve(assets_base: Path, category: str, entry: dict) -> AssetDescriptor:
+    """AssetManager._resolve_from_entry before the catalog."""
+    folder_path = assets_base / entry["folder"]
+    if not folder_path.exists():
+        raise FileNotFoundError(folder_path)
+    files = sorted([p for p in folder_path.iterdir() if p.is_file() and p.suffix.lower() in SUPPORTED_MEDIA_TYPES])
+    selected = files[0]
+    return AssetDescriptor(path=selected, media_type=SUPPORTED_MEDIA_TYPES[selected.suffix.lower()], category=category)
+
+
+def _build_tree(root: Path, folders: int, files: int) -> Path:
+    base = root / "cats"
+    categories = {}
+    for f in range(folders):
+        folder = base / f"cat{f}"
+        folder.mkdir(parents=True)
+        for i in range(files):
+            (folder / f"frame{i:03d}{'.gif' if i % 2 else '.txt'}").write_bytes(b"x")
+        categories[f"category{f}"] = {"folder": f"cat{f}", "preferred_file": ""}
+    config = {"assets_base": str(base), "default_category": "category0", "categories": categories}
+    path = root / "asset_mapping.json"
+    path.write_text(json.dumps(config), encoding="utf-8")
+    return path
+
+
+def _report(label: str, seconds: float, iterations: int) -> None:
+    print(f"{label:<32} {seconds / iterations * 1e6:9.3f} us/call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark asset resolution.")
+    parser.add_argument("--folders", type=int, default=8)
+    parser.add_argument("--files", type=int, default=40)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    from PyQt6.QtCore import QCoreApplication
+
+    app = QCoreApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        loader = ConfigLoader(_build_tree(Path(tmp), args.folders, args.files))
+        manager = AssetManager(loader, watch=True)
+        base = loader.get_assets_base()
+        categories = [f"category{f}" for f in range(args.folders)]
+        rotation = {"i": 0}
+
+        def next_category() -> str:
+            rotation["i"] += 1
+            return categories[rotation["i"] % len(categories)]
+
+        def legacy() -> AssetDescriptor:
+            category = next_category()
+            return _legacy_resolve(base, category, loader.get_category_entry(category))
+
+        print(f"{args.folders} folders x {args.files} files")
+        _report("iterdir + sort per call (old)", timeit.timeit(legacy, number=n), n)
+        _report("AssetManager.resolve_asset", timeit.timeit(lambda: manager.resolve_asset(next_category()), number=n), n)
+        _report("catalog.refresh (unchanged)", timeit.timeit(manager.catalog.refresh, number=max(n // 20, 1)), max(n // 20, 1))
+
+        version = manager.catalog.version
+        start = time.perf_counter()
+        (base / "cat0" / "aaa_new.gif").write_bytes(b"x")
+        while manager.catalog.version == version and time.perf_counter() - start < 5:
+            app.processEvents()
+            time.sleep(0.001)
+        picked = manager.resolve_asset("category0").path.name
+        print(f"watcher picked up new file in {(time.perf_counter() - start) * 1000:.1f} ms -> {picked}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+UI-thread hitches while CatWidget switches to an asset that is not decoded yet.
+
+A 4 ms heartbeat timer runs on the UI thread; the gaps between its ticks
+show how long the event loop was blocked (a dragged cat stutters for the
+same time). Each round empties the pool and switches between two GIFs:
+
+- sync: the previous path, QMovie opened and decoded on the UI thread
+- async: load_asset, decoded on the pool thread and swapped in when ready
+
+Usage:
+    python tools/bench_async_load.py --rounds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from desktopcat.core.asset_manager import AssetDescriptor, AssetManager  # noqa: E402
+
+HEARTBEAT_MS = 4
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark asynchronous asset loading.")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--window-ms", type=int, default=800, help="how long to watch after each switch")
+    args = parser.parse_args()
+
+    from PyQt6.QtCore import QEventLoop, QTimer
+    from PyQt6.QtWidgets import QApplication
+
+    from desktopcat.ui.animation import AnimationPool
+    from desktopcat.ui.widget import CatWidget
+
+    app = QApplication(sys.argv)
+    manager = AssetManager()
+    base = manager.catalog.assets_base
+    gifs = [
+        AssetDescriptor(path=path, media_type="gif", category=path.parent.name)
+        for path in sorted(base.rglob("*.gif"))
+    ]
+
+    def measure(widget: CatWidget, switch) -> tuple:
+        gaps, swap_ms = [], []
+        for i in range(args.rounds):
+            widget.animation_pool.clear()
+            asset = gifs[i % len(gifs)]
+            ticks = [time.perf_counter()]
+            heartbeat = QTimer()
+            heartbeat.timeout.connect(lambda: ticks.append(time.perf_counter()))
+            heartbeat.start(HEARTBEAT_MS)
+            start = time.perf_counter()
+            switch(widget, asset)
+            shown = None
+            while time.perf_counter() - start < args.window_ms / 1000:
+                app.processEvents(QEventLoop.ProcessEventsFlag.WaitForMoreEvents, HEARTBEAT_MS)
+                if shown is None and widget.asset.path == asset.path and not widget.is_loading():
+                    shown = time.perf_counter()
+            heartbeat.stop()
+            gaps.append(max(b - a for a, b in zip(ticks, ticks[1:])) * 1000)
+            swap_ms.append(((shown or time.perf_counter()) - start) * 1000)
+        return gaps, swap_ms
+
+    def report(label: str, gaps: list, swap_ms: list) -> None:
+        print(
+            f"{label:<6} worst UI stall median {statistics.median(gaps):6.1f} ms  max {max(gaps):6.1f} ms   "
+            f"new asset on screen after {statistics.median(swap_ms):6.1f} ms"
+        )
+
+    widget = CatWidget(gifs[-1], animation_pool=AnimationPool(budget_bytes=0))
+    widget.show()
+    report("sync", *measure(widget, lambda w, a: w._apply_asset(a)))
+    widget.close()
+
+    widget = CatWidget(gifs[-1])
+    widget.show()
+    report("async", *measure(widget, lambda w, a: w.load_asset(a)))
+    widget.close()
+
+
+if __name__ == "__main__":
+    main()
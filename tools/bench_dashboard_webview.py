@@ -0,0 +1,190 @@
+"""
+Compare DashboardWindow web view modes (eager / lazy / prewarm).
+
+Each mode runs in a fresh subprocess with the Qt offscreen platform and a
+throwaway app data dir. Reports the time to construct the window, resident
+memory of the app plus its QtWebEngine helper processes at startup, the time
+from opening the dashboard to the page's loadFinished, and resident memory
+once the window has been closed for the teardown period. ``prewarm-unopened``
+pre-warms and never opens the dashboard, to check that the idle view is torn
+down as well. ``--teardown`` must exceed the 2 s startup settle, or the
+pre-warmed view is gone before it is opened.
+
+Linux only (reads /proc). Not yet run against a QtWebEngine build.
+
+Usage:
+    python tools/bench_dashboard_webview.py --teardown 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+MODES = ("eager", "lazy", "prewarm", "prewarm-unopened")
+STARTUP_SETTLE_S = 2.0
+PAGE = "<!doctype html><html><body><h1>MeowBuddy</h1><script>document.title = 'ok';</script></body></html>"
+
+
+def _tree_rss_mb(pid: int) -> float:
+    """Resident memory of ``pid`` and all of its descendants (Linux /proc)."""
+    children = {}
+    for entry in Path("/proc").iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry.name))
+
+    total_kb, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, []))
+        try:
+            for line in Path(f"/proc/{current}/status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total_kb += int(line.split()[1])
+        except OSError:
+            pass
+    return total_kb / 1024
+
+
+def child(mode: str, teardown_s: float) -> None:
+    sys.path.insert(0, str(ROOT))
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    from app import dashboard as dashboard_module
+    from app.dashboard import DashboardWindow
+
+    if dashboard_module.QWebEngineView is None:
+        print(json.dumps({"error": f"QtWebEngine unavailable: {dashboard_module._WEBENGINE_IMPORT_ERROR}"}))
+        return
+
+    def settle(seconds: float) -> None:
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            app.processEvents()
+            time.sleep(0.01)
+
+    def wait_loaded(view, timeout: float = 20.0) -> None:
+        done = {"ok": False}
+        view.loadFinished.connect(lambda ok: done.update(ok=True))
+        deadline = time.perf_counter() + timeout
+        while not done["ok"] and time.perf_counter() < deadline:
+            app.processEvents()
+            time.sleep(0.001)
+
+    prewarm = mode.startswith("prewarm")
+    start = time.perf_counter()
+    dashboard = DashboardWindow(web_view_mode="prewarm" if prewarm else mode, teardown_s=teardown_s)
+    app.processEvents()
+    construct_ms = (time.perf_counter() - start) * 1000
+    # Pretend the user is logged in so opening goes straight to the web view.
+    dashboard.login_panel.setVisible(False)
+    dashboard.web_container.setVisible(True)
+    if prewarm:
+        dashboard.prewarm()
+        wait_loaded(dashboard.web_view)
+    settle(STARTUP_SETTLE_S)
+    startup_rss = _tree_rss_mb(os.getpid())
+
+    if mode == "prewarm-unopened":
+        settle(teardown_s + 2.0)
+        closed_rss = _tree_rss_mb(os.getpid())
+        print(
+            json.dumps(
+                {
+                    "construct_ms": construct_ms,
+                    "startup_rss": startup_rss,
+                    "open_ms": 0.0,
+                    "open_rss": 0.0,
+                    "closed_rss": closed_rss,
+                    "torn_down": dashboard.web_view is None,
+                }
+            )
+        )
+        return
+
+    prewarmed = dashboard.web_view
+    start = time.perf_counter()
+    dashboard.show()
+    dashboard.open_home()
+    if dashboard.web_view is not prewarmed or prewarmed is None:
+        wait_loaded(dashboard.web_view)
+    open_ms = (time.perf_counter() - start) * 1000
+    settle(1.0)
+    open_rss = _tree_rss_mb(os.getpid())
+
+    dashboard.close()
+    settle(teardown_s + 2.0)
+    closed_rss = _tree_rss_mb(os.getpid())
+    print(
+        json.dumps(
+            {
+                "construct_ms": construct_ms,
+                "startup_rss": startup_rss,
+                "open_ms": open_ms,
+                "open_rss": open_rss,
+                "closed_rss": closed_rss,
+                "torn_down": dashboard.web_view is None,
+            }
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark dashboard web view creation modes.")
+    parser.add_argument("--teardown", type=float, default=5.0, help="seconds closed before teardown")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.teardown)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        page = Path(tmp) / "index.html"
+        page.write_text(PAGE, encoding="utf-8")
+        env = dict(
+            os.environ,
+            QT_QPA_PLATFORM="offscreen",
+            MEOWBUDDY_HOME=str(Path(tmp) / "home"),
+            MEOWBUDDY_DASHBOARD_URL=page.as_uri(),
+            QTWEBENGINE_CHROMIUM_FLAGS=os.environ.get("QTWEBENGINE_CHROMIUM_FLAGS", "--no-sandbox"),
+        )
+        print(f"{'mode':<16} {'construct':>10} {'startup RSS':>12} {'open->loaded':>13} {'open RSS':>9} {'closed RSS':>11}")
+        for mode in MODES:
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", mode, "--teardown", str(args.teardown)],
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
+            lines = [line for line in out.stdout.splitlines() if line.startswith("{")]
+            if not lines:
+                print(f"{mode:<16} failed: {out.stderr.strip()[-400:]}")
+                continue
+            r = json.loads(lines[-1])
+            if "error" in r:
+                print(f"{mode:<16} skipped: {r['error']}")
+                continue
+            print(
+                f"{mode:<16} {r['construct_ms']:8.1f}ms {r['startup_rss']:10.1f}MB {r['open_ms']:11.1f}ms "
+                f"{r['open_rss']:7.1f}MB {r['closed_rss']:9.1f}MB{'' if r['torn_down'] else '  (kept)'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Resident frame memory per animation: source resolution vs decode-time downscaling.
+
+For each GIF under the asset folders, reports the bytes QMovie's CacheAll
+held (every frame at source size) against the AnimationPool entry decoded
+at the widget's display size in premultiplied ARGB32. With ``--budget-mb``
+below an animation's size, the pool falls back to streaming and the script
+reports the resident bytes and UI-thread decode time per frame instead.
+
+Usage:
+    python tools/bench_frame_memory.py --size 260 --budget-mb 48
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from desktopcat.core.config_loader import ConfigLoader  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure decoded frame memory.")
+    parser.add_argument("--size", type=int, default=260, help="widget box in pixels")
+    parser.add_argument("--budget-mb", type=float, default=48, help="per-animation frame budget")
+    args = parser.parse_args()
+
+    from PyQt6.QtCore import QSize
+    from PyQt6.QtGui import QImageReader
+    from PyQt6.QtWidgets import QApplication
+
+    from desktopcat.ui.animation import AnimationPool, StreamingAnimation
+
+    app = QApplication(sys.argv)
+    pool = AnimationPool(budget_bytes=1 << 40, frame_budget_bytes=int(args.budget_mb * 1024 * 1024))
+    box = QSize(args.size, args.size)
+    gifs = sorted(ConfigLoader().get_assets_base().rglob("*.gif"))
+    pool.warm((path, box) for path in gifs)
+    while pool.has_pending():
+        app.processEvents()
+        time.sleep(0.001)
+
+    print(f"{'asset':<28} {'source':>10} {'CacheAll':>10} {'pooled':>10} {'ratio':>6}")
+    for path in gifs:
+        reader = QImageReader(str(path))
+        source = reader.size()
+        frames = reader.imageCount()
+        old = source.width() * source.height() * 4 * frames
+        animation = pool.get(path, box)
+        if isinstance(animation, StreamingAnimation):
+            samples = []
+            for i in range(animation.frame_count * 2):
+                start = time.perf_counter()
+                animation.frame(i % animation.frame_count)
+                samples.append((time.perf_counter() - start) * 1000)
+            print(
+                f"{path.name:<28} {source.width():>4}x{source.height():<5} {old / 1e6:8.1f}MB "
+                f"{animation.nbytes / 1e6:8.2f}MB streaming, {statistics.median(samples):.2f} ms/frame"
+            )
+            continue
+        new = animation.nbytes
+        print(
+            f"{path.name:<28} {source.width():>4}x{source.height():<5} {old / 1e6:8.1f}MB "
+            f"{new / 1e6:8.1f}MB {old / new:5.2f}x  ({animation.size.width()}x{animation.size.height()} box)"
+        )
+
+
+if __name__ == "__main__":
+    main()
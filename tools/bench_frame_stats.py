@@ -0,0 +1,117 @@
+"""
+Overhead of CatWidget's frame timing, and a check that it sees stalls.
+
+Steps a pooled GIF (atlas mode) at ``--fps`` with every frame repainted
+synchronously and reports the median/p95 time per frame and process CPU:
+
+- off:   frame_stats disabled (the default)
+- stats: enable_frame_stats() (Python API / log only)
+- hud:   set_hud_visible(True), the tray's "Show Frame Stats"
+
+Then plays the GIF in real time while blocking the UI thread for
+``--stall-ms`` every second, and prints what the stats recorded.
+
+Usage:
+    python tools/bench_frame_stats.py --fps 60 --seconds 3 --stall-ms 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from desktopcat.core.asset_manager import AssetManager  # noqa: E402
+
+
+def _run(widget, step, fps: int, seconds: float) -> tuple:
+    from PyQt6.QtCore import QEventLoop, QTimer
+
+    samples = []
+    frames = int(fps * seconds)
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.setTimerType(timer.timerType().PreciseTimer)
+
+    def tick() -> None:
+        start = time.perf_counter()
+        step()
+        widget.repaint()
+        samples.append((time.perf_counter() - start) * 1000)
+        if len(samples) >= frames:
+            timer.stop()
+            loop.quit()
+
+    timer.timeout.connect(tick)
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    timer.start(int(1000 / fps))
+    loop.exec()
+    return samples, (time.process_time() - cpu_start) / (time.perf_counter() - wall_start) * 100
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark frame timing instrumentation.")
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--stall-ms", type=int, default=250)
+    parser.add_argument("--category", default="music")
+    args = parser.parse_args()
+
+    from PyQt6.QtCore import QEventLoop, QTimer
+    from PyQt6.QtWidgets import QApplication
+
+    from desktopcat.ui.animation import AnimationPool, FrameClock
+    from desktopcat.ui.widget import CatWidget
+
+    class ManualClock(FrameClock):
+        def schedule(self, player, due: float) -> None:  # the benchmark steps frames itself
+            pass
+
+    app = QApplication(sys.argv)
+    asset = AssetManager().resolve_asset(category=args.category)
+    pool = AnimationPool()
+    widget = CatWidget(asset, animation_pool=pool)
+    widget.show()
+    widget.preload([asset])
+    while pool.has_pending():
+        app.processEvents()
+        time.sleep(0.001)
+    widget.load_asset(asset)
+    print(f"{asset.path.name}, {args.fps} fps for {args.seconds:.0f} s per mode")
+
+    player = widget.player
+    clock = player.clock
+    player.clock = ManualClock()
+    for mode in ("off", "stats", "hud"):
+        widget.set_hud_visible(mode == "hud")
+        widget.enable_frame_stats(mode != "off")
+        samples, cpu = _run(widget, lambda: player.play(player.animation, player.index + 1), args.fps, args.seconds)
+        p95 = sorted(samples)[int(len(samples) * 0.95)]
+        print(f"{mode:<6} per frame median {statistics.median(samples):6.3f} ms  p95 {p95:6.3f} ms   CPU {cpu:5.1f}% of one core")
+    widget.set_hud_visible(False)
+
+    player.clock = clock
+    widget.enable_frame_stats()
+    player.play(player.animation)
+    stall = QTimer()
+    stall.timeout.connect(lambda: time.sleep(args.stall_ms / 1000))
+    stall.start(1000)
+    loop = QEventLoop()
+    QTimer.singleShot(int(args.seconds * 1000) + 500, loop.quit)
+    loop.exec()
+    stall.stop()
+    timing = widget.frame_timing()
+    print(f"with a {args.stall_ms} ms stall every second (native {player.native_fps():.1f} fps):")
+    print(json.dumps({k: v for k, v in timing.items() if k != "memory"}))
+    widget.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Time keyed incremental updates against full rebuilds with the Qt offscreen platform.
+
+Notices: after the user has fetched ``--fetched`` rows, scrolled to the
+middle and selected one, HomePage receives a refreshed list with one new
+notice on top and one edited notice. The keyed diff is compared against the
+previous model reset; reports whether the top visible row and the selection
+survived the update.
+
+Inventory: an equip toggle on a grid of N owned items, patching cards in
+place versus rebuilding every ItemCard.
+
+Usage:
+    python tools/bench_incremental_views.py --notices 10000 --items 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PyQt6.QtCore import QModelIndex  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from tools.bench_notice_list import _notices  # noqa: E402
+
+
+def _refreshed(notices: list) -> list:
+    fresh = {**notices[0], "id": "fresh", "title": "새 공지"}
+    edited = dict(notices[3], content="수정된 공지 내용")
+    return [fresh] + notices[:3] + [edited] + notices[4:]
+
+
+def _paint(app: QApplication, widget) -> None:
+    app.processEvents()
+    widget.grab()
+
+
+def _legacy_set_notices(model, notices: list) -> None:
+    """NoticeListModel.set_notices before the keyed diff: reset to the first page."""
+    model.beginResetModel()
+    model._notices = list(notices)
+    model._loaded = min(model.page_size, len(notices))
+    model.endResetModel()
+
+
+def bench_notices(app: QApplication, count: int, fetched: int, rounds: int) -> None:
+    from app.pages.home_page import HomePage, NoticeRole
+
+    base = _notices(count)
+    updated = _refreshed(base)
+    page = HomePage()
+    page.resize(1100, 720)
+    page.show()
+    model = page.notice_model
+    view = page.notice_list
+
+    def top_id():
+        return page._top_visible_index().data(NoticeRole)["id"]
+
+    def run(label: str, apply) -> None:
+        total = 0.0
+        kept_top = kept_selection = True
+        for _ in range(rounds):
+            _legacy_set_notices(model, [])
+            page._render_notices(base)
+            while model.rowCount() < fetched and model.canFetchMore(QModelIndex()):
+                model.fetchMore(QModelIndex())
+            _paint(app, view)
+            bar = view.verticalScrollBar()
+            bar.setValue(bar.maximum() // 2)
+            app.processEvents()
+            before = top_id()
+            view.setCurrentIndex(model.index(page._top_visible_index().row() + 1))
+            selected = view.currentIndex().data(NoticeRole)["id"]
+
+            start = time.perf_counter()
+            apply(updated)
+            _paint(app, view)
+            total += time.perf_counter() - start
+
+            current = view.currentIndex()
+            kept_top = kept_top and top_id() == before
+            kept_selection = kept_selection and current.isValid() and current.data(NoticeRole)["id"] == selected
+        print(
+            f"{label:<22} {total / rounds * 1000:9.2f} ms/update  "
+            f"top row kept={kept_top}  selection kept={kept_selection}  rows={model.rowCount()}"
+        )
+
+    def legacy(notices: list) -> None:
+        _legacy_set_notices(model, notices)
+        view.setVisible(bool(notices))
+
+    run("notices: reset", legacy)
+    run("notices: keyed diff", page._render_notices)
+    page.close()
+
+
+def bench_inventory(app: QApplication, count: int, rounds: int) -> None:
+    from app.pages.inventory_page import InventoryPage
+
+    owned = [{"id": f"item{i}", "name": f"Item {i}", "equipped": i == 0, "price": ""} for i in range(count)]
+    page = InventoryPage()
+    page.set_data(owned, [])
+    page.show()
+    _paint(app, page)
+
+    def full_rebuild() -> None:
+        for card in list(page.owned_cards.values()):
+            page.owned_grid.removeWidget(card)
+            card.setParent(None)
+            card.deleteLater()
+        page.owned_cards.clear()
+        page.render()
+
+    for label, refresh in (("inventory: rebuild", full_rebuild), ("inventory: incremental", page.render)):
+        start = time.perf_counter()
+        for r in range(rounds):
+            for item in page.owned_items:
+                item["equipped"] = item["id"] == f"item{(r + 1) % count}"
+            refresh()
+            _paint(app, page)
+        print(f"{label:<22} {(time.perf_counter() - start) / rounds * 1000:9.2f} ms/toggle")
+    page.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark keyed incremental view updates offscreen.")
+    parser.add_argument("--notices", type=int, default=10000)
+    parser.add_argument("--fetched", type=int, default=500, help="rows the user has scrolled into view")
+    parser.add_argument("--items", type=int, default=60)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    print(f"platform={app.platformName()}")
+    bench_notices(app, args.notices, args.fetched, args.rounds)
+    bench_inventory(app, args.items, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Render N notices with the Qt offscreen platform.
+
+Compares the previous QListWidget + one NoticeCard QFrame per row
+(``setItemWidget``) against HomePage's model/view list with the painting
+delegate. Reports time to populate and paint the first screen, time to
+scroll through the list, and the process peak RSS growth of each step.
+Memory comes from psutil (peak working set on Windows) when installed, else
+the Unix ``resource`` module; without either the column reads n/a.
+
+Usage:
+    python tools/bench_notice_list.py --count 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+try:
+    import psutil
+except ImportError:  # optional; only for the memory column
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PyQt6.QtCore import Qt  # noqa: E402
+from PyQt6.QtWidgets import QApplication, QFrame, QLabel, QListWidget, QListWidgetItem, QVBoxLayout  # noqa: E402
+
+
+class LegacyNoticeCard(QFrame):
+    """The per-row widget HomePage used before the delegate."""
+
+    def __init__(self, notice: dict):
+        super().__init__()
+        self.setFrameShape(QFrame.Shape.StyledPanel)
+        self.setStyleSheet("QFrame { background: #ffffff; border: 1px solid #e5e5e8; border-radius: 12px; }")
+        layout = QVBoxLayout()
+        title = QLabel(notice.get("title", ""))
+        title.setStyleSheet("font-weight: 600; font-size: 15px;")
+        text = notice.get("content", "")
+        content = QLabel(text if len(text) <= 120 else text[:120] + "…")
+        content.setWordWrap(True)
+        date = QLabel(notice.get("created_at", ""))
+        date.setAlignment(Qt.AlignmentFlag.AlignRight)
+        date.setStyleSheet("color: #777; font-size: 12px;")
+        layout.addWidget(title)
+        layout.addWidget(content)
+        layout.addWidget(date)
+        self.setLayout(layout)
+
+
+def _notices(count: int) -> list:
+    return [
+        {
+            "id": f"n{i}",
+            "vtuber_id": "vtuber-1",
+            "title": f"공지 #{i} 오늘 밤 라이브 안내",
+            "content": "오늘 밤 8시에 라이브를 합니다! 많이 와주세요. " * (1 + i % 4),
+            "created_at": f"2024-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}",
+        }
+        for i in range(count)
+    ]
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        # Windows reports the peak working set; elsewhere only the current RSS is available.
+        return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return None
+
+
+def _rss_growth(before: Optional[float]) -> str:
+    after = _peak_rss_mb()
+    if before is None or after is None:
+        return "peak RSS      n/a"
+    return f"peak RSS +{after - before:7.1f} MB"
+
+
+def _scroll_through(app: QApplication, view, steps: int = 50) -> float:
+    bar = view.verticalScrollBar()
+    start = time.perf_counter()
+    for i in range(1, steps + 1):
+        bar.setValue(bar.maximum() * i // steps)
+        app.processEvents()
+        view.viewport().grab()
+    return time.perf_counter() - start
+
+
+def bench_legacy(app: QApplication, notices: list) -> None:
+    rss = _peak_rss_mb()
+    start = time.perf_counter()
+    view = QListWidget()
+    view.resize(640, 720)
+    view.setSpacing(8)
+    for notice in notices:
+        item = QListWidgetItem()
+        card = LegacyNoticeCard(notice)
+        item.setSizeHint(card.sizeHint())
+        view.addItem(item)
+        view.setItemWidget(item, card)
+    view.show()
+    app.processEvents()
+    view.viewport().grab()
+    first = time.perf_counter() - start
+    scroll = _scroll_through(app, view)
+    print(f"{'widget-per-row':<16} first paint={first * 1000:9.1f} ms  scroll={scroll * 1000:9.1f} ms  {_rss_growth(rss)}")
+    view.close()
+
+
+def bench_model_view(app: QApplication, notices: list) -> None:
+    from app.pages.home_page import HomePage
+
+    rss = _peak_rss_mb()
+    page = HomePage()
+    page.resize(1100, 720)
+    start = time.perf_counter()
+    page._render_notices(notices)
+    page.show()
+    app.processEvents()
+    page.notice_list.viewport().grab()
+    first = time.perf_counter() - start
+    scroll = _scroll_through(app, page.notice_list)
+    print(
+        f"{'model/delegate':<16} first paint={first * 1000:9.1f} ms  scroll={scroll * 1000:9.1f} ms  "
+        f"{_rss_growth(rss)}  (rows fetched: {page.notice_model.rowCount()})"
+    )
+    page.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark notice list rendering offscreen.")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--mode", choices=["both", "legacy", "model"], default="both")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    notices = _notices(args.count)
+    print(f"{args.count} notices, platform={app.platformName()}")
+    # Model first: peak RSS only grows, so the smaller footprint must be measured before the larger one.
+    if args.mode in ("both", "model"):
+        bench_model_view(app, notices)
+    if args.mode in ("both", "legacy"):
+        bench_legacy(app, notices)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Measure what PlaybackGovernor saves while the cat is idle, covered or hidden.
+
+Plays a pooled GIF offscreen through the real FrameClock and walks the
+governor through its states with fake probes, ``--seconds`` each: active,
+idle (no input), fullscreen app in front, hidden from the tray. It prints
+process CPU and frames drawn per state, then the governor's own report.
+
+Usage:
+    python tools/bench_playback_governor.py --seconds 3 --category youtube
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from desktopcat.core.asset_manager import AssetManager  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the playback governor.")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--category", default="youtube")
+    parser.add_argument("--idle-fps", type=float, default=5.0)
+    parser.add_argument("--fullscreen-fps", type=float, default=0.0)
+    args = parser.parse_args()
+
+    from PyQt6.QtCore import QEventLoop, QTimer
+    from PyQt6.QtWidgets import QApplication
+
+    from desktopcat.ui.animation import AnimationPool
+    from desktopcat.ui.playback_governor import PlaybackGovernor, PlaybackPolicy
+    from desktopcat.ui.widget import CatWidget
+
+    app = QApplication(sys.argv)
+    asset = AssetManager().resolve_asset(category=args.category)
+    pool = AnimationPool()
+    widget = CatWidget(asset, animation_pool=pool)
+    widget.show()
+    widget.preload([asset])
+    while pool.has_pending() or widget.movie is not None:
+        app.processEvents()
+        time.sleep(0.001)
+
+    probe = {"idle": 0.0, "fullscreen": False}
+    policy = PlaybackPolicy(idle_fps=args.idle_fps, fullscreen_fps=args.fullscreen_fps, poll_interval_ms=100)
+    governor = PlaybackGovernor(
+        widget, policy, idle_seconds=lambda: probe["idle"], is_fullscreen=lambda: probe["fullscreen"]
+    )
+    governor.start()
+    print(f"{asset.path.name}: native {widget.player.native_fps():.1f} fps, {args.seconds:.0f} s per state")
+
+    def phase(label: str) -> None:
+        governor.evaluate()
+        shown, cpu, wall = widget.player.frames_shown, time.process_time(), time.perf_counter()
+        loop = QEventLoop()
+        QTimer.singleShot(int(args.seconds * 1000), loop.quit)
+        loop.exec()
+        cpu_pct = (time.process_time() - cpu) / (time.perf_counter() - wall) * 100
+        fps = (widget.player.frames_shown - shown) / args.seconds
+        print(f"{label:<12} state={governor.state:<10} {fps:5.1f} frames/s drawn   CPU {cpu_pct:5.1f}%")
+
+    phase("active")
+    probe["idle"] = 10_000.0
+    phase("idle")
+    probe["idle"], probe["fullscreen"] = 0.0, True
+    phase("fullscreen")
+    probe["fullscreen"] = False
+    widget.hide()
+    phase("hidden")
+    widget.show()
+    phase("active again")
+
+    print(governor.report())
+    print(governor.summary())
+    widget.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Benchmark of CatWidget work per resize event during a QSizeGrip drag.
+
+Simulates a drag as ``--steps`` resize events and times each one, for a
+still image (a generated ``--still-size`` PNG) and for the current GIF in
+QMovie and pooled form:
+
+- old: the previous behaviour, re-smoothing the label's current pixmap (or
+  calling QMovie.setScaledSize) on every event
+- smooth from source: correct quality without debouncing
+- new: CatWidget as is, a fast scale from the source while dragging and one
+  smooth rescale RESIZE_SETTLE_MS after the last event
+
+It also reports how far the old path's repeated rescaling drifts from a
+single scale of the original (mean per-channel difference).
+
+Usage:
+    python tools/bench_resize.py --steps 60 --still-size 1600
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from desktopcat.core.asset_manager import AssetDescriptor, AssetManager  # noqa: E402
+
+
+def _drag_sizes(steps: int) -> list:
+    # Shrink to 160 px and grow back, like a user dragging the grip around.
+    half = steps // 2
+    return [260 - 100 * i // half for i in range(half)] + [160 + 100 * i // half for i in range(half)]
+
+
+def _time_drag(app, widget, sizes, per_event=None) -> list:
+    samples = []
+    for side in sizes:
+        start = time.perf_counter()
+        widget.resize(side, side)
+        if per_event:
+            per_event()
+        app.processEvents()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _settle(app, widget) -> float:
+    from desktopcat.ui.widget import RESIZE_SETTLE_MS
+
+    deadline = time.perf_counter() + RESIZE_SETTLE_MS / 1000 + 0.3
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+    return (time.perf_counter() - start) * 1000
+
+
+def _report(label: str, samples: list) -> None:
+    print(f"{label:<36} median {statistics.median(samples):7.3f} ms   max {max(samples):7.3f} ms   total {sum(samples):8.1f} ms")
+
+
+def _difference(a, b) -> float:
+    a, b = a.toImage(), b.toImage()
+    if a.size() != b.size():
+        return float("nan")
+    total = 0
+    for y in range(0, a.height(), 2):
+        for x in range(0, a.width(), 2):
+            pa, pb = a.pixelColor(x, y), b.pixelColor(x, y)
+            total += abs(pa.red() - pb.red()) + abs(pa.green() - pb.green()) + abs(pa.blue() - pb.blue())
+    return total / max(1, (a.width() // 2) * (a.height() // 2) * 3)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark resize handling.")
+    parser.add_argument("--steps", type=int, default=60)
+    parser.add_argument("--still-size", type=int, default=1600)
+    args = parser.parse_args()
+
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QColor, QImage, QLinearGradient, QPainter
+    from PyQt6.QtWidgets import QApplication
+
+    from desktopcat.ui.animation import AnimationPool
+    from desktopcat.ui.widget import CatWidget
+
+    app = QApplication(sys.argv)
+    sizes = _drag_sizes(args.steps)
+    smooth = Qt.TransformationMode.SmoothTransformation
+    keep = Qt.AspectRatioMode.KeepAspectRatio
+
+    with tempfile.TemporaryDirectory() as tmp:
+        image = QImage(args.still_size, args.still_size, QImage.Format.Format_ARGB32)
+        painter = QPainter(image)
+        gradient = QLinearGradient(0, 0, args.still_size, args.still_size)
+        gradient.setColorAt(0, QColor("orange"))
+        gradient.setColorAt(1, QColor("navy"))
+        painter.fillRect(image.rect(), gradient)
+        for i in range(0, args.still_size, 16):
+            painter.drawLine(i, 0, 0, i)
+        painter.end()
+        still = Path(tmp) / "still.png"
+        image.save(str(still))
+        asset = AssetDescriptor(path=still, media_type="image", category="bench")
+
+        widget = CatWidget(asset)
+        widget.show()
+        label = widget.image_label
+        widget.resize(260, 260)
+        source = widget._source_pixmap
+        widget._source_pixmap = None  # disable the new path; the per-event callbacks below do the work
+        label.setPixmap(source.scaled(widget.size(), keep, smooth))
+
+        def legacy_still() -> None:
+            label.setPixmap(label.pixmap().scaled(widget.size(), keep, smooth))
+
+        _report("still, old (smooth of last result)", _time_drag(app, widget, sizes, legacy_still))
+        drifted = label.pixmap()
+        label.setPixmap(source.scaled(widget.size(), keep, smooth))
+        _report("still, smooth from source", _time_drag(app, widget, sizes, lambda: label.setPixmap(source.scaled(widget.size(), keep, smooth))))
+        widget.close()
+
+        widget = CatWidget(asset)
+        widget.show()
+        widget.resize(260, 260)
+        _settle(app, widget)
+        _report("still, new (fast + settle)", _time_drag(app, widget, sizes))
+        _settle(app, widget)
+        fresh = widget.image_label.pixmap()
+        print(f"{'':<36} final smooth rescale after settle; drift of old result vs. one scale: {_difference(drifted, fresh):.2f}/255")
+        widget.close()
+
+    gif = AssetManager().resolve_asset(category="youtube")
+    widget = CatWidget(gif, animation_pool=AnimationPool(budget_bytes=0))
+    widget.show()
+    movie = widget.movie
+    _report("gif QMovie, old (scale per event)", _time_drag(app, widget, sizes, lambda: movie.setScaledSize(widget.size())))
+    _settle(app, widget)
+    _report("gif QMovie, new", _time_drag(app, widget, sizes))
+    widget.close()
+
+    pool = AnimationPool()
+    widget = CatWidget(gif, animation_pool=pool)
+    widget.show()
+    widget.preload([gif])
+    while pool.has_pending() or widget.movie is not None:
+        app.processEvents()
+        time.sleep(0.001)
+    _report("gif pooled atlas, new", _time_drag(app, widget, sizes))
+    _settle(app, widget)
+    while pool.has_pending():
+        app.processEvents()
+        time.sleep(0.001)
+    app.processEvents()
+    size = widget.player.animation.size
+    print(f"{'':<36} re-decoded from the file at {size.width()}x{size.height()} after settle")
+    widget.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Benchmark of context rule matching with large generated rule sets.
+
+For each ``--rules`` size, generates that many rules (process lists, title
+substrings, rules without a process), followed by the shipped
+config/context_rules.json rules, and matches a rotation of foreground
+windows (process, 40-160 character title) with:
+
+- linear: ContextManager._match_category before RuleMatcher, which
+  lowercases every rule's lists on every tick
+- compiled: RuleMatcher (process dict + Aho-Corasick over titles)
+
+Both must agree on every window. A second pass mixes in title_regex,
+title_glob and process_glob rules and checks RuleMatcher against a plain
+reference evaluation of the same rules.
+
+Usage:
+    python tools/bench_rule_matcher.py --rules 10 100 1000 5000 --windows 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from desktopcat.core.rule_matcher import RuleMatcher  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+WORDS = [
+    "youtube", "music", "유튜브", "뮤직", "github", "pull", "request", "docs", "mail", "inbox",
+    "slack", "meeting", "calendar", "notion", "figma", "design", "jira", "sprint", "board", "video",
+    "stream", "twitch", "netflix", "episode", "spotify", "playlist", "terminal", "python", "build", "log",
+]
+
+
+def _legacy_match(rules: list, default: str, process_name: str, window_title: str) -> str:
+    """ContextManager._match_category before RuleMatcher."""
+    proc = process_name.lower()
+    title = window_title.lower()
+    for rule in rules:
+        processes = [p.lower() for p in rule.get("process", [])]
+        title_subs = [t.lower() for t in rule.get("title_contains", [])]
+        if processes and proc not in processes:
+            continue
+        if title_subs:
+            if not any(sub in title for sub in title_subs):
+                continue
+        return rule.get("category") or default
+    return default
+
+
+def _reference_match(rules: list, default: str, process_name: str, window_title: str) -> str:
+    """Straightforward evaluation of every rule type, for checking RuleMatcher."""
+    proc, title = process_name.lower(), window_title.lower()
+    for rule in rules:
+        processes = [p.lower() for p in rule.get("process", [])]
+        globs = [g.lower() for g in rule.get("process_glob", [])]
+        if (processes or globs) and proc not in processes and not any(fnmatch.fnmatchcase(proc, g) for g in globs):
+            continue
+        subs = [t.lower() for t in rule.get("title_contains", [])]
+        regexes = rule.get("title_regex", [])
+        title_globs = [g.lower() for g in rule.get("title_glob", [])]
+        if subs or regexes or title_globs:
+            if not (
+                any(sub in title for sub in subs)
+                or any(re.search(r, title, re.IGNORECASE) for r in regexes)
+                or any(fnmatch.fnmatchcase(title, g) for g in title_globs)
+            ):
+                continue
+        return rule.get("category") or default
+    return default
+
+
+def _token(rng: random.Random) -> str:
+    return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9)))
+
+
+def _generate(rng: random.Random, count: int, processes: list, patterns: bool) -> list:
+    rules = []
+    for i in range(count):
+        rule = {"name": f"generated_{i}", "category": f"cat{i % 7}"}
+        kind = rng.random()
+        if kind < 0.7:
+            rule["process"] = rng.sample(processes, rng.randint(1, 3))
+        elif patterns and kind < 0.8:
+            rule["process_glob"] = [rng.choice(processes)[:3] + "*.exe"]
+        roll = rng.random()
+        if patterns and roll < 0.1:
+            rule["title_regex"] = [rf"\b{rng.choice(WORDS)}\s+\d+"]
+        elif patterns and roll < 0.2:
+            rule["title_glob"] = [f"*{rng.choice(WORDS)} - {_token(rng)}*"]
+        elif roll < 0.9 or "process" not in rule:
+            # Catch-alls belong at the end of a rule file; generated rules all have a condition to check.
+            rule["title_contains"] = [f"{rng.choice(WORDS)} {_token(rng)}" for _ in range(rng.randint(1, 3))]
+        rules.append(rule)
+    return rules
+
+
+def _windows(rng: random.Random, count: int, processes: list) -> list:
+    windows = []
+    for _ in range(count):
+        words = []
+        while sum(len(w) + 1 for w in words) < rng.randint(40, 160):
+            words.append(rng.choice(WORDS) if rng.random() < 0.5 else _token(rng))
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), str(rng.randint(1, 99)))
+        process = rng.choice(processes + ["chrome.exe", "msedge.exe", "code.exe", "explorer.exe"])
+        windows.append((process, " ".join(words).title()))
+    return windows
+
+
+def _time(fn, windows: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for process, title in windows:
+            fn(process, title)
+    return (time.perf_counter() - start) / (repeat * len(windows)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark context rule matching.")
+    parser.add_argument("--rules", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--windows", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    shipped = json.loads((ROOT / "config" / "context_rules.json").read_text(encoding="utf-8"))
+    default = shipped.get("default_category", "idle")
+    rng = random.Random(args.seed)
+    processes = [f"{_token(rng)}.exe" for _ in range(200)]
+    windows = _windows(rng, args.windows, processes)
+
+    print(f"{'rules':>6} {'linear':>12} {'compiled':>12} {'speed-up':>9} {'compile':>10}")
+    for count in args.rules:
+        rules = _generate(rng, count, processes, patterns=False) + shipped["rules"]
+        start = time.perf_counter()
+        matcher = RuleMatcher(rules, default)
+        compile_ms = (time.perf_counter() - start) * 1000
+        for process, title in windows:
+            expected = _legacy_match(rules, default, process, title)
+            if matcher.match(process, title) != expected:
+                raise SystemExit(f"mismatch for {process!r} {title!r}: expected {expected}")
+        repeat = max(1, 20000 // (count * len(windows) // 100 + 1))
+        linear = _time(lambda p, t: _legacy_match(rules, default, p, t), windows, repeat)
+        compiled = _time(matcher.match, windows, repeat * 10)
+        print(f"{count:>6} {linear:>9.1f} us {compiled:>9.2f} us {linear / compiled:>8.0f}x {compile_ms:>7.1f} ms")
+
+    print("same window as the previous tick:", f"{_time(matcher.match, windows[:1], 10000):.2f} us")
+
+    for count in args.rules:
+        rules = _generate(rng, count, processes, patterns=True) + shipped["rules"]
+        matcher = RuleMatcher(rules, default)
+        for process, title in windows:
+            expected = _reference_match(rules, default, process, title)
+            if matcher.match(process, title) != expected:
+                raise SystemExit(f"mismatch for {process!r} {title!r}: expected {expected}")
+        compiled = _time(matcher.match, windows, 10)
+        print(f"{count:>6} rules with regex/glob: {compiled:.2f} us per window, matches the reference")
+
+
+if __name__ == "__main__":
+    main()
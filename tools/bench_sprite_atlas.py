@@ -0,0 +1,106 @@
+"""
+Offscreen benchmark of CatWidget's GIF render paths at a fixed frame rate.
+
+Drives one widget per path at ``--fps`` for ``--seconds`` and reports the
+per-frame paint time (advance + synchronous repaint of the whole widget,
+children included) and the process CPU time per second of animation:
+
+- qmovie: QMovie feeding the stacked QLabel (the path before the pool)
+- label:  pooled frames set on the QLabel (render_mode="label")
+- atlas:  widget paints from the pooled sprite atlas (render_mode="atlas")
+
+Usage:
+    python tools/bench_sprite_atlas.py --fps 30 --seconds 3 --category youtube
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from desktopcat.core.asset_manager import AssetManager  # noqa: E402
+
+
+def _run(app, widget, step, fps: int, seconds: float) -> tuple:
+    from PyQt6.QtCore import QEventLoop, QTimer
+
+    samples = []
+    frames = int(fps * seconds)
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.setTimerType(timer.timerType().PreciseTimer)
+
+    def tick() -> None:
+        start = time.perf_counter()
+        step()
+        widget.repaint()
+        samples.append((time.perf_counter() - start) * 1000)
+        if len(samples) >= frames:
+            timer.stop()
+            loop.quit()
+
+    timer.timeout.connect(tick)
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    timer.start(int(1000 / fps))
+    loop.exec()
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    return samples, cpu / wall * 100
+
+
+def _report(label: str, samples: list, cpu_pct: float) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label:<8} paint median {statistics.median(samples):6.3f} ms  p95 {p95:6.3f} ms   CPU {cpu_pct:5.1f}% of one core")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark CatWidget render paths.")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--category", default="youtube")
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication
+
+    from desktopcat.ui.animation import AnimationPool, FrameClock
+    from desktopcat.ui.widget import CatWidget
+
+    class ManualClock(FrameClock):
+        def schedule(self, player, due: float) -> None:  # the benchmark steps frames itself
+            pass
+
+    app = QApplication(sys.argv)
+    asset = AssetManager().resolve_asset(category=args.category)
+    print(f"{asset.path.name}, {args.fps} fps for {args.seconds:.0f} s")
+
+    widget = CatWidget(asset, animation_pool=AnimationPool(budget_bytes=0))
+    widget.show()
+    widget.movie.stop()
+    _report("qmovie", *_run(app, widget, widget.movie.jumpToNextFrame, args.fps, args.seconds))
+    widget.close()
+
+    pool = AnimationPool()
+    for mode in ("label", "atlas"):
+        widget = CatWidget(asset, animation_pool=pool, render_mode=mode)
+        widget.player.clock = ManualClock()
+        widget.show()
+        widget.preload([asset])
+        while pool.has_pending():
+            app.processEvents()
+            time.sleep(0.001)
+        widget.load_asset(asset)
+        player = widget.player
+        _report(mode, *_run(app, widget, lambda: player.play(player.animation, player.index + 1), args.fps, args.seconds))
+        widget.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Track time-to-first-cat-frame for ``python -m app.main``.
+
+Launches the app N times with ``--profile-startup`` (offscreen, throwaway
+app data dir, fixed asset), waits for the profile line it appends to
+``logs/startup_profile.jsonl``, stops the process, and prints the median of
+each phase. Also times importing the modules that are now deferred until
+after the first frame, i.e. what was taken off the critical path.
+
+Usage:
+    python tools/bench_startup.py --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+FIRST_FRAME_PHASES = ("imports", "qapplication", "asset_resolution", "cat_widget", "first_paint")
+DEFERRED_MODULES = (
+    "app.dashboard",
+    "app.tray",
+    "app.notice_poller",
+    "app.async_api_client",
+    "PyQt6.QtMultimedia",
+    "PyQt6.QtMultimediaWidgets",
+)
+
+
+def _default_asset() -> Path:
+    return next(p for p in sorted((ROOT / "assets" / "cats").rglob("*")) if p.suffix.lower() in (".gif", ".png"))
+
+
+def _run_once(asset: Path, env: dict, log: Path, timeout: float) -> dict:
+    seen = len(log.read_text(encoding="utf-8").splitlines()) if log.exists() else 0
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "app.main", str(asset), "--profile-startup"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            lines = log.read_text(encoding="utf-8").splitlines() if log.exists() else []
+            if len(lines) > seen:
+                return json.loads(lines[-1])
+            if proc.poll() is not None:
+                raise RuntimeError(f"app exited with {proc.returncode} before reporting")
+            time.sleep(0.02)
+        raise TimeoutError("no startup profile written")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def _deferred_import_ms(env: dict) -> None:
+    for module in DEFERRED_MODULES:
+        code = (
+            "import time, PyQt6.QtWidgets; t = time.perf_counter(); "
+            f"import {module}; print((time.perf_counter() - t) * 1000)"
+        )
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True)
+        if out.returncode == 0:
+            print(f"  {module:<28} {float(out.stdout.strip()):8.1f} ms")
+        else:
+            print(f"  {module:<28} import failed: {out.stderr.strip().splitlines()[-1]}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark app startup phases.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--asset", type=Path, default=None)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+    asset = args.asset or _default_asset()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"), MEOWBUDDY_HOME=tmp)
+        log = Path(tmp) / "logs" / "startup_profile.jsonl"
+        records = [_run_once(asset, env, log, args.timeout) for _ in range(args.runs)]
+
+        print(f"{args.runs} runs, asset={asset.relative_to(ROOT) if asset.is_relative_to(ROOT) else asset}")
+        phases = list(records[0]["phases"])
+        for phase in phases:
+            values = [r["phases"].get(phase, 0.0) for r in records]
+            print(f"  {phase:<20} median {statistics.median(values):8.1f} ms")
+        first_frame = [sum(r["phases"].get(p, 0.0) for p in FIRST_FRAME_PHASES) for r in records]
+        print(f"  {'time to first frame':<20} median {statistics.median(first_frame):8.1f} ms")
+        print(f"  {'total':<20} median {statistics.median(r['total_ms'] for r in records):8.1f} ms")
+        print("import cost deferred past the first frame:")
+        _deferred_import_ms(env)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Micro-benchmark of the per-poll path lookups.
+
+Compares the old behaviour (``ensure_app_dirs`` mkdirs on every lookup) with
+the memoized ``AppLayout`` for the callers that run on every notice poll.
+
+Usage:
+    python tools/bench_storage_paths.py --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import notice_state, storage_paths, token_store  # noqa: E402
+from app.storage_paths import AppLayout, set_layout  # noqa: E402
+
+
+def _report(label: str, seconds: float, iterations: int) -> None:
+    print(f"{label:<36} {seconds / iterations * 1e6:9.3f} us/call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark app directory resolution.")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    with tempfile.TemporaryDirectory() as tmp:
+        set_layout(AppLayout.from_root(Path(tmp) / "MeowBuddy"))
+        layout = storage_paths.get_layout()
+
+        def per_call_mkdir() -> Path:
+            return layout.ensure().settings / notice_state.NOTICE_STATE_FILE
+
+        _report("settings path, mkdir per call (old)", timeit.timeit(per_call_mkdir, number=n), n)
+        _report("notice_state._state_path", timeit.timeit(notice_state._state_path, number=n), n)
+        _report("token_store._token_path", timeit.timeit(token_store._token_path, number=n), n)
+        _report("notice_state.load_last_seen", timeit.timeit(notice_state.load_last_seen, number=n), n)
+        set_layout(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Measure thumbnail loading with the Qt offscreen platform.
+
+Generates N large PNGs, then compares decoding them full-size on the UI
+thread (QPixmap + scaled) with ThumbnailService: cold (scaled decode on the
+executor), warm disk cache (new service, same cache dir) and warm memory.
+Reports wall time and the longest stretch the UI thread was blocked.
+
+Usage:
+    python tools/bench_thumbnails.py --count 24 --size 3000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PyQt6.QtCore import QElapsedTimer, QSize, Qt, QTimer  # noqa: E402
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from app.thumbnails import ThumbnailService  # noqa: E402
+
+THUMB = QSize(240, 160)
+
+
+def _make_images(folder: Path, count: int, size: int) -> list:
+    paths = []
+    for i in range(count):
+        image = QImage(size, size * 2 // 3, QImage.Format.Format_RGB32)
+        image.fill(QColor.fromHsv(i * 15 % 360, 160, 220))
+        painter = QPainter(image)
+        painter.drawText(image.rect(), Qt.AlignmentFlag.AlignCenter, f"item {i}")
+        painter.end()
+        path = folder / f"item{i}.png"
+        image.save(str(path))
+        paths.append(path)
+    return paths
+
+
+class _StallProbe:
+    """Ticks every 5 ms on the UI thread and records the largest gap."""
+
+    def __init__(self) -> None:
+        self.clock = QElapsedTimer()
+        self.worst = 0
+        self.timer = QTimer()
+        self.timer.setInterval(5)
+        self.timer.timeout.connect(self._tick)
+
+    def start(self) -> None:
+        self.worst = 0
+        self.clock.start()
+        self.timer.start()
+
+    def _tick(self) -> None:
+        self.worst = max(self.worst, self.clock.restart())
+
+    def stop(self) -> int:
+        self.timer.stop()
+        return self.worst
+
+
+def bench_sync(app: QApplication, paths: list, probe: _StallProbe) -> None:
+    probe.start()
+    start = time.perf_counter()
+    for path in paths:
+        QPixmap(str(path)).scaled(THUMB, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        app.processEvents()
+    _report("UI thread, full decode", time.perf_counter() - start, max(probe.stop(), 0))
+
+
+def bench_service(app: QApplication, label: str, service: ThumbnailService, paths: list, probe: _StallProbe) -> None:
+    pending = {"n": len(paths)}
+
+    def done(_pixmap) -> None:
+        pending["n"] -= 1
+
+    probe.start()
+    start = time.perf_counter()
+    for path in paths:
+        service.request(path, THUMB, done)
+    while pending["n"]:
+        app.processEvents()
+        time.sleep(0.001)
+    _report(label, time.perf_counter() - start, probe.stop())
+
+
+def _report(label: str, seconds: float, stall_ms: int) -> None:
+    print(f"{label:<28} total={seconds * 1000:8.1f} ms  worst UI stall={stall_ms:5d} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark thumbnail decoding and caching.")
+    parser.add_argument("--count", type=int, default=24)
+    parser.add_argument("--size", type=int, default=3000, help="source image width in pixels")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    probe = _StallProbe()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _make_images(Path(tmp), args.count, args.size)
+        cache_dir = Path(tmp) / "thumbs"
+        print(f"{args.count} images of {args.size}px -> {THUMB.width()}x{THUMB.height()}")
+        bench_sync(app, paths, probe)
+        service = ThumbnailService(cache_dir)
+        bench_service(app, "service, cold", service, paths, probe)
+        bench_service(app, "service, disk cache", ThumbnailService(cache_dir), paths, probe)
+        bench_service(app, "service, memory cache", service, paths, probe)
+        print(f"memory cache: {len(service.memory)} pixmaps, {service.memory.used_bytes / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()